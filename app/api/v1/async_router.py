@@ -0,0 +1,182 @@
+# app/api/v1/async_router.py
+from fastapi import APIRouter, Depends, Query, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+
+from app.schemas.camara_schema import Camara, PaginatedCamaraResponse
+from app.schemas.vereador_schema import VereadorPublic, PaginatedVereadorResponse
+from app.schemas.mandato_vereador_schema import MandatoVereadorPublic, PaginatedMandatoVereadorResponse
+from app.services.async_service import run_service
+from app.services.camara_service import camara_service
+from app.services.vereador_service import VereadorService
+from app.services.mandato_vereador_service import MandatoVereadorService
+
+from app.db.database import get_async_db
+from app.db.fields import ListView, list_response, page_response, select_fields, select_includes
+from app.core.etag import conditional_response, object_response
+from app.core.security import get_current_principal_async
+from app.schemas.token_schema import Principal
+
+# Rotas de leitura do modo assíncrono (DB_ASYNC=true).
+# Quando habilitado, este roteador é registrado antes dos demais e responde
+# pelos mesmos caminhos, permitindo comparar os dois modos com a mesma API.
+# As listagens são serializadas (page_response) ainda dentro da sessão, onde
+# os relacionamentos lazy podem ser carregados; a versão da ETag (e o 304)
+# também é resolvida lá, na mesma chamada.
+router = APIRouter(tags=["Leitura assíncrona"])
+
+@router.get("/camaras/", response_model=PaginatedCamaraResponse)
+async def read_camaras(
+    *,
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1),
+    filtro: Optional[str] = None,
+    cursor: Optional[str] = None,
+    include_total: bool = True,
+    estimate: bool = False,
+    fields: Optional[str] = None,
+    view: Optional[ListView] = None,
+    current_user: Principal = Depends(get_current_principal_async)
+):
+    """
+    Retorna uma lista de camaras. Requer autenticação.
+    """
+    selecao = select_fields(PaginatedCamaraResponse, fields, view)
+
+    def _read(session):
+        def _render():
+            page = camara_service.get_all_camaras(session, skip, limit, filtro, cursor, include_total, estimate, selecao)
+            return page_response(page, PaginatedCamaraResponse, selecao)
+        return conditional_response(request, camara_service.get_camaras_version(session, filtro), _render)
+
+    return await run_service(db, _read)
+
+@router.get("/camaras/{camara_id}", response_model=Camara)
+async def read_camara(
+    *,
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+    camara_id: int,
+    current_user: Principal = Depends(get_current_principal_async)
+):
+    """
+    Retorna uma camara específica pelo ID. Requer autenticação.
+    """
+    return await run_service(
+        db,
+        lambda session: object_response(request, Camara, camara_service.get_camara(session, camara_id))
+    )
+
+@router.get("/vereadores/", response_model=PaginatedVereadorResponse)
+async def read_vereadores(
+    *,
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1),
+    filtro: Optional[str] = None,
+    cursor: Optional[str] = None,
+    include_total: bool = True,
+    estimate: bool = False,
+    fields: Optional[str] = None,
+    view: Optional[ListView] = None,
+    current_user: Principal = Depends(get_current_principal_async)
+):
+    """
+    Retorna uma lista de vereadores.
+    """
+    selecao = select_fields(PaginatedVereadorResponse, fields, view)
+
+    def _read(session):
+        service = VereadorService(session)
+
+        def _render():
+            page = service.get_all_vereadores(skip=skip, limit=limit, filtro=filtro, cursor=cursor,
+                                              include_total=include_total, estimate=estimate, selecao=selecao)
+            return page_response(page, PaginatedVereadorResponse, selecao)
+        return conditional_response(request, service.get_vereadores_version(filtro=filtro), _render)
+
+    return await run_service(db, _read)
+
+# {id:int}: não captura /vereadores/exportar, atendida pela rota síncrona
+@router.get("/vereadores/{id:int}", response_model=VereadorPublic)
+async def read_vereador_by_id(
+    *,
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+    id: int,
+    current_user: Principal = Depends(get_current_principal_async)
+):
+    """
+    Retorna um vereador específico pelo seu ID.
+    """
+    return await run_service(
+        db,
+        lambda session: object_response(request, VereadorPublic, VereadorService(session).get_vereador_by_id(id=id))
+    )
+
+@router.get("/mandato-vereador/", response_model=List[MandatoVereadorPublic])
+async def read_all_associations(
+    *,
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1),
+    camara_id: Optional[int] = None,
+    mandato_ativo: Optional[bool] = None,
+    fields: Optional[str] = None,
+    view: Optional[ListView] = None,
+    current_user: Principal = Depends(get_current_principal_async)
+):
+    """
+    Lista associações mandato-vereador com filtros opcionais.
+    """
+    selecao = select_fields(PaginatedMandatoVereadorResponse, fields, view)
+
+    def _read(session):
+        service = MandatoVereadorService(session)
+
+        def _render():
+            associacoes = service.get_all_associations(camara_id=camara_id, mandato_ativo=mandato_ativo, selecao=selecao)
+            return list_response(associacoes, PaginatedMandatoVereadorResponse, selecao)
+        return conditional_response(request, service.get_all_associations_version(camara_id=camara_id, mandato_ativo=mandato_ativo), _render)
+
+    return await run_service(db, _read)
+
+@router.get("/mandato-vereador/mandato/{mandato_id}", response_model=PaginatedMandatoVereadorResponse)
+async def read_associations_by_mandato(
+    *,
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+    mandato_id: int,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1),
+    filtro: Optional[str] = None,
+    cursor: Optional[str] = None,
+    include_total: bool = True,
+    estimate: bool = False,
+    fields: Optional[str] = None,
+    view: Optional[ListView] = None,
+    include: Optional[str] = None,
+    current_user: Principal = Depends(get_current_principal_async)
+):
+    """
+    Lista todos os vereadores associados a um mandato específico, com paginação e filtro.
+    """
+    selecao = select_fields(PaginatedMandatoVereadorResponse, fields, view, include)
+    incluir = select_includes(PaginatedMandatoVereadorResponse, include)
+
+    def _read(session):
+        service = MandatoVereadorService(session)
+
+        def _render():
+            page = service.get_associations_by_mandato(
+                mandato_id=mandato_id, skip=skip, limit=limit, filtro=filtro, cursor=cursor,
+                include_total=include_total, estimate=estimate, selecao=selecao
+            )
+            return page_response(page, PaginatedMandatoVereadorResponse, selecao, incluir)
+        return conditional_response(request, service.get_associations_version_by_mandato(mandato_id=mandato_id, filtro=filtro), _render)
+
+    return await run_service(db, _read)
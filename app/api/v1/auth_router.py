@@ -1,48 +1,51 @@
 # app/api/v1/auth_router.py
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
 from app.db.database import get_db
 # ATUALIZADO: Importe o novo schema
-from app.schemas.token_schema import TokenComUsuario
-from app.core.security import create_access_token, verify_password
+from app.schemas.token_schema import TokenComUsuario, RefreshTokenRequest
+from app.core.security import verify_password_async
 from app.repositories.usuario_repository import UsuarioRepository
+from app.services.auth_service import AuthService
 
 router = APIRouter(tags=["Autenticação"])
 
 # ATUALIZADO: Altere o response_model para o novo schema
+# Assíncrona: o bcrypt roda no pool de processos (app/core/hashing.py) sem
+# ocupar uma thread do servidor; as consultas vão para o threadpool
 @router.post("/login", response_model=TokenComUsuario)
-def login_for_access_token(
+async def login_for_access_token(
     form_data: OAuth2PasswordRequestForm = Depends(), 
     db: Session = Depends(get_db)
 ):
-    user_repo = UsuarioRepository(db)
-    usuario = user_repo.get_by_email(form_data.username) 
+    usuario = await run_in_threadpool(_get_usuario, db, form_data.username)
     
-    if not usuario or not verify_password(form_data.password, usuario.senha_hash):
+    if not usuario or not await verify_password_async(form_data.password, usuario.senha_hash):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="E-mail ou senha incorretos",
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    access_token = create_access_token(data={"sub": usuario.email})
+    # Tokens e câmaras do usuário (pode ler as associações)
+    return await run_in_threadpool(AuthService(db).create_session, usuario)
 
-    camaras_acesso = None
-    # Se o utilizador NÃO for um super admin, busca as suas câmaras associadas
-    if not usuario.is_superuser:
-        camaras_acesso = [assoc.camara for assoc in usuario.associacoes if assoc.ativo]
 
-        if not camaras_acesso:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN, # 403 Forbidden é o código correto para este caso
-                detail="Acesso negado. Você não está associado a nenhuma câmara ativa.",
-            )
-    
-    
-    return {
-        "access_token": access_token, 
-        "token_type": "bearer",
-        "usuario": usuario,
-        "camaras": camaras_acesso
-    }
\ No newline at end of file
+def _get_usuario(db: Session, email: str):
+    usuario = UsuarioRepository(db).get_by_email(email)
+    # Encerra a leitura: a conexão volta ao pool enquanto o bcrypt roda
+    # (expire_on_commit=False mantém o usuário carregado)
+    db.commit()
+    return usuario
+
+
+@router.post("/refresh", response_model=TokenComUsuario)
+def refresh_access_token(body: RefreshTokenRequest, db: Session = Depends(get_db)):
+    """
+    Troca o refresh token por um novo access token (e um novo refresh token,
+    que substitui o enviado). Não verifica senha: o access token pode ter
+    validade curta sem exigir novos logins.
+    """
+    return AuthService(db).refresh(body.refresh_token)
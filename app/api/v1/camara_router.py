@@ -1,5 +1,5 @@
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, Request, status
 from sqlalchemy.orm import Session
 from typing import List, Optional
 
@@ -10,8 +10,10 @@ from app.services.camara_service import camara_service
 
 # Importações para a dependência de banco de dados e autenticação
 from app.db.database import get_db
-from app.core.security import get_current_user
-from app.models.usuario_model import Usuario # Opcional, mas bom para clareza de tipo
+from app.db.fields import ListView, page_response, select_fields
+from app.core.etag import conditional_response, object_response
+from app.core.security import get_current_principal
+from app.schemas.token_schema import Principal
 
 # Define o prefixo e as tags do roteador
 router = APIRouter(prefix="/camaras", tags=["Câmaras"])
@@ -23,7 +25,7 @@ def create_camara(
     *,
     db: Session = Depends(get_db),
     camara_in: CamaraCreate,
-    current_user: Usuario = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """
     Cria uma nova camara. Requer autenticação.
@@ -33,30 +35,43 @@ def create_camara(
 @router.get("/", response_model=PaginatedCamaraResponse)
 def read_camaras(
     *,
+    request: Request,
     db: Session = Depends(get_db),
-    skip: int = 0,
-    limit: int = 100,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1),
     filtro: Optional[str] = None,
-    current_user: Usuario = Depends(get_current_user)
+    cursor: Optional[str] = None,
+    include_total: bool = True,
+    estimate: bool = False,
+    fields: Optional[str] = None,
+    view: Optional[ListView] = None,
+    current_user: Principal = Depends(get_current_principal)
 ):
     """
     Retorna uma lista de camaras. Requer autenticação.
+    `fields`/`view=lean` limitam os campos retornados (ver app/db/fields.py).
+    Com `If-None-Match` e nada alterado, 304 (ver app/core/etag.py).
     """
-    camaras = camara_service.get_all_camaras(db, skip, limit, filtro)
-    total = camara_service.get_total_camaras(db,filtro) # Você precisará criar este método
-    return {"items": camaras, "total": total}
+    selecao = select_fields(PaginatedCamaraResponse, fields, view)
+
+    def _render():
+        page = camara_service.get_all_camaras(db, skip, limit, filtro, cursor, include_total, estimate, selecao)
+        return page_response(page, PaginatedCamaraResponse, selecao)
+
+    return conditional_response(request, camara_service.get_camaras_version(db, filtro), _render)
 
 @router.get("/{camara_id}", response_model=Camara)
 def read_camara(
     *,
+    request: Request,
     db: Session = Depends(get_db),
     camara_id: int,
-    current_user: Usuario = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """
     Retorna uma camara específica pelo ID. Requer autenticação.
     """
-    return camara_service.get_camara(db, camara_id)
+    return object_response(request, Camara, camara_service.get_camara(db, camara_id))
 
 @router.put("/{camara_id}", response_model=Camara)
 def update_camara(
@@ -64,7 +79,7 @@ def update_camara(
     db: Session = Depends(get_db),
     camara_id: int,
     camara_in: CamaraUpdate,
-    current_user: Usuario = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """
     Atualiza uma camara. Requer autenticação.
@@ -76,7 +91,7 @@ def delete_camara(
     *,
     db: Session = Depends(get_db),
     camara_id: int,
-    current_user: Usuario = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """
     Deleta (logicamente) uma camara. Requer autenticação.
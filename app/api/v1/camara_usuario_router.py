@@ -1,34 +1,45 @@
 # app/api/v1/camara_usuario_router.py
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, Request, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from app.schemas.camara_usuario_schema import CamaraUsuarioPublic, CamaraUsuarioCreate, CamaraUsuarioUpdate, CamaraUsuarioUpdatePayload, PaginatedCamaraUsuarioResponse
 from app.services.camara_usuario_service import CamaraUsuarioService
+from app.services.usuario_service import hash_new_password
 from app.db.database import get_db
-from app.core.security import get_current_user
-from app.models.usuario_model import Usuario
+from app.db.export import ExportFormat, export_response
+from app.db.fields import ListView, page_response, select_fields, select_includes
+from app.core.etag import conditional_response, object_response
+from app.core.security import get_current_principal
+from app.schemas.token_schema import Principal
+from typing import Optional
 
 router = APIRouter(prefix="/usuario-camara", tags=["Usuários da câmara"])
 
 @router.post("/", response_model=CamaraUsuarioPublic, status_code=status.HTTP_201_CREATED)
-def create_association(
+async def create_association(
     *,
     db: Session = Depends(get_db),
     association_in: CamaraUsuarioCreate,
-    current_user: Usuario = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """
     Cria uma nova associação entre um usuário e uma câmara.
     Requer autenticação.
     """
+    # Usuário novo: o bcrypt roda no pool de processos, sem ocupar uma thread
+    usuario = association_in.usuario
+    hashed_password = await hash_new_password(usuario.senha, usuario.confSenha) if usuario and not usuario.id else None
     service = CamaraUsuarioService(db)
-    return service.create_association(association_in=association_in)
+    return await run_in_threadpool(service.create_association, association_in=association_in,
+                                   hashed_password=hashed_password)
 
 @router.get("/{id}", response_model=CamaraUsuarioPublic)
 def read_association_by_id(
     *,
+    request: Request,
     db: Session = Depends(get_db),
     id: int,
-    current_user: Usuario = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """
     Obtém os dados de uma associação específica pelo seu ID,
@@ -36,26 +47,59 @@ def read_association_by_id(
     Requer autenticação.
     """
     service = CamaraUsuarioService(db)
-    return service.get_association(id=id)
+    return object_response(request, CamaraUsuarioPublic, service.get_association(id=id))
 
 @router.get("/camara/{camara_id}", response_model=PaginatedCamaraUsuarioResponse)
 def read_associations_by_camara(
     *,
+    request: Request,
     db: Session = Depends(get_db),
     camara_id: int,
-    skip: int = 0,
-    limit: int = 100,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1),
     filtro: str = None,
-    current_user: Usuario = Depends(get_current_user)
+    cursor: str = None,
+    include_total: bool = True,
+    estimate: bool = False,
+    fields: Optional[str] = None,
+    view: Optional[ListView] = None,
+    include: Optional[str] = None,
+    current_user: Principal = Depends(get_current_principal)
 ):
     """
     Lista todos os usuários associados a uma câmara específica com paginação.
+    `fields` (ex.: `fields=papel,usuario.nome,camara.nome`) e `view=lean` (só
+    os ids, sem os objetos aninhados) limitam os campos retornados; com
+    `include=camara`, a câmara vem uma vez só em `included`. Com
+    `If-None-Match` e nada alterado, 304.
     Requer autenticação.
     """
+    selecao = select_fields(PaginatedCamaraUsuarioResponse, fields, view, include)
+    incluir = select_includes(PaginatedCamaraUsuarioResponse, include)
     service = CamaraUsuarioService(db)
-    usuarios = service.get_associations_by_camara(camara_id=camara_id, skip=skip, limit=limit, filtro=filtro)
-    total = service.get_total_associations_by_camara(camara_id=camara_id, filtro=filtro)
-    return {"items": usuarios, "total": total}
+
+    def _render():
+        page = service.get_associations_by_camara(camara_id=camara_id, skip=skip, limit=limit, filtro=filtro, cursor=cursor, include_total=include_total, estimate=estimate, selecao=selecao)
+        return page_response(page, PaginatedCamaraUsuarioResponse, selecao, incluir)
+
+    return conditional_response(request, service.get_associations_version_by_camara(camara_id=camara_id, filtro=filtro), _render)
+
+@router.get("/camara/{camara_id}/exportar")
+def export_associations_by_camara(
+    *,
+    db: Session = Depends(get_db),
+    camara_id: int,
+    formato: ExportFormat = "csv",
+    filtro: str = None,
+    current_user: Principal = Depends(get_current_principal)
+):
+    """
+    Exporta todos os usuários de uma câmara (com o mesmo `filtro` da listagem)
+    em CSV ou NDJSON, gerado em streaming.
+    """
+    service = CamaraUsuarioService(db)
+    itens = service.export_associations_by_camara(camara_id=camara_id, filtro=filtro)
+    return export_response(itens, CamaraUsuarioPublic, formato, f"usuarios_camara_{camara_id}")
 
 @router.put("/{id}", response_model=CamaraUsuarioPublic)
 def update_association(
@@ -63,7 +107,7 @@ def update_association(
     db: Session = Depends(get_db),
     id: int,
     association_in: CamaraUsuarioUpdatePayload, 
-    current_user: Usuario = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     service = CamaraUsuarioService(db)
     return service.update_association(id=id, association_in=association_in)
@@ -73,7 +117,7 @@ def delete_association(
     *,
     db: Session = Depends(get_db),
     id: int,
-    current_user: Usuario = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """
     Deleta (logicamente) uma associação.
@@ -1,5 +1,5 @@
 # votacao-backend/app/api/v1/comissao_membro_router.py
-from fastapi import APIRouter, Depends, status, Response
+from fastapi import APIRouter, Depends, Query, Request, status, Response
 from sqlalchemy.orm import Session
 from typing import List, Optional
 
@@ -11,8 +11,11 @@ from app.schemas.comissao_membro_schema import (
 )
 from app.services.comissao_membro_service import ComissaoMembroService
 from app.db.database import get_db
-from app.core.security import get_current_user
-from app.models.usuario_model import Usuario
+from app.db.fields import ListView, page_response, select_fields, select_includes
+from app.db.export import ExportFormat, export_response
+from app.core.etag import conditional_response, object_response
+from app.core.security import get_current_principal
+from app.schemas.token_schema import Principal
 
 router = APIRouter(prefix="/comissao-membros", tags=["Membros da Comissão"])
 
@@ -21,7 +24,7 @@ def create_comissao_membro(
     *,
     db: Session = Depends(get_db),
     comissao_membro_in: ComissaoMembroCreate,
-    current_user: Usuario = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     service = ComissaoMembroService(db)
     return service.create_association(association_in=comissao_membro_in)
@@ -29,27 +32,64 @@ def create_comissao_membro(
 @router.get("/comissao/{comissao_id}", response_model=PaginatedComissaoMembroResponse)
 def read_comissao_membros(
     *,
+    request: Request,
     db: Session = Depends(get_db),
     comissao_id: int,
-    skip: int = 0,
-    limit: int = 100,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1),
     filtro: Optional[str] = None,
-    current_user: Usuario = Depends(get_current_user)
+    cursor: Optional[str] = None,
+    include_total: bool = True,
+    estimate: bool = False,
+    fields: Optional[str] = None,
+    view: Optional[ListView] = None,
+    include: Optional[str] = None,
+    current_user: Principal = Depends(get_current_principal)
 ):
+    """
+    Lista os membros de uma comissão. Com `include` (ex.:
+    `include=comissao,mandato_vereador.mandato`), a comissão e os mandatos vêm
+    uma vez só em `included`, e não repetidos em cada membro. `fields` (ex.:
+    `fields=funcao,mandato_vereador.vereador.nome`) e `view=lean` limitam os
+    campos retornados. Com `If-None-Match` e nada alterado, 304.
+    """
+    selecao = select_fields(PaginatedComissaoMembroResponse, fields, view, include)
+    incluir = select_includes(PaginatedComissaoMembroResponse, include)
     service = ComissaoMembroService(db)
-    membros = service.get_all_by_comissao_id(comissao_id=comissao_id, skip=skip, limit=limit, filtro=filtro)
-    total = service.get_total_by_comissao_id(comissao_id=comissao_id, filtro=filtro)
-    return {"items": membros, "total": total}
+
+    def _render():
+        page = service.get_all_by_comissao_id(comissao_id=comissao_id, skip=skip, limit=limit, filtro=filtro, cursor=cursor, include_total=include_total, estimate=estimate, selecao=selecao)
+        return page_response(page, PaginatedComissaoMembroResponse, selecao, incluir)
+
+    return conditional_response(request, service.get_version_by_comissao_id(comissao_id=comissao_id, filtro=filtro), _render)
+
+@router.get("/comissao/{comissao_id}/exportar")
+def export_comissao_membros(
+    *,
+    db: Session = Depends(get_db),
+    comissao_id: int,
+    formato: ExportFormat = "csv",
+    filtro: Optional[str] = None,
+    current_user: Principal = Depends(get_current_principal)
+):
+    """
+    Exporta todos os membros de uma comissão (com o mesmo `filtro` da
+    listagem) em CSV ou NDJSON, gerado em streaming.
+    """
+    service = ComissaoMembroService(db)
+    itens = service.export_by_comissao_id(comissao_id=comissao_id, filtro=filtro)
+    return export_response(itens, ComissaoMembroPublic, formato, f"membros_comissao_{comissao_id}")
 
 @router.get("/{id}", response_model=ComissaoMembroPublic)
 def read_comissao_membro_by_id(
     *,
+    request: Request,
     db: Session = Depends(get_db),
     id: int,
-    current_user: Usuario = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     service = ComissaoMembroService(db)
-    return service.get_association(id=id)
+    return object_response(request, ComissaoMembroPublic, service.get_association(id=id))
 
 @router.put("/{id}", response_model=ComissaoMembroPublic)
 def update_comissao_membro(
@@ -57,7 +97,7 @@ def update_comissao_membro(
     db: Session = Depends(get_db),
     id: int,
     comissao_membro_in: ComissaoMembroUpdate,
-    current_user: Usuario = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     service = ComissaoMembroService(db)
     return service.update_association(id=id, association_in=comissao_membro_in)
@@ -67,7 +107,7 @@ def delete_comissao_membro(
     *,
     db: Session = Depends(get_db),
     id: int,
-    current_user: Usuario = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     service = ComissaoMembroService(db)
     service.delete_association(id=id)
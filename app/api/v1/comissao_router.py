@@ -1,12 +1,14 @@
-from fastapi import APIRouter, Depends, status, Response
+from fastapi import APIRouter, Depends, Query, Request, status, Response
 from sqlalchemy.orm import Session
 from typing import List, Optional
 
 from app.schemas.comissao_schema import ComissaoPublic, ComissaoCreate, ComissaoUpdate, PaginatedComissaoResponse
 from app.services.comissao_service import ComissaoService
 from app.db.database import get_db
-from app.core.security import get_current_user
-from app.models.usuario_model import Usuario
+from app.db.fields import ListView, page_response, select_fields
+from app.core.etag import conditional_response, object_response
+from app.core.security import get_current_principal
+from app.schemas.token_schema import Principal
 
 router = APIRouter(prefix="/comissoes", tags=["Comissões"])
 
@@ -15,7 +17,7 @@ def create_comissao(
     *,
     db: Session = Depends(get_db),
     comissao_in: ComissaoCreate,
-    current_user: Usuario = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     service = ComissaoService(db)
     return service.create_comissao(comissao_in=comissao_in)
@@ -23,27 +25,42 @@ def create_comissao(
 @router.get("/{id}", response_model=ComissaoPublic)
 def read_comissao_by_id(
     *,
+    request: Request,
     db: Session = Depends(get_db),
     id: int,
-    current_user: Usuario = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     service = ComissaoService(db)
-    return service.get_comissao(id=id)
+    return object_response(request, ComissaoPublic, service.get_comissao(id=id))
 
 @router.get("/camara/{camara_id}", response_model=PaginatedComissaoResponse)
 def read_comissoes_by_camara(
     *,
+    request: Request,
     db: Session = Depends(get_db),
     camara_id: int,
-    skip: int = 0,
-    limit: int = 100,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1),
     filtro: Optional[str] = None,
-    current_user: Usuario = Depends(get_current_user)
+    cursor: Optional[str] = None,
+    include_total: bool = True,
+    estimate: bool = False,
+    fields: Optional[str] = None,
+    view: Optional[ListView] = None,
+    current_user: Principal = Depends(get_current_principal)
 ):
+    """
+    Lista as comissões de uma câmara. `fields`/`view=lean` limitam os campos
+    retornados (ver app/db/fields.py). Com `If-None-Match` e nada alterado, 304.
+    """
+    selecao = select_fields(PaginatedComissaoResponse, fields, view)
     service = ComissaoService(db)
-    comissoes = service.get_all_comissoes_by_camara(camara_id=camara_id, skip=skip, limit=limit, filtro=filtro)
-    total = service.get_total_comissoes_by_camara(camara_id=camara_id, filtro=filtro)
-    return {"items": comissoes, "total": total}
+
+    def _render():
+        page = service.get_all_comissoes_by_camara(camara_id=camara_id, skip=skip, limit=limit, filtro=filtro, cursor=cursor, include_total=include_total, estimate=estimate, selecao=selecao)
+        return page_response(page, PaginatedComissaoResponse, selecao)
+
+    return conditional_response(request, service.get_comissoes_version_by_camara(camara_id=camara_id, filtro=filtro), _render)
 
 @router.put("/{id}", response_model=ComissaoPublic)
 def update_comissao(
@@ -51,7 +68,7 @@ def update_comissao(
     db: Session = Depends(get_db),
     id: int,
     comissao_in: ComissaoUpdate, 
-    current_user: Usuario = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     service = ComissaoService(db)
     return service.update_comissao(id=id, comissao_in=comissao_in)
@@ -61,7 +78,7 @@ def delete_comissao(
     *,
     db: Session = Depends(get_db),
     id: int,
-    current_user: Usuario = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     service = ComissaoService(db)
     service.delete_comissao(id=id)
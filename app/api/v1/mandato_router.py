@@ -1,5 +1,5 @@
 # votacao-backend/app/api/v1/mandato_router.py
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, Request, status
 from sqlalchemy.orm import Session
 from typing import List, Optional
 
@@ -12,8 +12,10 @@ from app.services.mandato_service import MandatoService
 
 # 3. Importações padrão para dependências
 from app.db.database import get_db
-from app.core.security import get_current_user
-from app.models.usuario_model import Usuario
+from app.db.fields import ListView, page_response, select_fields
+from app.core.etag import conditional_response, object_response
+from app.core.security import get_current_principal
+from app.schemas.token_schema import Principal
 
 # 4. Definição do router
 router = APIRouter(prefix="/mandatos", tags=["Mandatos"])
@@ -23,7 +25,7 @@ def create_mandato(
     *,
     db: Session = Depends(get_db),
     mandato_in: MandatoCreate,
-    current_user: Usuario = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """
     Cria um novo mandato. Requer autenticação.
@@ -34,35 +36,47 @@ def create_mandato(
 @router.get("/{id}", response_model=MandatoPublic)
 def read_mandato_by_id(
     *,
+    request: Request,
     db: Session = Depends(get_db),
     id: int,
-    current_user: Usuario = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """
     Obtém os dados de um mandato específico pelo seu ID.
     Requer autenticação.
     """
     service = MandatoService(db)
-    return service.get_mandato(id=id)
+    return object_response(request, MandatoPublic, service.get_mandato(id=id))
 
 @router.get("/camara/{camara_id}", response_model=PaginatedMandatoResponse)
 def read_mandatos_by_camara(
     *,
+    request: Request,
     db: Session = Depends(get_db),
     camara_id: int,
-    skip: int = 0,
-    limit: int = 100,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1),
     filtro: Optional[str] = None,
-    current_user: Usuario = Depends(get_current_user)
+    cursor: Optional[str] = None,
+    include_total: bool = True,
+    estimate: bool = False,
+    fields: Optional[str] = None,
+    view: Optional[ListView] = None,
+    current_user: Principal = Depends(get_current_principal)
 ):
     """
     Lista todos os mandatos associados a uma câmara específica com paginação.
-    Requer autenticação.
+    `fields`/`view=lean` limitam os campos retornados (ver app/db/fields.py).
+    Com `If-None-Match` e nada alterado, 304. Requer autenticação.
     """
+    selecao = select_fields(PaginatedMandatoResponse, fields, view)
     service = MandatoService(db)
-    mandatos = service.get_all_mandatos_by_camara(camara_id=camara_id, skip=skip, limit=limit, filtro=filtro)
-    total = service.get_total_mandatos_by_camara(camara_id=camara_id, filtro=filtro)
-    return {"items": mandatos, "total": total}
+
+    def _render():
+        page = service.get_all_mandatos_by_camara(camara_id=camara_id, skip=skip, limit=limit, filtro=filtro, cursor=cursor, include_total=include_total, estimate=estimate, selecao=selecao)
+        return page_response(page, PaginatedMandatoResponse, selecao)
+
+    return conditional_response(request, service.get_mandatos_version_by_camara(camara_id=camara_id, filtro=filtro), _render)
 
 @router.put("/{id}", response_model=MandatoPublic)
 def update_mandato(
@@ -70,7 +84,7 @@ def update_mandato(
     db: Session = Depends(get_db),
     id: int,
     mandato_in: MandatoUpdate, 
-    current_user: Usuario = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """
     Atualiza um mandato existente. Requer autenticação.
@@ -83,7 +97,7 @@ def delete_mandato(
     *,
     db: Session = Depends(get_db),
     id: int,
-    current_user: Usuario = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """
     Deleta um mandato. Requer autenticação.
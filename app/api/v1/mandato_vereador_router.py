@@ -1,5 +1,5 @@
 # app/api/v1/mandato_vereador_router.py
-from fastapi import APIRouter, Depends, status, Response
+from fastapi import APIRouter, Depends, Query, Request, status, Response
 from sqlalchemy.orm import Session
 from typing import List, Optional
 
@@ -7,12 +7,16 @@ from app.schemas.mandato_vereador_schema import (
     MandatoVereadorPublic, 
     MandatoVereadorCreate, 
     PaginatedMandatoVereadorResponse,
-    MandatoVereadorUpdatePayload
+    MandatoVereadorUpdatePayload,
+    MandatoVereadorImport,
+    MandatoVereadorImportResponse
 )
 from app.services.mandato_vereador_service import MandatoVereadorService
 from app.db.database import get_db
-from app.core.security import get_current_user
-from app.models.usuario_model import Usuario
+from app.db.fields import ListView, list_response, page_response, select_fields, select_includes
+from app.core.etag import conditional_response, object_response
+from app.core.security import get_current_principal
+from app.schemas.token_schema import Principal
 
 router = APIRouter(prefix="/mandato-vereador", tags=["Associação Mandato/Vereador"])
 
@@ -21,7 +25,7 @@ def create_association(
     *,
     db: Session = Depends(get_db),
     association_in: MandatoVereadorCreate,
-    current_user: Usuario = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """
     Cria uma nova associação entre um vereador e um mandato.
@@ -31,55 +35,99 @@ def create_association(
     service = MandatoVereadorService(db)
     return service.create_association(association_in=association_in)
 
+@router.post("/importar", response_model=MandatoVereadorImportResponse)
+def import_associations(
+    *,
+    db: Session = Depends(get_db),
+    import_in: MandatoVereadorImport,
+    current_user: Principal = Depends(get_current_principal)
+):
+    """
+    Importa em lote os vereadores de um mandato (até 1000 por requisição).
+    Cada item traz a 'funcao' e um 'vereador_id' ou os dados do 'vereador';
+    vereadores já cadastrados (mesmo e-mail ou CPF) são reaproveitados.
+    Retorna o resultado de cada linha: "criado", "associado" ou "erro".
+    """
+    service = MandatoVereadorService(db)
+    return service.import_associations(import_in=import_in)
+
 @router.get("/", response_model=List[MandatoVereadorPublic])
 def read_all_associations(
     *,
+    request: Request,
     db: Session = Depends(get_db),
-    skip: int = 0,
-    limit: int = 100,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1),
     camara_id: Optional[int] = None,
     mandato_ativo: Optional[bool] = None,
-    current_user: Usuario = Depends(get_current_user)
+    fields: Optional[str] = None,
+    view: Optional[ListView] = None,
+    current_user: Principal = Depends(get_current_principal)
 ):
     """
     Lista associações mandato-vereador com filtros opcionais.
     - `camara_id`: Filtra por câmara.
     - `mandato_ativo`: Filtra por mandatos ativos (true) ou inativos (false).
+    - `fields`/`view=lean`: limitam os campos retornados (ver app/db/fields.py).
+    Sem paginação: com a ETag, os tablets não baixam a lista de novo sem
+    alterações, e o corpo comprimido vem do cache (app/core/compression.py).
     """
+    # Os itens são os mesmos da listagem paginada por mandato
+    selecao = select_fields(PaginatedMandatoVereadorResponse, fields, view)
     service = MandatoVereadorService(db)
-    associacoes = service.get_all_associations(camara_id=camara_id, mandato_ativo=mandato_ativo)
-    return associacoes
+
+    def _render():
+        associacoes = service.get_all_associations(camara_id=camara_id, mandato_ativo=mandato_ativo, selecao=selecao)
+        return list_response(associacoes, PaginatedMandatoVereadorResponse, selecao)
+
+    return conditional_response(request, service.get_all_associations_version(camara_id=camara_id, mandato_ativo=mandato_ativo), _render)
 
 @router.get("/mandato/{mandato_id}", response_model=PaginatedMandatoVereadorResponse)
 def read_associations_by_mandato(
     *,
+    request: Request,
     db: Session = Depends(get_db),
     mandato_id: int,
-    skip: int = 0,
-    limit: int = 100,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1),
     filtro: Optional[str] = None,
-    current_user: Usuario = Depends(get_current_user)
+    cursor: Optional[str] = None,
+    include_total: bool = True,
+    estimate: bool = False,
+    fields: Optional[str] = None,
+    view: Optional[ListView] = None,
+    include: Optional[str] = None,
+    current_user: Principal = Depends(get_current_principal)
 ):
     """
     Lista todos os vereadores associados a um mandato específico, com paginação e filtro.
+    Com `include=mandato`, o mandato vem uma vez só em `included`.
+    `fields`/`view=lean` limitam os campos retornados (ver app/db/fields.py).
+    Com `If-None-Match` e nada alterado, 304.
     """
+    selecao = select_fields(PaginatedMandatoVereadorResponse, fields, view, include)
+    incluir = select_includes(PaginatedMandatoVereadorResponse, include)
     service = MandatoVereadorService(db)
-    associacoes = service.get_associations_by_mandato(mandato_id=mandato_id, skip=skip, limit=limit, filtro=filtro)
-    total = service.get_total_associations_by_mandato(mandato_id=mandato_id, filtro=filtro)
-    return {"items": associacoes, "total": total}
+
+    def _render():
+        page = service.get_associations_by_mandato(mandato_id=mandato_id, skip=skip, limit=limit, filtro=filtro, cursor=cursor, include_total=include_total, estimate=estimate, selecao=selecao)
+        return page_response(page, PaginatedMandatoVereadorResponse, selecao, incluir)
+
+    return conditional_response(request, service.get_associations_version_by_mandato(mandato_id=mandato_id, filtro=filtro), _render)
 
 @router.get("/{id}", response_model=MandatoVereadorPublic)
 def read_association_by_id(
     *,
+    request: Request,
     db: Session = Depends(get_db),
     id: int,
-    current_user: Usuario = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """
     Busca os dados de uma associação específica pelo seu ID.
     """
     service = MandatoVereadorService(db)
-    return service.get_association(id=id)
+    return object_response(request, MandatoVereadorPublic, service.get_association(id=id))
 
 @router.put("/{id}", response_model=MandatoVereadorPublic)
 def update_association(
@@ -87,7 +135,7 @@ def update_association(
     db: Session = Depends(get_db),
     id: int,
     association_in: MandatoVereadorUpdatePayload,
-    current_user: Usuario = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """
     Atualiza os dados de uma associação (função) e os dados do vereador associado.
@@ -100,7 +148,7 @@ def delete_association(
     *,
     db: Session = Depends(get_db),
     id: int,
-    current_user: Usuario = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """
     Deleta uma associação entre um vereador e um mandato.
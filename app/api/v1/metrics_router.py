@@ -0,0 +1,24 @@
+# app/api/v1/metrics_router.py
+from fastapi import APIRouter, Depends
+
+from app.core.compression import compression_stats
+from app.core.hashing import hashing_stats
+from app.core.principal_cache import principal_cache
+from app.services.auth_service import login_cache
+from app.core.security import get_current_principal
+from app.schemas.token_schema import Principal
+
+router = APIRouter(prefix="/metricas", tags=["Métricas"])
+
+@router.get("/")
+def read_metrics(current_user: Principal = Depends(get_current_principal)):
+    """
+    Contadores do processo que atendeu a requisição (cada worker tem os seus).
+    - `auth_cache`: acertos e faltas do cache de usuários autenticados.
+    - `login_cache`: acertos e faltas do cache das câmaras/claims do login.
+    - `hashing`: fila e latência (ms) do pool de processos do bcrypt.
+    - `compression`: respostas comprimidas, bytes antes/depois, CPU gasta,
+      respostas sem compressão por falta de orçamento e o cache por ETag.
+    """
+    return {"auth_cache": principal_cache.stats(), "login_cache": login_cache.stats(), "hashing": hashing_stats(),
+            "compression": compression_stats()}
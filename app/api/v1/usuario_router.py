@@ -1,37 +1,49 @@
 # app/api/v1/usuario_router.py
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from app.schemas.usuario_schema import UsuarioCreate, UsuarioPublic, PaginatedUsuarioResponse, UsuarioUpdate, UsuarioSimple
-from app.services.usuario_service import UsuarioService
+from app.services.usuario_service import UsuarioService, hash_new_password
 from app.db.database import get_db
-from app.core.security import get_current_user
+from app.db.fields import ListView, page_response, select_fields
+from app.core.security import get_current_user, get_current_principal
 from app.models.usuario_model import Usuario
+from app.schemas.token_schema import Principal
 from typing import List, Optional
 
 router = APIRouter(prefix="/usuarios", tags=["Usuários"])
 
+# Assíncronas: o bcrypt roda no pool de processos (app/core/hashing.py) sem
+# ocupar uma thread do servidor; o serviço vai para o threadpool
 @router.post("/", response_model=UsuarioPublic, status_code=status.HTTP_201_CREATED)
-def create_usuario(usuario: UsuarioCreate, db: Session = Depends(get_db)):
+async def create_usuario(usuario: UsuarioCreate, db: Session = Depends(get_db)):
     """
     Cria um novo usuário no sistema.
     """
+    hashed_password = await hash_new_password(usuario.senha, usuario.confSenha)
     service = UsuarioService(db)
-    return service.create_usuario(usuario_create=usuario)
+    return await run_in_threadpool(service.create_usuario, usuario_create=usuario, hashed_password=hashed_password)
 
 @router.get("/", response_model=PaginatedUsuarioResponse)
 def read_usuarios(
-    skip: int = 0,
-    limit: int = 100,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1),
     filtro: Optional[str] = None,
+    cursor: Optional[str] = None,
+    include_total: bool = True,
+    estimate: bool = False,
+    fields: Optional[str] = None,
+    view: Optional[ListView] = None,
     db: Session = Depends(get_db),
 ):
     """
-    Retorna uma lista de usuários.
+    Retorna uma lista de usuários. `fields`/`view=lean` limitam os campos
+    retornados (ver app/db/fields.py).
     """
+    selecao = select_fields(PaginatedUsuarioResponse, fields, view)
     service = UsuarioService(db)
-    usuarios = service.get_all_usuarios(skip=skip, limit=limit, filtro=filtro)
-    total = service.get_total_usuarios(filtro=filtro)
-    return {"items": usuarios, "total": total}
+    page = service.get_all_usuarios(skip=skip, limit=limit, filtro=filtro, cursor=cursor, include_total=include_total, estimate=estimate, selecao=selecao)
+    return page_response(page, PaginatedUsuarioResponse, selecao)
 
 @router.get("/me", response_model=UsuarioPublic)
 def read_usuario_me(current_user: Usuario = Depends(get_current_user)):
@@ -44,7 +56,7 @@ def read_usuario_me(current_user: Usuario = Depends(get_current_user)):
 def read_usuario_by_id(
     usuario_id: int, 
     db: Session = Depends(get_db),
-    current_user: Usuario = Depends(get_current_user) # Rota protegida
+    current_user: Principal = Depends(get_current_principal) # Rota protegida
 ):
     """
     Retorna um usuário específico pelo ID.
@@ -57,7 +69,7 @@ def read_usuario_by_id(
 def read_usuario_by_email(
     email: str, 
     db: Session = Depends(get_db),
-    current_User: Usuario = Depends(get_current_user) # Rota protegida
+    current_User: Principal = Depends(get_current_principal) # Rota protegida
 ):
     """
     Retorna um usuário específico pelo email.
@@ -67,15 +79,17 @@ def read_usuario_by_email(
 
 
 @router.put("/{usuario_id}", response_model=UsuarioPublic)
-def update_usuario(
+async def update_usuario(
     usuario_id: int,
     usuario_update: UsuarioUpdate,
     db: Session = Depends(get_db),
-    current_user: Usuario = Depends(get_current_user) # Rota protegida
+    current_user: Principal = Depends(get_current_principal) # Rota protegida
 ):
     """
     Atualiza um usuário.
     """
+    hashed_password = await hash_new_password(usuario_update.senha, usuario_update.confSenha)
     service = UsuarioService(db)
-    return service.update_usuario(usuario_id=usuario_id, usuario_update=usuario_update)
+    return await run_in_threadpool(service.update_usuario, usuario_id=usuario_id, usuario_update=usuario_update,
+                                   hashed_password=hashed_password)
 
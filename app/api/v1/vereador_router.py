@@ -1,11 +1,14 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, Request, status
 from sqlalchemy.orm import Session
-from app.schemas.vereador_schema import VereadorCreate, VereadorPublic, PaginatedVereadorResponse, VereadorUpdate, VereadorSimple
+from app.schemas.vereador_schema import Vereador, VereadorCreate, VereadorPublic, PaginatedVereadorResponse, VereadorUpdate, VereadorSimple
 from app.services.usuario_service import UsuarioService
 from app.services.vereador_service import VereadorService
 from app.db.database import get_db
-from app.core.security import get_current_user
-from app.models.usuario_model import Usuario
+from app.db.export import ExportFormat, export_response
+from app.db.fields import ListView, page_response, select_fields
+from app.core.etag import conditional_response, object_response
+from app.core.security import get_current_principal
+from app.schemas.token_schema import Principal
 from typing import List, Optional
 
 router = APIRouter(prefix="/vereadores", tags=["Vereadores"])
@@ -15,7 +18,7 @@ def create_vereador(
     *,
     db: Session = Depends(get_db),
     vereador: VereadorCreate,
-    current_user: Usuario = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """
     Criar um novo vereador no sistema.
@@ -27,33 +30,61 @@ def create_vereador(
 @router.get("/", response_model=PaginatedVereadorResponse)
 def read_vereadores(
     *,
+    request: Request,
     db: Session = Depends(get_db),
-    skip: int = 0,
-    limit: int = 100,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1),
     filtro: Optional[str] = None,
-    current_user: Usuario = Depends(get_current_user)
+    cursor: Optional[str] = None,
+    include_total: bool = True,
+    estimate: bool = False,
+    fields: Optional[str] = None,
+    view: Optional[ListView] = None,
+    current_user: Principal = Depends(get_current_principal)
 ):
     """
-    Retorna uma lista de vereadores.
+    Retorna uma lista de vereadores. `fields`/`view=lean` limitam os campos
+    retornados (ver app/db/fields.py). Com `If-None-Match` e nada alterado, 304.
     """
+    selecao = select_fields(PaginatedVereadorResponse, fields, view)
     service = VereadorService(db)
-    vereadores = service.get_all_vereadores(skip=skip, limit=limit, filtro=filtro)
-    total = service.get_total_vereadores(filtro=filtro)
-    return {"items": vereadores, "total": total}
+
+    def _render():
+        page = service.get_all_vereadores(skip=skip, limit=limit, filtro=filtro, cursor=cursor, include_total=include_total, estimate=estimate, selecao=selecao)
+        return page_response(page, PaginatedVereadorResponse, selecao)
+
+    return conditional_response(request, service.get_vereadores_version(filtro=filtro), _render)
+
+
+@router.get("/exportar")
+def export_vereadores(
+    *,
+    db: Session = Depends(get_db),
+    formato: ExportFormat = "csv",
+    filtro: Optional[str] = None,
+    current_user: Principal = Depends(get_current_principal)
+):
+    """
+    Exporta todos os vereadores (com o mesmo `filtro` da listagem) em CSV ou
+    NDJSON. O arquivo é gerado em streaming, sem paginação.
+    """
+    service = VereadorService(db)
+    return export_response(service.export_vereadores(filtro=filtro), Vereador, formato, "vereadores")
 
 
 @router.get("/{id}", response_model=VereadorPublic)
 def read_vereador_by_id(
     *,
+    request: Request,
     db: Session = Depends(get_db),
     id: int,
-    current_user: Usuario = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """
     Retorna um vereador específico pelo seu ID.
     """
     service = VereadorService(db)
-    return service.get_vereador_by_id(id=id)
+    return object_response(request, VereadorPublic, service.get_vereador_by_id(id=id))
 
 
 @router.get("/cpf/{cpf}", response_model=VereadorSimple)
@@ -61,7 +92,7 @@ def read_vereador_by_cpf(
     *,
     db: Session = Depends(get_db),
     cpf: str,
-    current_user: Usuario = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """
     Retorna um vereador específico pelo seu CPF.
@@ -75,7 +106,7 @@ def read_vereador_by_email(
     *,
     db: Session = Depends(get_db),
     email: str,
-    current_user: Usuario = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """
     Retorna um vereador específico pelo seu email.
@@ -90,7 +121,7 @@ def update_vereador(
     db: Session = Depends(get_db),
     id: int,
     vereador_update: VereadorUpdate,
-    current_user: Usuario = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """
     Atualiza um vereador existente.
@@ -0,0 +1,98 @@
+# app/core/cache.py
+"""
+Cache em memória com validade (TTL) e descarte dos menos usados (LRU), por
+processo, com invalidação amarrada à transação da sessão.
+
+`invalidate_on_commit`/`clear_on_commit` removem as entradas na hora e de
+novo após o commit, para que uma requisição concorrente não deixe no cache
+o estado anterior à transação.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+
+class MemoryCache:
+    def __init__(self, maxsize: int, ttl: float, nome: str):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.nome = nome
+        self._itens: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+        # Chaves a invalidar no commit, guardadas em Session.info
+        self._info_chaves = f"cache:{nome}:chaves"
+        self._info_limpar = f"cache:{nome}:limpar"
+        event.listen(Session, "after_commit", self._after_commit)
+        event.listen(Session, "after_rollback", self._after_rollback)
+
+    @property
+    def enabled(self) -> bool:
+        return self.maxsize > 0 and self.ttl > 0
+
+    def get(self, chave: Hashable) -> Optional[Any]:
+        with self._lock:
+            item = self._itens.get(chave)
+            if item is None or item[0] < time.monotonic():
+                if item is not None:
+                    del self._itens[chave]
+                self.misses += 1
+                return None
+            self._itens.move_to_end(chave)
+            self.hits += 1
+            return item[1]
+
+    def set(self, chave: Hashable, valor: Any) -> None:
+        with self._lock:
+            self._itens[chave] = (time.monotonic() + self.ttl, valor)
+            self._itens.move_to_end(chave)
+            while len(self._itens) > self.maxsize:
+                self._itens.popitem(last=False)
+
+    def invalidate(self, *chaves: Hashable) -> None:
+        with self._lock:
+            for chave in chaves:
+                self._itens.pop(chave, None)
+
+    def invalidate_on_commit(self, db: Session, *chaves: Hashable) -> None:
+        """Invalida agora e de novo quando a transação da sessão for confirmada."""
+        self.invalidate(*chaves)
+        db.info.setdefault(self._info_chaves, set()).update(chaves)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._itens.clear()
+
+    def clear_on_commit(self, db: Session) -> None:
+        """Esvazia agora e de novo quando a transação da sessão for confirmada."""
+        self.clear()
+        db.info[self._info_limpar] = True
+
+    def stats(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._itens),
+                "maxsize": self.maxsize,
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / total, 4) if total else None,
+            }
+
+    def _after_commit(self, session) -> None:
+        if session.info.pop(self._info_limpar, False):
+            self.clear()
+        chaves = session.info.pop(self._info_chaves, None)
+        if chaves:
+            self.invalidate(*chaves)
+
+    def _after_rollback(self, session) -> None:
+        session.info.pop(self._info_limpar, None)
+        session.info.pop(self._info_chaves, None)
@@ -0,0 +1,267 @@
+# app/core/compression.py
+"""
+Compressão das respostas (brotli/gzip), negociada pelo Accept-Encoding.
+
+As listagens grandes (ex.: GET /mandato-vereador/, sem paginação) vão para
+os tablets pela rede sem fio do plenário. O middleware:
+
+- escolhe `br` (se o pacote brotli estiver instalado) ou `gzip`, pela
+  preferência (q) do cliente; `br` no empate;
+- só comprime JSON, NDJSON e texto (CSV) a partir de COMPRESSION_MIN_SIZE
+  bytes; respostas menores, 304 e as que já têm Content-Encoding passam
+  direto;
+- respeita um orçamento de CPU por processo (COMPRESSION_CPU_BUDGET segundos
+  de CPU por segundo): esgotado, as respostas saem sem compressão até ele
+  se recompor, em vez de a compressão disputar a CPU com as requisições;
+- guarda os corpos comprimidos das respostas com ETag (app/core/etag.py),
+  por ETag e codificação: a mesma listagem pedida por vários tablets é
+  comprimida uma vez só. O corpo é conferido pelo hash antes do reuso.
+
+Corpos grandes são comprimidos numa thread, sem travar o event loop. As
+exportações (streaming) são comprimidas bloco a bloco, sem cache. ETags
+fortes viram fracas ao comprimir (as da aplicação já são). Os contadores
+ficam em GET /metricas/ (`compression`).
+"""
+import hashlib
+import threading
+import time
+import zlib
+from typing import Callable, Optional
+
+import anyio.to_thread
+from starlette.datastructures import Headers, MutableHeaders
+
+from app.core.cache import MemoryCache
+from app.core.config import settings
+
+try:
+    import brotli
+except ImportError:  # opcional: sem ele, só gzip
+    brotli = None
+
+# Acima disso a compressão roda numa thread (o mesmo limite do GZipMiddleware do Starlette)
+THREAD_MIN_SIZE = 128 * 1024
+
+
+def _comprimivel(content_type: str) -> bool:
+    tipo = content_type.partition(";")[0].strip().lower()
+    if tipo.startswith("text/"):
+        return tipo != "text/event-stream"
+    return tipo in ("application/json", "application/x-ndjson") or tipo.endswith("+json")
+
+
+def negotiate(accept_encoding: str) -> Optional[str]:
+    """Codificação da resposta: a de maior q entre `br` e `gzip` (None: sem compressão)."""
+    pesos: dict[str, float] = {}
+    for parte in accept_encoding.lower().split(","):
+        nome, _, params = parte.partition(";")
+        q = 1.0
+        for param in params.split(";"):
+            chave, _, valor = param.strip().partition("=")
+            if chave == "q":
+                try:
+                    q = float(valor)
+                except ValueError:
+                    q = 0.0
+        if nome.strip():
+            pesos[nome.strip()] = q
+
+    melhor, melhor_q = None, 0.0
+    for codificacao in (("br",) if brotli else ()) + ("gzip",):
+        q = pesos.get(codificacao, pesos.get("*", 0.0))
+        if q > melhor_q:
+            melhor, melhor_q = codificacao, q
+    return melhor
+
+
+def _compressor(codificacao: str) -> Callable[[bytes, bool], bytes]:
+    """Função (bloco, fim) -> bytes comprimidos, de um stream na `codificacao`."""
+    if codificacao == "br":
+        c = brotli.Compressor(quality=settings.COMPRESSION_BROTLI_QUALITY)
+        return lambda bloco, fim: c.process(bloco) + (c.finish() if fim else c.flush())
+    z = zlib.compressobj(settings.COMPRESSION_GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    return lambda bloco, fim: z.compress(bloco) + z.flush(zlib.Z_FINISH if fim else zlib.Z_SYNC_FLUSH)
+
+
+class CPUBudget:
+    """
+    Balde de fichas em segundos de CPU: recebe `taxa` por segundo, até `taxa`
+    acumulados. Cada compressão desconta a CPU que usou (o saldo pode ficar
+    negativo); sem saldo, não se comprime. `taxa` 0 desliga a compressão.
+    """
+    def __init__(self, taxa: float):
+        self.taxa = taxa
+        self._saldo = taxa
+        self._em = time.monotonic()
+        self._lock = threading.Lock()
+
+    def available(self) -> bool:
+        with self._lock:
+            agora = time.monotonic()
+            self._saldo = min(self.taxa, self._saldo + (agora - self._em) * self.taxa)
+            self._em = agora
+            return self.taxa > 0 and self._saldo > 0
+
+    def spend(self, segundos: float) -> None:
+        with self._lock:
+            self._saldo -= segundos
+
+
+class CompressionMetrics:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.responses: dict[str, int] = {}
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.cpu_seconds = 0.0
+        self.over_budget = 0
+
+    def add(self, codificacao: str, entrada: int, saida: int, cpu: float = 0.0, nova: bool = True) -> None:
+        with self._lock:
+            if nova:
+                self.responses[codificacao] = self.responses.get(codificacao, 0) + 1
+            self.bytes_in += entrada
+            self.bytes_out += saida
+            self.cpu_seconds += cpu
+
+    def skip(self) -> None:
+        with self._lock:
+            self.over_budget += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "responses": dict(self.responses),
+                "bytes_in": self.bytes_in,
+                "bytes_out": self.bytes_out,
+                "ratio": round(self.bytes_out / self.bytes_in, 4) if self.bytes_in else None,
+                "cpu_ms": round(self.cpu_seconds * 1000, 1),
+                "over_budget": self.over_budget,
+            }
+
+
+compression_budget = CPUBudget(settings.COMPRESSION_CPU_BUDGET)
+compression_cache = MemoryCache(settings.COMPRESSION_CACHE_MAXSIZE, settings.COMPRESSION_CACHE_TTL_SECONDS, "compressao")
+compression_metrics = CompressionMetrics()
+
+
+def compression_stats() -> dict:
+    return {**compression_metrics.stats(), "brotli": brotli is not None, "cache": compression_cache.stats()}
+
+
+def _comprimir(codificacao: str, fn: Callable[[bytes, bool], bytes], bloco: bytes, fim: bool, nova: bool) -> bytes:
+    inicio = time.thread_time()
+    saida = fn(bloco, fim)
+    cpu = time.thread_time() - inicio
+    compression_budget.spend(cpu)
+    compression_metrics.add(codificacao, len(bloco), len(saida), cpu, nova)
+    return saida
+
+
+async def _executar(codificacao: str, fn: Callable[[bytes, bool], bytes], bloco: bytes, fim: bool, nova: bool = False) -> bytes:
+    if len(bloco) >= THREAD_MIN_SIZE:
+        return await anyio.to_thread.run_sync(_comprimir, codificacao, fn, bloco, fim, nova)
+    return _comprimir(codificacao, fn, bloco, fim, nova)
+
+
+async def compress_body(codificacao: str, body: bytes, etag: Optional[str]) -> Optional[bytes]:
+    """
+    Corpo inteiro comprimido, do cache (pela ETag) ou comprimido agora.
+    None se o orçamento de CPU estiver esgotado.
+    """
+    chave = digest = None
+    if etag and compression_cache.enabled:
+        chave = (etag, codificacao)
+        digest = hashlib.blake2b(body, digest_size=16).digest()
+        item = compression_cache.get(chave)
+        if item is not None and item[0] == digest:
+            compression_metrics.add(codificacao, len(body), len(item[1]))
+            return item[1]
+
+    if not compression_budget.available():
+        compression_metrics.skip()
+        return None
+    comprimido = await _executar(codificacao, _compressor(codificacao), body, True, nova=True)
+    if chave is not None:
+        compression_cache.set(chave, (digest, comprimido))
+    return comprimido
+
+
+class CompressionMiddleware:
+    """Middleware ASGI de compressão das respostas (ver o início do módulo)."""
+    def __init__(self, app, minimum_size: int = settings.COMPRESSION_MIN_SIZE):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        codificacao = negotiate(Headers(scope=scope).get("accept-encoding", ""))
+        inicio = None       # http.response.start, retida até o primeiro bloco do corpo
+        direto = False      # resposta que não se comprime: repassada como veio
+        stream = None       # compressor do streaming, do segundo bloco em diante
+
+        async def send_compressed(message):
+            nonlocal inicio, direto, stream
+            tipo = message["type"]
+            if tipo == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                direto = (
+                    message["status"] in (204, 206, 304)
+                    or "content-encoding" in headers
+                    or not _comprimivel(headers.get("content-type", ""))
+                )
+                if direto:
+                    await send(message)
+                else:
+                    inicio = message
+                return
+
+            if tipo != "http.response.body" or direto:
+                if inicio is not None:
+                    await send(inicio)
+                    inicio = None
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if inicio is None:
+                if stream is not None:
+                    message["body"] = await _executar(codificacao, stream, body, not more_body)
+                await send(message)
+                return
+
+            mensagem_inicio, inicio = inicio, None
+            headers = MutableHeaders(raw=mensagem_inicio["headers"])
+            headers.add_vary_header("Accept-Encoding")
+            if codificacao is None or (not more_body and len(body) < self.minimum_size):
+                await send(mensagem_inicio)
+                await send(message)
+                return
+
+            if not more_body:
+                comprimido = await compress_body(codificacao, body, headers.get("etag"))
+                if comprimido is not None:
+                    headers["Content-Length"] = str(len(comprimido))
+                    message["body"] = comprimido
+            elif compression_budget.available():
+                stream = _compressor(codificacao)
+                comprimido = message["body"] = await _executar(codificacao, stream, body, False, nova=True)
+                if "content-length" in headers:
+                    del headers["Content-Length"]
+            else:
+                comprimido = None
+                compression_metrics.skip()
+
+            if comprimido is not None:
+                headers["Content-Encoding"] = codificacao
+                etag = headers.get("etag")
+                if etag and not etag.startswith("W/"):
+                    headers["ETag"] = "W/" + etag
+            await send(mensagem_inicio)
+            await send(message)
+
+        await self.app(scope, receive, send_compressed)
@@ -2,6 +2,7 @@
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import model_validator, Field
+from sqlalchemy.engine import make_url
 from typing import Any
 
 class Settings(BaseSettings):
@@ -9,42 +10,111 @@ class Settings(BaseSettings):
     model_config = SettingsConfigDict(env_file=".env", extra="ignore")
 
     # Variáveis para a escolha do banco de dados
-    DB_DIALECT: str = Field(..., description="Dialeto do banco: 'postgresql' ou 'mysql'")
-    DB_HOST: str
-    DB_USER: str
-    DB_PASSWORD: str
+    DB_DIALECT: str = Field(..., description="Dialeto do banco: 'postgresql', 'mysql' ou 'sqlite'")
+    # Para 'sqlite' apenas DB_NAME (caminho do arquivo) é utilizado
+    DB_HOST: str | None = None
+    DB_USER: str | None = None
+    DB_PASSWORD: str | None = None
     DB_NAME: str
-    DB_PORT: int
+    DB_PORT: int | None = None
 
-    # Esta variável será CONSTRUÍDA a partir das variáveis acima
+    # Habilita o modo assíncrono (create_async_engine + AsyncSession)
+    DB_ASYNC: bool = False
+
+    # Réplicas de leitura: URLs separadas por vírgula (ex: "postgresql://u:s@replica1/db,...")
+    DB_REPLICA_URLS: str = ""
+    # Janela (em segundos) em que um cliente que acabou de escrever continua lendo do primário.
+    # A marca da escrita vai no cookie db_primario_ate, válido em qualquer processo/servidor;
+    # para clientes que não devolvem cookies, vale só no processo que recebeu a escrita
+    DB_REPLICA_LAG_SECONDS: float = 5.0
+
+    # Expõe, por requisição, o número de comandos SQL e commits (X-DB-Statements/X-DB-Commits)
+    DB_METRICS: bool = False
+
+    # Estas variáveis serão CONSTRUÍDAS a partir das variáveis acima
     SQLALCHEMY_DATABASE_URI: str | None = None
+    SQLALCHEMY_ASYNC_DATABASE_URI: str | None = None
+    SQLALCHEMY_REPLICA_URIS: list[str] = []
+    SQLALCHEMY_ASYNC_REPLICA_URIS: list[str] = []
 
     @model_validator(mode='after')
     def build_database_uri(self) -> 'Settings':
         """
-        Constrói a URI de conexão com o banco de dados dinamicamente
-        com base no dialeto escolhido.
+        Constrói as URIs de conexão (síncrona e assíncrona) com o banco
+        de dados dinamicamente com base no dialeto escolhido.
         """
         if self.DB_DIALECT == "postgresql":
-            # Usa o driver psycopg2
-            self.SQLALCHEMY_DATABASE_URI = (
-                f"postgresql+psycopg2://{self.DB_USER}:{self.DB_PASSWORD}"
+            # Usa o driver psycopg2 (síncrono) e asyncpg (assíncrono)
+            credenciais = (
+                f"{self.DB_USER}:{self.DB_PASSWORD}"
                 f"@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
             )
+            self.SQLALCHEMY_DATABASE_URI = f"postgresql+psycopg2://{credenciais}"
+            self.SQLALCHEMY_ASYNC_DATABASE_URI = f"postgresql+asyncpg://{credenciais}"
         elif self.DB_DIALECT == "mysql":
-            # Usa o driver mysqlclient
-            self.SQLALCHEMY_DATABASE_URI = (
-                f"mysql+pymysql://{self.DB_USER}:{self.DB_PASSWORD}"
+            # Usa o driver PyMySQL (síncrono) e aiomysql (assíncrono)
+            credenciais = (
+                f"{self.DB_USER}:{self.DB_PASSWORD}"
                 f"@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
             )
+            self.SQLALCHEMY_DATABASE_URI = f"mysql+pymysql://{credenciais}"
+            self.SQLALCHEMY_ASYNC_DATABASE_URI = f"mysql+aiomysql://{credenciais}"
+        elif self.DB_DIALECT == "sqlite":
+            # Banco local em arquivo, usado em desenvolvimento e testes
+            self.SQLALCHEMY_DATABASE_URI = f"sqlite:///{self.DB_NAME}"
+            self.SQLALCHEMY_ASYNC_DATABASE_URI = f"sqlite+aiosqlite:///{self.DB_NAME}"
         else:
             raise ValueError(f"Dialeto de banco de dados não suportado: {self.DB_DIALECT}")
+
+        # As réplicas usam os mesmos drivers do primário
+        sync_driver = make_url(self.SQLALCHEMY_DATABASE_URI).drivername
+        async_driver = make_url(self.SQLALCHEMY_ASYNC_DATABASE_URI).drivername
+        replicas, async_replicas = [], []
+        for url in filter(None, (u.strip() for u in self.DB_REPLICA_URLS.split(","))):
+            replica_url = make_url(url)
+            if replica_url.get_backend_name() != self.DB_DIALECT:
+                raise ValueError(f"Réplica com dialeto diferente do primário: {url}")
+            replicas.append(replica_url.set(drivername=sync_driver).render_as_string(hide_password=False))
+            async_replicas.append(replica_url.set(drivername=async_driver).render_as_string(hide_password=False))
+        self.SQLALCHEMY_REPLICA_URIS = replicas
+        self.SQLALCHEMY_ASYNC_REPLICA_URIS = async_replicas
         return self
 
     # Configurações de Segurança e JWT (continuam as mesmas)
     SECRET_KEY: str
     ALGORITHM: str
     ACCESS_TOKEN_EXPIRE_MINUTES: int
+    # Validade do refresh token (renovada a cada uso, em POST /refresh)
+    REFRESH_TOKEN_EXPIRE_DAYS: int = 30
+
+    # Cache do usuário autenticado (app/core/principal_cache.py); 0 desabilita
+    AUTH_CACHE_TTL_SECONDS: float = 60.0
+    AUTH_CACHE_MAXSIZE: int = 10000
+
+    # Cache das câmaras/claims do login por usuário (app/services/auth_service.py); 0 desabilita
+    LOGIN_CACHE_TTL_SECONDS: float = 300.0
+    LOGIN_CACHE_MAXSIZE: int = 10000
+
+    # Intervalo (s) em que cada processo relê do banco as versões dos tokens
+    # revogados (app/core/token_version.py)
+    TOKEN_VERSION_TTL_SECONDS: float = 30.0
+
+    # Pool de processos do bcrypt (app/core/hashing.py): processos (padrão:
+    # núcleos; 0 executa na própria thread), pedidos aguardando e Retry-After do 503
+    HASH_WORKERS: int | None = None
+    HASH_QUEUE_SIZE: int = 32
+    HASH_RETRY_AFTER_SECONDS: int = 1
+
+    # Compressão das respostas (app/core/compression.py): tamanho mínimo (bytes),
+    # níveis do gzip (1-9) e do brotli (0-11) e orçamento de CPU, em segundos de
+    # CPU por segundo em cada processo (0 desliga a compressão)
+    COMPRESSION_MIN_SIZE: int = 1024
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4
+    COMPRESSION_CPU_BUDGET: float = 0.5
+    # Cache dos corpos já comprimidos, por ETag e codificação; 0 desabilita
+    COMPRESSION_CACHE_TTL_SECONDS: float = 300.0
+    COMPRESSION_CACHE_MAXSIZE: int = 64
 
 # Cria uma instância única das configurações para ser usada em toda a aplicação
-settings = Settings()
\ No newline at end of file
+settings = Settings()
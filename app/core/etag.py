@@ -0,0 +1,79 @@
+# app/core/etag.py
+"""
+Requisições condicionais (ETag / If-None-Match) nas leituras.
+
+A ETag é um hash da versão dos dados da resposta e da URL (os parâmetros
+mudam o corpo):
+
+- detalhe: id e dt_atualizado do objeto e dos objetos aninhados no schema
+  (`object_response`);
+- listagem: número de linhas e maior dt_atualizado de cada tabela da
+  resposta, sobre o filtro da listagem (Projection.version), numa consulta
+  de agregação, sem ler a página (`conditional_response`).
+
+Se a ETag enviada em `If-None-Match` ainda vale, a resposta é 304 sem corpo:
+na listagem, sem a consulta da página nem a serialização; no detalhe, sem a
+serialização. As respostas vão com `Cache-Control: private, no-cache`: o
+navegador as guarda e sempre revalida.
+
+Inclusões, alterações (o dt_atualizado é atualizado em todo UPDATE feito
+pela aplicação) e exclusões, lógicas ou não, mudam a versão. Onde o
+dt_atualizado só tem segundos (SQLite, TIMESTAMP do MySQL), uma segunda
+alteração no mesmo segundo, lida entre as duas, só aparece na alteração
+seguinte. As ETags são fracas (`W/`): a mesma versão vale com ou sem
+compressão.
+"""
+import hashlib
+from typing import Any, Callable
+
+from fastapi import Request, Response, status
+from pydantic import BaseModel
+
+from app.core.serialization import JSONBytesResponse, _plano, construct, get_adapter
+
+
+def _etag(request: Request, versao: tuple) -> str:
+    chave = repr((request.url.path, request.url.query, versao)).encode()
+    return f'W/"{hashlib.blake2b(chave, digest_size=16).hexdigest()}"'
+
+
+def _corresponde(request: Request, etag: str) -> bool:
+    """Comparação fraca com as ETags de If-None-Match (ou `*`)."""
+    cabecalho = request.headers.get("if-none-match")
+    if not cabecalho:
+        return False
+    if cabecalho.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag.removeprefix("W/") for tag in cabecalho.split(","))
+
+
+def conditional_response(request: Request, versao: tuple, render: Callable[[], Response]) -> Response:
+    """
+    304 se a ETag da `versao` for a do If-None-Match; senão, a resposta de
+    `render()` (chamado só nesse caso) com a ETag.
+    """
+    etag = _etag(request, versao)
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if _corresponde(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    resposta = render()
+    resposta.headers.update(headers)
+    return resposta
+
+
+def object_version(schema: type[BaseModel], obj: Any) -> tuple:
+    """(id, dt_atualizado) do objeto e, recursivamente, dos aninhados no schema."""
+    versao: list = [obj.id, getattr(obj, "dt_atualizado", None)]
+    for nome, sub, _ in _plano(schema):
+        if sub is not None:
+            relacionado = getattr(obj, nome)
+            versao.append(object_version(sub, relacionado) if relacionado is not None else None)
+    return tuple(versao)
+
+
+def object_response(request: Request, schema: type[BaseModel], obj: Any) -> Response:
+    """Detalhe com ETag: o objeto só é serializado (como `schema`) sem o 304."""
+    return conditional_response(
+        request, object_version(schema, obj),
+        lambda: JSONBytesResponse(get_adapter(schema).dump_json(construct(schema, obj)))
+    )
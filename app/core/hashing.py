@@ -0,0 +1,168 @@
+# app/core/hashing.py
+"""
+Hash e verificação de senhas (bcrypt) num pool de processos dedicado.
+
+O bcrypt consome centenas de milissegundos de CPU por chamada. Executado na
+própria requisição, ocupa as threads do pool compartilhado do servidor e, num
+pico de logins (abertura de sessão plenária), trava os demais endpoints.
+
+Aqui as chamadas vão para um ProcessPoolExecutor com HASH_WORKERS processos
+(padrão: número de núcleos) e uma fila limitada a HASH_QUEUE_SIZE pedidos
+aguardando. Com o pool cheio, a requisição falha na hora com 503 e
+Retry-After, em vez de se acumular. HASH_WORKERS=0 executa na própria
+thread (desenvolvimento).
+
+Este módulo é importado pelos processos do pool: deve continuar leve
+(sem banco nem rotas). Os processos são criados com "spawn": scripts que
+criam usuários importando a aplicação precisam do `if __name__ == "__main__"`
+(ou de HASH_WORKERS=0).
+"""
+import asyncio
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing import get_context
+from typing import Callable, Optional
+
+from fastapi import HTTPException, status
+from passlib.context import CryptContext
+
+from app.core.config import settings
+
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+
+# ------------------- Funções executadas nos processos do pool -------------------
+
+def _hash(password: str) -> str:
+    return pwd_context.hash(password)
+
+def _verify(plain_password: str, hashed_password: str) -> bool:
+    return pwd_context.verify(plain_password, hashed_password)
+
+
+# ------------------- Métricas -------------------
+
+class HashingMetrics:
+    """Latência (da chegada ao resultado) das últimas chamadas e contadores."""
+    def __init__(self, janela: int = 1000):
+        self._latencias: deque[float] = deque(maxlen=janela)
+        self._lock = threading.Lock()
+        self.completed = 0
+        self.rejected = 0
+        self.in_flight = 0
+
+    def start(self) -> None:
+        with self._lock:
+            self.in_flight += 1
+
+    def finish(self, segundos: float) -> None:
+        with self._lock:
+            self.in_flight -= 1
+            self.completed += 1
+            self._latencias.append(segundos)
+
+    def reject(self) -> None:
+        with self._lock:
+            self.rejected += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            latencias = sorted(self._latencias)
+            completed, rejected, in_flight = self.completed, self.rejected, self.in_flight
+
+        def percentil(p: float) -> Optional[float]:
+            if not latencias:
+                return None
+            return round(latencias[min(len(latencias) - 1, int(len(latencias) * p))] * 1000, 2)
+
+        return {
+            "in_flight": in_flight,
+            "completed": completed,
+            "rejected": rejected,
+            "latency_ms": {"p50": percentil(0.5), "p95": percentil(0.95), "p99": percentil(0.99)},
+        }
+
+
+# ------------------- Executor -------------------
+
+class HashingExecutor:
+    def __init__(self, workers: int, queue_size: int):
+        self.workers = workers
+        # Em execução + aguardando; acima disso a chamada é recusada
+        self.capacity = max(workers, 1) + queue_size
+        self._vagas = threading.BoundedSemaphore(self.capacity)
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+        self.metrics = HashingMetrics()
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        # Criado no primeiro uso, não na importação (nem nos processos filhos)
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    self._pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=get_context("spawn"))
+        return self._pool
+
+    def _reservar(self) -> float:
+        if not self._vagas.acquire(blocking=False):
+            self.metrics.reject()
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Servidor ocupado. Tente novamente em instantes.",
+                headers={"Retry-After": str(settings.HASH_RETRY_AFTER_SECONDS)},
+            )
+        self.metrics.start()
+        return time.perf_counter()
+
+    def _liberar(self, inicio: float) -> None:
+        self._vagas.release()
+        self.metrics.finish(time.perf_counter() - inicio)
+
+    def submit(self, fn: Callable, *args) -> Future:
+        """Agenda a chamada no pool (503 se estiver cheio)."""
+        inicio = self._reservar()
+        if self.workers == 0:
+            future: Future = Future()
+            try:
+                future.set_result(fn(*args))
+            except Exception as e:
+                future.set_exception(e)
+        else:
+            try:
+                future = self._get_pool().submit(fn, *args)
+            except Exception:
+                self._liberar(inicio)
+                raise
+        future.add_done_callback(lambda _: self._liberar(inicio))
+        return future
+
+    def stats(self) -> dict:
+        return {"workers": self.workers, "capacity": self.capacity, **self.metrics.stats()}
+
+
+_executor = HashingExecutor(
+    workers=settings.HASH_WORKERS if settings.HASH_WORKERS is not None else (os.cpu_count() or 1),
+    queue_size=settings.HASH_QUEUE_SIZE,
+)
+
+
+# ------------------- API -------------------
+
+def hash_password(password: str) -> str:
+    return _executor.submit(_hash, password).result()
+
+def verify_password(plain_password: str, hashed_password: str) -> bool:
+    return _executor.submit(_verify, plain_password, hashed_password).result()
+
+async def hash_password_async(password: str) -> str:
+    """Versão para rotas assíncronas: aguarda o pool sem ocupar thread."""
+    return await asyncio.wrap_future(_executor.submit(_hash, password))
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await asyncio.wrap_future(_executor.submit(_verify, plain_password, hashed_password))
+
+def hashing_stats() -> dict:
+    return _executor.stats()
@@ -0,0 +1,170 @@
+# app/core/permissions.py
+"""
+Permissões dos usuários nas câmaras, compiladas em máscara de bits.
+
+CamaraUsuario.permissao guarda a lista de nomes em JSON (é o que a API
+recebe e devolve). Ao gravar a associação, a lista também é compilada em
+CamaraUsuario.permissao_mask: cada nome tem um bit fixo, dado pelo catálogo
+da tabela `permissao` (bit = id - 1), e nomes novos são registrados na hora.
+
+A máscara vai nas claims do token (papel e máscara por câmara, ver
+app/core/security.py), de modo que `require_permission` verifica uma
+permissão com um AND de bits, sem consultar o banco nem decodificar JSON.
+Alterar a associação revoga os tokens emitidos antes (token_version).
+
+A máscara é um BIGINT com sinal: o catálogo comporta até 63 nomes.
+"""
+import threading
+import time
+from typing import Iterable, Optional
+
+from fastapi import Depends, HTTPException, Request, status
+from sqlalchemy import insert, select
+from sqlalchemy.exc import IntegrityError
+
+from app.core.config import settings
+from app.core.security import get_current_principal, get_current_principal_async
+from app.db.database import SessionLocal
+from app.models.permissao_model import Permissao
+from app.schemas.token_schema import Principal
+
+MAX_PERMISSOES = 63
+
+
+class PermissionRegistry:
+    """
+    Cópia em memória do catálogo `nome -> bit`. Nomes desconhecidos fazem
+    reler o catálogo (no máximo uma vez a cada TOKEN_VERSION_TTL_SECONDS na
+    verificação; sempre na compilação, que é uma escrita).
+
+    O catálogo é lido e gravado numa sessão própria, no primário, e cada
+    registro é confirmado na hora: um nome registrado por uma requisição que
+    depois falhou só ocupa um bit sem uso.
+    """
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._bits: dict[str, int] = {}
+        self._expira_em = 0.0
+        self._lock = threading.Lock()
+
+    def _reload(self) -> None:
+        with SessionLocal() as db:
+            linhas = db.execute(select(Permissao.id, Permissao.nome)).all()
+        with self._lock:
+            self._bits = {nome: id - 1 for id, nome in linhas}
+            self._expira_em = time.monotonic() + self.ttl
+
+    def _register(self, nomes: Iterable[str]) -> None:
+        with SessionLocal() as db:
+            for nome in nomes:
+                try:
+                    db.execute(insert(Permissao).values(nome=nome))
+                    db.commit()
+                except IntegrityError:
+                    # Registrado ao mesmo tempo por outra requisição
+                    db.rollback()
+
+    def bit(self, nome: str) -> Optional[int]:
+        """Bit de uma permissão (None se o nome ainda não foi usado em nenhuma associação)."""
+        if nome not in self._bits and time.monotonic() >= self._expira_em:
+            self._reload()
+        return self._bits.get(nome)
+
+    def compile(self, nomes: Iterable[str]) -> int:
+        """Máscara de uma lista de permissões, registrando os nomes novos."""
+        nomes = list(dict.fromkeys(nomes))
+        if any(nome not in self._bits for nome in nomes):
+            self._reload()
+            novos = [nome for nome in nomes if nome not in self._bits]
+            if novos:
+                self._register(novos)
+                self._reload()
+
+        mask = 0
+        for nome in nomes:
+            bit = self._bits[nome]
+            if bit >= MAX_PERMISSOES:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Limite de {MAX_PERMISSOES} permissões distintas atingido ('{nome}').",
+                )
+            mask |= 1 << bit
+        return mask
+
+    def clear(self) -> None:
+        with self._lock:
+            self._bits.clear()
+            self._expira_em = 0.0
+
+
+permission_registry = PermissionRegistry(settings.TOKEN_VERSION_TTL_SECONDS)
+
+
+def _camara_id(request: Request) -> Optional[int]:
+    valor = request.path_params.get("camara_id") or request.query_params.get("camara_id")
+    try:
+        return int(valor) if valor is not None else None
+    except ValueError:
+        return None
+
+
+def has_permission(principal: Principal, mask: int, camara_id: Optional[int] = None) -> bool:
+    """
+    Verifica se o usuário tem todas as permissões da máscara na câmara
+    informada ou, sem câmara, em alguma das suas câmaras. Superusuários têm
+    todas.
+    """
+    if principal.is_superuser:
+        return True
+    if camara_id is not None:
+        claims = principal.camaras.get(camara_id)
+        return claims is not None and claims.permissao_mask & mask == mask
+    return any(claims.permissao_mask & mask == mask for claims in principal.camaras.values())
+
+
+def _checker(nomes: tuple[str, ...]):
+    mascara: Optional[int] = None
+
+    def check(principal: Principal, request: Request) -> Principal:
+        nonlocal mascara
+        if principal.is_superuser:
+            return principal
+        if mascara is None:
+            bits = [permission_registry.bit(nome) for nome in nomes]
+            # Permissão que ninguém recebeu ainda: só superusuários passam
+            if None in bits:
+                raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Permissão insuficiente.")
+            mascara = sum(1 << bit for bit in set(bits))
+        if not has_permission(principal, mascara, _camara_id(request)):
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Permissão insuficiente.")
+        return principal
+
+    return check
+
+
+def require_permission(*nomes: str):
+    """
+    Dependência que exige as permissões `nomes` (todas) do usuário autenticado.
+    A câmara é o parâmetro `camara_id` da rota ou da query string; sem ele,
+    basta ter as permissões em alguma câmara. Devolve o Principal:
+
+        @router.delete("/{id}")
+        def remove(..., current_user: Principal = Depends(require_permission("usuarios"))):
+    """
+    check = _checker(nomes)
+
+    # Síncrona de propósito: se precisar reler o catálogo, roda no threadpool
+    def dependency(request: Request, principal: Principal = Depends(get_current_principal)) -> Principal:
+        return check(principal, request)
+
+    return dependency
+
+
+def require_permission_async(*nomes: str):
+    """Equivalente a require_permission para as rotas do modo DB_ASYNC."""
+    check = _checker(nomes)
+
+    def dependency(request: Request, principal: Principal = Depends(get_current_principal_async)) -> Principal:
+        return check(principal, request)
+
+    return dependency
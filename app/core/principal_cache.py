@@ -0,0 +1,16 @@
+# app/core/principal_cache.py
+"""
+Cache em memória dos usuários autenticados (principal), por processo.
+
+Sem ele, toda requisição autenticada faz um SELECT do usuário pelo e-mail
+do token antes de qualquer outro trabalho. As entradas expiram após
+AUTH_CACHE_TTL_SECONDS e as menos usadas saem quando o cache enche (LRU).
+
+O usuário é guardado desanexado da sessão (somente leitura). Alterações
+no usuário (UsuarioService.update_usuario) invalidam a entrada na hora e de
+novo após o commit (app/core/cache.py).
+"""
+from app.core.cache import MemoryCache
+from app.core.config import settings
+
+principal_cache = MemoryCache(settings.AUTH_CACHE_MAXSIZE, settings.AUTH_CACHE_TTL_SECONDS, "principal")
@@ -1,26 +1,24 @@
 # app/core/security.py
 from datetime import datetime, timedelta, timezone
-from passlib.context import CryptContext
 from jose import JWTError, jwt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 
 from app.core.config import settings
-from app.schemas.token_schema import TokenData
-from app.db.database import get_db
+from app.core.principal_cache import principal_cache
+from app.core.token_version import token_versions
+from app.schemas.token_schema import Principal
+from app.db.database import get_db, get_async_db
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 # ATUALIZADO: Importa o novo repositório
 from app.repositories.usuario_repository import UsuarioRepository 
+from app.services.async_service import run_service
 
 # ------------------- Configuração de Senhas -------------------
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
-
-def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+# O bcrypt roda no pool de processos de app/core/hashing.py
+from app.core.hashing import verify_password, verify_password_async, hash_password as get_password_hash
 
 
 # ------------------- Configuração do JWT -------------------
@@ -34,28 +32,114 @@ def create_access_token(data: dict):
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
 
-# Função de dependência para obter o usuário logado
-def get_current_user(
-    token: str = Depends(oauth2_scheme), 
-    db: Session = Depends(get_db)
-):
-    credentials_exception = HTTPException(
+def create_user_access_token(usuario, camaras: dict) -> str:
+    """
+    Access token com as claims do usuário: id (`uid`), superusuário (`su`),
+    papel e máscara de permissões em cada câmara ativa (`cam`, montado por
+    AuthService.get_session_bootstrap) e versão (`ver`). A autorização das
+    requisições usa só essas claims (ver get_current_principal).
+    """
+    return create_access_token(data={
+        "sub": usuario.email,
+        "uid": usuario.id,
+        "su": bool(usuario.is_superuser),
+        "cam": camaras,
+        "ver": usuario.token_version or 0,
+    })
+
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Não foi possível validar as credenciais",
         headers={"WWW-Authenticate": "Bearer"},
     )
+
+def _decode_token(token: str) -> Principal:
+    """
+    Decodifica o JWT e monta o usuário a partir das claims. Tokens sem as
+    claims (emitidos antes delas) são recusados: basta um novo login.
+    """
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
         email: str = payload.get("sub")
-        if email is None:
-            raise credentials_exception
-        token_data = TokenData(email=email)
-    except JWTError:
-        raise credentials_exception
-    
+        usuario_id = payload.get("uid")
+        versao = payload.get("ver")
+        if email is None or usuario_id is None or versao is None:
+            raise _credentials_exception()
+        return Principal(
+            id=usuario_id,
+            email=email,
+            is_superuser=payload.get("su", False),
+            camaras={
+                int(camara_id): {"papel": papel, "permissao_mask": mask}
+                for camara_id, (papel, mask) in payload.get("cam", {}).items()
+            },
+            token_version=versao,
+        )
+    except (JWTError, ValueError, TypeError):
+        raise _credentials_exception()
+
+def _check_version(principal: Principal) -> Principal:
+    if not token_versions.is_current(principal.id, principal.token_version):
+        raise _credentials_exception()
+    return principal
+
+def _cached_principal(email: str):
+    return principal_cache.get(email) if principal_cache.enabled else None
+
+def _load_principal(db: Session, email: str):
+    """
+    Busca o usuário do token no banco e o guarda no cache. Ele é desanexado
+    da sessão antes: a requisição corrente pode alterar o próprio usuário sem
+    afetar a cópia do cache.
+    """
     # ATUALIZADO: Busca o usuário com o novo repositório
     user_repo = UsuarioRepository(db)
-    user = user_repo.get_by_email(email=token_data.email)
+    user = user_repo.get_by_email(email=email)
+    if user is not None and principal_cache.enabled:
+        db.expunge(user)
+        principal_cache.set(email, user)
+    return user
+
+# Dependência das rotas que só precisam saber quem é o usuário e o que ele
+# pode fazer: resolvida pelas claims do token, sem consultar o banco (o mapa
+# de versões é relido a cada TOKEN_VERSION_TTL_SECONDS, não por requisição)
+def get_current_principal(
+    token: str = Depends(oauth2_scheme),
+    db: Session = Depends(get_db)
+) -> Principal:
+    principal = _decode_token(token)
+    if token_versions.stale:
+        token_versions.refresh(db)
+    return _check_version(principal)
+
+async def get_current_principal_async(
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_async_db)
+) -> Principal:
+    principal = _decode_token(token)
+    if token_versions.stale:
+        await run_service(db, token_versions.refresh)
+    return _check_version(principal)
+
+# Função de dependência para obter o usuário logado (objeto completo do banco)
+def get_current_user(
+    principal: Principal = Depends(get_current_principal),
+    db: Session = Depends(get_db)
+):
+    user = _cached_principal(principal.email) or _load_principal(db, principal.email)
+    if user is None:
+        raise _credentials_exception()
+    return user
+
+# Versão assíncrona da dependência, usada pelas rotas do modo DB_ASYNC
+async def get_current_user_async(
+    principal: Principal = Depends(get_current_principal_async),
+    db: AsyncSession = Depends(get_async_db)
+):
+    user = _cached_principal(principal.email)
+    if user is None:
+        user = await run_service(db, lambda session: _load_principal(session, principal.email))
     if user is None:
-        raise credentials_exception
+        raise _credentials_exception()
     return user
\ No newline at end of file
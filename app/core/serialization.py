@@ -0,0 +1,69 @@
+# app/core/serialization.py
+"""
+Serialização das respostas direto para bytes JSON.
+
+Numa rota com response_model, o FastAPI valida o retorno contra o schema
+(`from_attributes`) e só então serializa. Nas listagens grandes a validação
+é a maior parte do custo (EmailStr, validadores, um objeto por linha), e os
+dados vêm do próprio banco. Aqui:
+
+- `get_adapter`: um TypeAdapter por tipo, criado uma vez e reaproveitado;
+- `construct`: monta o schema a partir dos atributos do objeto ORM sem
+  validação (`model_construct`), como a Projection confiável
+  (app/db/projection.py); booleanos expostos como int são convertidos;
+- `JSONBytesResponse`: resposta padrão da aplicação (app/main.py). Bytes
+  passam direto; o resto é serializado por `pydantic_core.to_json`, sem o
+  `json.dumps` da biblioteca padrão.
+
+As rotas com response_model continuam no caminho do FastAPI, que já
+serializa com `dump_json` (a resposta padrão é registrada com `Default` para
+não desligá-lo).
+"""
+from functools import lru_cache
+from typing import Any, Iterable, Optional
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import to_json
+
+from app.db.projection import _schema_aninhado
+
+
+@lru_cache(maxsize=None)
+def get_adapter(tipo: Any) -> TypeAdapter:
+    """Mantém um TypeAdapter por tipo, evitando reconstruí-lo a cada requisição."""
+    return TypeAdapter(tipo)
+
+
+@lru_cache(maxsize=None)
+def _plano(schema: type[BaseModel]) -> tuple[tuple[str, Optional[type[BaseModel]], bool], ...]:
+    """(campo, schema aninhado, int) de cada campo do schema."""
+    return tuple(
+        (nome, _schema_aninhado(field.annotation), field.annotation is int)
+        for nome, field in schema.model_fields.items()
+    )
+
+
+def construct(schema: type[BaseModel], obj: Any, excluir: Iterable[str] = ()) -> BaseModel:
+    """
+    Schema montado dos atributos de `obj` (e dos relacionamentos aninhados),
+    sem validação. Os campos em `excluir` não são lidos (nem serializáveis).
+    """
+    dados = {}
+    for nome, sub, inteiro in _plano(schema):
+        if nome in excluir:
+            continue
+        valor = getattr(obj, nome)
+        if sub is not None and valor is not None:
+            valor = construct(sub, valor)
+        elif inteiro and valor.__class__ is bool:
+            valor = int(valor)
+        dados[nome] = valor
+    return schema.model_construct(**dados)
+
+
+class JSONBytesResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return to_json(content)
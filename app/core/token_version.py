@@ -0,0 +1,81 @@
+# app/core/token_version.py
+"""
+Versão dos tokens de cada usuário, para revogar access tokens.
+
+O token leva a versão do usuário no momento do login (claim `ver`). Mudanças
+que alteram o acesso (desativar o usuário, trocar senha ou superusuário,
+alterar ou remover uma associação com câmara) incrementam
+`usuario.token_version`, e tokens com versão anterior deixam de valer.
+
+A verificação é feita num mapa em memória `usuario_id -> versão`, sem
+consulta por requisição. O mapa é relido do banco (só usuários com versão
+> 0) a cada TOKEN_VERSION_TTL_SECONDS, para que uma revogação feita em
+outro processo valha aqui também; no processo que revogou ela vale após o
+commit. As versões do mapa nunca diminuem (uma réplica atrasada não desfaz
+uma revogação já vista).
+"""
+import threading
+import time
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.repositories.usuario_repository import UsuarioRepository
+
+
+class TokenVersions:
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._versoes: dict[int, int] = {}
+        self._expira_em = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def stale(self) -> bool:
+        return time.monotonic() >= self._expira_em
+
+    def refresh(self, db: Session) -> None:
+        """Relê as versões do banco (uma consulta para todos os usuários)."""
+        versoes = UsuarioRepository(db).get_token_versions()
+        with self._lock:
+            for usuario_id, versao in versoes.items():
+                if versao > self._versoes.get(usuario_id, 0):
+                    self._versoes[usuario_id] = versao
+            self._expira_em = time.monotonic() + self.ttl
+
+    def is_current(self, usuario_id: int, versao: int) -> bool:
+        return versao >= self._versoes.get(usuario_id, 0)
+
+    def set(self, usuario_id: int, versao: int) -> None:
+        with self._lock:
+            if versao > self._versoes.get(usuario_id, 0):
+                self._versoes[usuario_id] = versao
+
+    def bump_on_commit(self, db: Session, usuario_id: int) -> None:
+        """
+        Incrementa a versão do usuário na transação corrente; o mapa local é
+        atualizado quando ela for confirmada.
+        """
+        versao = UsuarioRepository(db).increment_token_version(usuario_id)
+        if versao is not None:
+            db.info.setdefault("versoes_de_token", {})[usuario_id] = versao
+
+    def clear(self) -> None:
+        with self._lock:
+            self._versoes.clear()
+            self._expira_em = 0.0
+
+
+token_versions = TokenVersions(settings.TOKEN_VERSION_TTL_SECONDS)
+
+
+@event.listens_for(Session, "after_commit")
+def _after_commit(session):
+    for usuario_id, versao in session.info.pop("versoes_de_token", {}).items():
+        token_versions.set(usuario_id, versao)
+
+
+@event.listens_for(Session, "after_rollback")
+def _after_rollback(session):
+    session.info.pop("versoes_de_token", None)
@@ -1,24 +1,203 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+import math
+import random
+import time
+from contextvars import ContextVar
+from typing import Optional
 
+from fastapi import Request
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core.cache import MemoryCache
 from app.core.config import settings # Importa as configurações
+from app.db.search import register_sqlite_functions
 
-# Cria a "engine" de conexão com o banco de dados
-engine = create_engine(
-    settings.SQLALCHEMY_DATABASE_URI,
+# Opções de pool compartilhadas pelo primário e pelas réplicas
+engine_options = dict(
     pool_pre_ping=True,      # Verifica se a conexão está ativa antes de cada uso
     pool_recycle=300,        # Recicla (fecha e reabre) conexões ociosas a cada 300s (5 minutos)
     pool_size=5,             # Número de conexões para manter no pool
     max_overflow=10          # Número de conexões extras que podem ser abertas
 )
 
+# Cria a "engine" de conexão com o banco de dados (primário)
+engine = create_engine(settings.SQLALCHEMY_DATABASE_URI, **engine_options)
+
+# Engines das réplicas de leitura (lista vazia quando não configuradas)
+replica_engines = [create_engine(url, **engine_options) for url in settings.SQLALCHEMY_REPLICA_URIS]
+
+
+def _sqlite_foreign_keys(engine) -> None:
+    """
+    O SQLite só verifica chaves estrangeiras com PRAGMA foreign_keys=ON, em
+    cada conexão. Os serviços dependem dessa verificação (app/db/integrity.py).
+    Registra também as funções da busca textual (app/db/search.py).
+    """
+    if engine.dialect.name == "sqlite":
+        @event.listens_for(engine, "connect")
+        def _ligar(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            cursor.execute("PRAGMA foreign_keys=ON")
+            cursor.close()
+            register_sqlite_functions(dbapi_connection)
+
+for _engine in (engine, *replica_engines):
+    _sqlite_foreign_keys(_engine)
+
+
+# ------------------- Roteamento primário/réplicas -------------------
+
+# Leitura das próprias escritas (read-after-write): por DB_REPLICA_LAG_SECONDS
+# depois de uma escrita, o cliente lê do primário, e não de uma réplica que
+# ainda não recebeu a escrita. A marca da escrita vai ao cliente num cookie
+# (ReadAfterWriteMiddleware), que ele devolve a qualquer processo/servidor,
+# e fica também na memória do processo que escreveu, para clientes que não
+# guardam cookies (nesse caso, só vale no mesmo processo).
+PRIMARY_COOKIE = "db_primario_ate"
+
+_escritas_recentes = MemoryCache(10000, settings.DB_REPLICA_LAG_SECONDS, "escritas_recentes")
+
+# Marca de escrita da requisição corrente, lida pelo ReadAfterWriteMiddleware
+_escrita_da_requisicao: ContextVar[Optional[dict]] = ContextVar("db_escrita_da_requisicao", default=None)
+
+def _client_key(request: Request) -> str:
+    """Identifica o cliente pelo token de acesso ou, na falta dele, pelo IP."""
+    return request.headers.get("authorization") or (request.client.host if request.client else "")
+
+def _registrar_escrita(chave: str) -> None:
+    _escritas_recentes.set(chave, True)
+    marca = _escrita_da_requisicao.get()
+    if marca is not None:
+        marca["escreveu"] = True
+
+def _escreveu_recentemente(request: Request) -> bool:
+    try:
+        if float(request.cookies.get(PRIMARY_COOKIE, 0)) > time.time():
+            return True
+    except ValueError:
+        pass
+    return _escritas_recentes.get(_client_key(request)) is not None
+
+def _is_read_only(request: Request) -> bool:
+    """Uma requisição só vai para as réplicas se for de leitura e o cliente não escreveu há pouco."""
+    return request.method in ("GET", "HEAD") and not _escreveu_recentemente(request)
+
+
+class ReadAfterWriteMiddleware:
+    """
+    Middleware ASGI que devolve o cookie PRIMARY_COOKIE nas respostas das
+    requisições que escreveram no banco: até o instante do cookie (e enquanto
+    ele durar), as leituras do cliente vão ao primário, em qualquer processo.
+    """
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        marca = {"escreveu": False}
+        token = _escrita_da_requisicao.set(marca)
+
+        async def send_with_cookie(message):
+            if message["type"] == "http.response.start" and marca["escreveu"]:
+                lag = settings.DB_REPLICA_LAG_SECONDS
+                cookie = (
+                    f"{PRIMARY_COOKIE}={time.time() + lag:.3f}; Max-Age={math.ceil(lag)}; "
+                    "Path=/; HttpOnly; SameSite=Lax"
+                )
+                message["headers"] = [*message.get("headers", []), (b"set-cookie", cookie.encode())]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_cookie)
+        finally:
+            _escrita_da_requisicao.reset(token)
+
+
+class RoutingSession(Session):
+    """
+    Sessão que direciona as consultas de requisições somente-leitura às réplicas.
+    Escritas, flushes e qualquer leitura feita depois de uma escrita na mesma
+    sessão continuam no primário.
+    """
+    primary_engine = engine
+    replica_engines = replica_engines
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if getattr(clause, "is_dml", False):
+            # INSERT/UPDATE/DELETE executados diretamente (sem passar pelo flush)
+            _marcar_escrita(self)
+            return self.primary_engine
+        if self.replica_engines and self.info.get("read_only") and not self.info.get("wrote") and not self._flushing:
+            return random.choice(self.replica_engines)
+        return self.primary_engine
+
+def _marcar_escrita(session: Session) -> None:
+    session.info["wrote"] = True
+    if "client_key" in session.info:
+        _registrar_escrita(session.info["client_key"])
+
+@event.listens_for(RoutingSession, "after_flush")
+def _after_flush(session, flush_context):
+    _marcar_escrita(session)
+
+
 # Cria uma classe SessionLocal que será usada para criar sessões com o banco
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# expire_on_commit=False: os objetos continuam carregados após o commit, e a
+# serialização da resposta não precisa relê-los do banco
+SessionLocal = sessionmaker(class_=RoutingSession, autocommit=False, autoflush=False, expire_on_commit=False)
 
 # Função de dependência para ser usada nas rotas da API
-def get_db():
+def get_db(request: Request):
     db = SessionLocal()
+    db.info["client_key"] = _client_key(request)
+    db.info["read_only"] = _is_read_only(request)
     try:
         yield db
+    except Exception:
+        # Desfaz qualquer escrita pendente; o commit é feito pelos serviços (@transactional)
+        db.rollback()
+        raise
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+# ------------------- Modo assíncrono -------------------
+# Só é criado quando DB_ASYNC=true, para não exigir os drivers assíncronos
+# (asyncpg, aiomysql, aiosqlite) em quem usa apenas o modo síncrono.
+
+async_engine = None
+AsyncSessionLocal = None
+
+if settings.DB_ASYNC:
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+    async_engine = create_async_engine(settings.SQLALCHEMY_ASYNC_DATABASE_URI, **engine_options)
+    async_replica_engines = [
+        create_async_engine(url, **engine_options) for url in settings.SQLALCHEMY_ASYNC_REPLICA_URIS
+    ]
+    for _engine in (async_engine, *async_replica_engines):
+        _sqlite_foreign_keys(_engine.sync_engine)
+
+    class AsyncRoutingSession(RoutingSession):
+        """Mesmo roteamento da RoutingSession, sobre as engines assíncronas."""
+        primary_engine = async_engine.sync_engine
+        replica_engines = [e.sync_engine for e in async_replica_engines]
+
+    # expire_on_commit=False evita recarregamentos implícitos (lazy I/O)
+    # depois do commit, que não são permitidos numa AsyncSession
+    AsyncSessionLocal = async_sessionmaker(
+        class_=AsyncSession, sync_session_class=AsyncRoutingSession,
+        autoflush=False, expire_on_commit=False
+    )
+
+# Função de dependência assíncrona, equivalente a get_db
+async def get_async_db(request: Request):
+    if AsyncSessionLocal is None:
+        raise RuntimeError("Modo assíncrono desabilitado. Defina DB_ASYNC=true no .env")
+    async with AsyncSessionLocal() as db:
+        db.info["client_key"] = _client_key(request)
+        db.info["read_only"] = _is_read_only(request)
+        yield db
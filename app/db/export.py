@@ -0,0 +1,90 @@
+# app/db/export.py
+"""
+Exportação das listagens em CSV ou NDJSON.
+
+Os itens vêm de `Projection.stream` (cursor no servidor) e são escritos na
+resposta em blocos, à medida que são lidos: nem a consulta nem a resposta
+ficam inteiras em memória.
+
+No CSV os campos aninhados viram colunas `<relação>.<campo>`; no NDJSON
+cada linha é o mesmo JSON do item da listagem.
+"""
+import csv
+import io
+from datetime import date, datetime
+from typing import Iterable, Iterator, Literal
+
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+from app.db.projection import _schema_aninhado
+
+ExportFormat = Literal["csv", "ndjson"]
+
+# Itens por bloco escrito na resposta
+EXPORT_CHUNK = 500
+
+MEDIA_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+}
+
+
+def _colunas(schema: type[BaseModel], prefixo: str = "") -> list[str]:
+    """Cabeçalho do CSV: campos e campos calculados, com os aninhados achatados."""
+    colunas = []
+    for nome, field in schema.model_fields.items():
+        sub = _schema_aninhado(field.annotation)
+        colunas.extend(_colunas(sub, f"{prefixo}{nome}.") if sub else [prefixo + nome])
+    colunas.extend(prefixo + nome for nome in schema.model_computed_fields)
+    return colunas
+
+
+def _achatar(dados: dict, prefixo: str, saida: dict) -> dict:
+    for nome, valor in dados.items():
+        if isinstance(valor, dict):
+            _achatar(valor, f"{prefixo}{nome}.", saida)
+        else:
+            saida[prefixo + nome] = valor.isoformat() if isinstance(valor, (date, datetime)) else valor
+    return saida
+
+
+def _csv(itens: Iterable[BaseModel], schema: type[BaseModel]) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=_colunas(schema), extrasaction="ignore")
+    # BOM para o Excel reconhecer o UTF-8 (acentos)
+    buffer.write("\ufeff")
+    writer.writeheader()
+    for n, item in enumerate(itens, 1):
+        writer.writerow(_achatar(item.model_dump(), "", {}))
+        if n % EXPORT_CHUNK == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+def _ndjson(itens: Iterable[BaseModel]) -> Iterator[str]:
+    bloco = []
+    for item in itens:
+        bloco.append(item.model_dump_json())
+        if len(bloco) == EXPORT_CHUNK:
+            yield "\n".join(bloco) + "\n"
+            bloco = []
+    if bloco:
+        yield "\n".join(bloco) + "\n"
+
+
+def export_response(
+    itens: Iterable[BaseModel],
+    schema: type[BaseModel],
+    formato: ExportFormat,
+    nome_arquivo: str
+) -> StreamingResponse:
+    """Resposta em streaming com os itens no formato pedido, como anexo."""
+    corpo = _csv(itens, schema) if formato == "csv" else _ndjson(itens)
+    return StreamingResponse(
+        corpo,
+        media_type=MEDIA_TYPES[formato],
+        headers={"Content-Disposition": f'attachment; filename="{nome_arquivo}.{formato}"'},
+    )
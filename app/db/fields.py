@@ -0,0 +1,188 @@
+# app/db/fields.py
+"""
+Seleção de campos nas listagens (sparse fieldsets).
+
+- `?fields=id,nome,camara.nome`: só os campos pedidos, inclusive de objetos
+  aninhados (`<relação>.<campo>`; a relação sozinha traz o objeto inteiro);
+- `?view=lean`: só os campos simples do item, sem objetos aninhados nem
+  campos calculados (pode ser combinado com `fields`, que acrescenta campos);
+- sem nenhum dos dois (ou `view=full`): o item completo, como antes.
+
+A seleção limita a consulta (Projection.only: só as colunas e os JOINs
+necessários) e a serialização (`include`). Os campos calculados, como as
+datas formatadas e o `ativo_desc`, só são calculados quando pedidos: numa
+página grande isso poupa um strftime por linha e por campo. O `id` vem
+sempre, inclusive nos objetos aninhados.
+
+Objetos relacionados repetidos (a mesma comissão em todos os membros, o
+mesmo mandato em todos os vereadores) podem vir uma vez só, como no JSON:API:
+
+- `?include=comissao,mandato_vereador.mandato`: as relações listadas saem
+  dos itens, que ficam só com a chave estrangeira (`comissao_id`), e vêm em
+  `included`, por caminho e por id:
+  `{"items": [...], "included": {"comissao": {"3": {...}}, ...}, ...}`.
+  `a.b` implica `a`; as relações não listadas continuam aninhadas.
+
+Com `fields`, os objetos em `included` também ficam só com os campos pedidos.
+"""
+from functools import lru_cache
+from typing import Any, List, Literal, NamedTuple, Optional
+
+from fastapi import HTTPException, status
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+from app.core.serialization import JSONBytesResponse, construct, get_adapter
+from app.db.pagination import Page
+from app.db.projection import _schema_aninhado
+
+ListView = Literal["full", "lean"]
+
+
+class FieldSelection(NamedTuple):
+    campos: frozenset[str]  # caminhos pedidos, para Projection.only
+    include: dict           # árvore no formato do `include` do Pydantic
+
+
+def _lista(texto: Optional[str]) -> set[str]:
+    return {c.strip() for c in (texto or "").split(",") if c.strip()}
+
+
+def _item_schema(response_model: type[BaseModel]) -> type[BaseModel]:
+    return _schema_aninhado(response_model.model_fields["items"].annotation)
+
+
+def _incluir(schema: type[BaseModel], arvore: dict, partes: list[str], caminho: str) -> None:
+    if "id" in schema.model_fields:
+        arvore["id"] = True
+
+    nome, resto = partes[0], partes[1:]
+    if nome in schema.model_computed_fields:
+        sub = None
+    elif nome in schema.model_fields:
+        sub = _schema_aninhado(schema.model_fields[nome].annotation)
+    else:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Campo desconhecido: '{caminho}'.")
+
+    if not resto:
+        arvore[nome] = True
+    elif sub is None:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Campo desconhecido: '{caminho}'.")
+    elif arvore.get(nome) is not True:
+        _incluir(sub, arvore.setdefault(nome, {}), resto, caminho)
+
+
+@lru_cache(maxsize=256)
+def select_fields(response_model: type[BaseModel], fields: Optional[str] = None, view: Optional[ListView] = None, include: Optional[str] = None) -> Optional[FieldSelection]:
+    """
+    Interpreta `fields`/`view` para os itens da resposta paginada
+    (`response_model.items`). Devolve None quando a listagem é a completa.
+    As relações de `include` (e suas chaves estrangeiras) entram na seleção.
+    """
+    schema = _item_schema(response_model)
+    caminhos = _lista(fields)
+    if view == "lean":
+        caminhos.update(
+            nome for nome, field in schema.model_fields.items()
+            if _schema_aninhado(field.annotation) is None
+        )
+    if not caminhos:
+        return None
+
+    for caminho in _lista(include):
+        if not any(c == caminho or c.startswith(caminho + ".") for c in caminhos):
+            caminhos.add(caminho)
+        caminhos.add(caminho + "_id")
+
+    include: dict = {}
+    for caminho in sorted(caminhos):
+        _incluir(schema, include, caminho.split("."), caminho)
+    return FieldSelection(frozenset(caminhos), include)
+
+
+@lru_cache(maxsize=256)
+def select_includes(response_model: type[BaseModel], include: Optional[str] = None) -> Optional[dict]:
+    """
+    Interpreta `include`: árvore `{relação: {sub-relação: {...}}}` das
+    relações a trazer em `included` (None sem `include`). Só valem relações
+    com chave estrangeira no item (`<relação>_id`).
+    """
+    arvore: dict = {}
+    for caminho in sorted(_lista(include)):
+        no, schema = arvore, _item_schema(response_model)
+        for nome in caminho.split("."):
+            field = schema.model_fields.get(nome)
+            sub = _schema_aninhado(field.annotation) if field else None
+            if sub is None or f"{nome}_id" not in schema.model_fields:
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Relação desconhecida em include: '{caminho}'.")
+            no, schema = no.setdefault(nome, {}), sub
+    return arvore or None
+
+
+def _side_load(objetos: list, schema: type[BaseModel], arvore: dict, included: dict, prefixo: str) -> list[BaseModel]:
+    """
+    Monta os schemas dos objetos sem as relações da árvore, que vão para
+    `included[<caminho>][id]`. Cada objeto relacionado é montado uma vez só.
+    """
+    modelos = [obj if isinstance(obj, BaseModel) else construct(schema, obj, excluir=arvore) for obj in objetos]
+    for nome, sub in arvore.items():
+        chave = prefixo + nome
+        mapa = included.setdefault(chave, {})
+        novos: dict[int, Any] = {}
+        for obj in objetos:
+            relacionado = getattr(obj, nome)
+            if relacionado is not None and relacionado.id not in mapa:
+                novos.setdefault(relacionado.id, relacionado)
+        sub_schema = _schema_aninhado(schema.model_fields[nome].annotation)
+        mapa.update(zip(novos, _side_load(list(novos.values()), sub_schema, sub, included, chave + ".")))
+    return modelos
+
+
+def _filtros(arvore: dict, selecao: Any, prefixo: str, exclude: dict, include: Optional[dict]) -> None:
+    """Filtros de serialização de cada mapa de `included`."""
+    for nome, sub in arvore.items():
+        chave = prefixo + nome
+        sub_selecao = True if selecao is True else selecao.get(nome, True)
+        if sub:
+            exclude[chave] = {"__all__": set(sub)}
+        if include is not None:
+            include[chave] = True if sub_selecao is True else {"__all__": sub_selecao}
+        _filtros(sub, sub_selecao, chave + ".", exclude, include)
+
+
+def page_response(page: Page, response_model: type[BaseModel], selecao: Optional[FieldSelection] = None, incluir: Optional[dict] = None) -> JSONBytesResponse:
+    """
+    Resposta da listagem, já serializada em JSON: os itens (schemas da
+    projeção ou instâncias ORM, montadas com `construct`) não passam pela
+    validação do response_model da rota. Com seleção de campos, só os campos
+    pedidos são serializados; com `incluir` (select_includes), as relações
+    vêm uma vez só em `included`.
+    """
+    schema = _item_schema(response_model)
+    if incluir:
+        included: dict = {}
+        items = _side_load(page.items, schema, incluir, included, "")
+        exclude: dict = {"items": {"__all__": set(incluir)}, "included": {}}
+        include = None
+        if selecao is not None:
+            include = {"items": {"__all__": selecao.include}, "included": {}, "total": True, "next_cursor": True}
+        _filtros(incluir, selecao.include if selecao else True, "", exclude["included"], include["included"] if include else None)
+        corpo = {"items": items, "included": included, "total": page.total, "next_cursor": page.next_cursor}
+        return JSONBytesResponse(to_json(corpo, include=include, exclude=exclude))
+
+    items = [item if isinstance(item, BaseModel) else construct(schema, item) for item in page.items]
+    resposta = response_model.model_construct(items=items, total=page.total, next_cursor=page.next_cursor)
+
+    include = None
+    if selecao is not None:
+        include = {"items": {"__all__": selecao.include}, "total": True, "next_cursor": True}
+    return JSONBytesResponse(get_adapter(response_model).dump_json(resposta, include=include))
+
+
+def list_response(itens: list, response_model: type[BaseModel], selecao: Optional[FieldSelection] = None) -> JSONBytesResponse:
+    """
+    Resposta de uma listagem sem paginação (lista JSON dos itens de
+    `response_model.items`), já serializada, com a seleção de campos.
+    """
+    include = {"__all__": selecao.include} if selecao is not None else None
+    return JSONBytesResponse(get_adapter(List[_item_schema(response_model)]).dump_json(itens, include=include))
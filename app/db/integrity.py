@@ -0,0 +1,170 @@
+# app/db/integrity.py
+"""
+Tradução das violações de integridade do banco em respostas HTTP.
+
+Em vez de consultar antes de inserir ("já existe um usuário com este
+e-mail?"), os serviços inserem direto e deixam as constraints decidirem: a
+verificação não custa uma consulta a mais e não tem condição de corrida.
+
+A violação (unique ou chave estrangeira) é identificada pela mensagem do
+banco, com a tabela e as colunas envolvidas, nos três dialetos:
+
+- PostgreSQL: nome da constraint e `Key (colunas)=(...)` do DETAIL;
+- MySQL: nome do índice (`Duplicate entry ... for key`) ou a cláusula
+  `FOREIGN KEY (...)` da constraint;
+- SQLite: `UNIQUE constraint failed: tabela.coluna`. Para chave estrangeira
+  o SQLite não informa qual foi: a resposta é genérica, a menos que o
+  serviço indique as referências a conferir (missing_reference_http_error).
+"""
+import re
+from typing import NamedTuple, Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.db.base import Base
+
+# Mensagens das violações de unicidade, por (tabela, colunas)
+UNIQUE_MESSAGES = {
+    ("usuario", ("email",)): "Um usuário com este e-mail já está cadastrado.",
+    ("vereador", ("email",)): "Um vereador com este e-mail ou CPF já está cadastrado.",
+    ("vereador", ("cpf",)): "Um vereador com este e-mail ou CPF já está cadastrado.",
+    ("camara_usuario", ("usuario_id", "camara_id")): "Este usuário já está associado a esta câmara.",
+    ("mandato_vereador", ("mandato_id", "vereador_id")): "Este vereador já está cadastrado neste mandato.",
+}
+
+# Violações de unicidade que são conflito com o estado atual (409), e não
+# registro repetido: ex. duas ativações simultâneas de mandatos da mesma
+# câmara (índice ux_mandato_camara_id_ativo, migração 0004)
+CONFLICT_MESSAGES = {
+    ("mandato", ("camara_id",)): "Já existe um mandato ativo para esta câmara.",
+}
+
+# Mensagens (404) de chave estrangeira inexistente, por (tabela, colunas)
+FOREIGN_KEY_MESSAGES = {
+    ("camara_usuario", ("usuario_id",)): "Usuário não encontrado",
+    ("camara_usuario", ("camara_id",)): "Câmara não encontrada",
+    ("camara_usuario", ("vereador_id",)): "Vereador não encontrado",
+    ("mandato", ("camara_id",)): "Câmara não encontrada",
+    ("mandato_vereador", ("mandato_id",)): "Mandato não encontrado",
+    ("mandato_vereador", ("vereador_id",)): "Vereador não encontrado",
+    ("comissao", ("camara_id",)): "Câmara não encontrada",
+    ("comissao_membro", ("comissao_id",)): "Comissão não encontrada",
+    ("comissao_membro", ("mandato_vereador_id",)): "Associação não encontrada",
+}
+
+
+class Violation(NamedTuple):
+    tipo: str  # "unique", "foreign_key" (referência inexistente) ou "referenced" (registro em uso)
+    tabela: Optional[str]
+    colunas: tuple[str, ...]
+
+
+def _colunas(texto: str) -> tuple[str, ...]:
+    return tuple(c.strip(' `"') for c in texto.split(","))
+
+
+def _por_nome(nome: str) -> tuple[Optional[str], tuple[str, ...]]:
+    """
+    Tabela e colunas de um índice/constraint único declarado nos modelos.
+    Índices funcionais informam as colunas em `info["colunas"]`.
+    """
+    nome = nome.rsplit(".", 1)[-1]  # MySQL 8 informa `tabela.indice`
+    for tabela in Base.metadata.tables.values():
+        for item in (*tabela.indexes, *tabela.constraints):
+            if item.name == nome:
+                return tabela.name, tuple(item.info.get("colunas", ())) or tuple(c.name for c in item.columns)
+    return None, ()
+
+
+def parse_integrity_error(exc: IntegrityError) -> Optional[Violation]:
+    """Identifica a violação a partir da mensagem do driver (None se não reconhecida)."""
+    mensagem = str(exc.orig)
+    instrucao = (exc.statement or "").lstrip().upper()
+
+    # ---- unicidade ----
+    if m := re.search(r"UNIQUE constraint failed: (.+)", mensagem):  # SQLite
+        pares = [c.strip().split(".", 1) for c in m.group(1).split(",")]
+        return Violation("unique", pares[0][0], tuple(p[-1] for p in pares))
+    if m := re.search(r"Duplicate entry .* for key '([^']+)'", mensagem):  # MySQL
+        return Violation("unique", *_por_nome(m.group(1)))
+    if m := re.search(r'unique constraint "([^"]+)"', mensagem):  # PostgreSQL
+        tabela, colunas = _por_nome(m.group(1))
+        if k := re.search(r"Key \(([^)]+)\)=", mensagem):
+            colunas = _colunas(k.group(1))
+        return Violation("unique", tabela, colunas)
+
+    # ---- chave estrangeira ----
+    if m := re.search(r'update or delete on table "([^"]+)" violates foreign key', mensagem):  # PostgreSQL
+        return Violation("referenced", m.group(1), ())
+    if m := re.search(r'on table "([^"]+)" violates foreign key', mensagem):  # PostgreSQL
+        k = re.search(r"Key \(([^)]+)\)=", mensagem)
+        return Violation("foreign_key", m.group(1), _colunas(k.group(1)) if k else ())
+    if "Cannot delete or update a parent row" in mensagem:  # MySQL 1451
+        return Violation("referenced", None, ())
+    if m := re.search(r"\.`([^`]+)`, CONSTRAINT `[^`]+` FOREIGN KEY \(([^)]+)\)", mensagem):  # MySQL 1452
+        return Violation("foreign_key", m.group(1), _colunas(m.group(2)))
+    if "FOREIGN KEY constraint failed" in mensagem:  # SQLite
+        return Violation("referenced" if instrucao.startswith("DELETE") else "foreign_key", None, ())
+
+    return None
+
+
+def integrity_http_error(exc: IntegrityError, mensagens: Optional[dict] = None) -> Optional[HTTPException]:
+    """
+    Converte a violação na HTTPException correspondente: 400 para unicidade e
+    registro em uso, 409 para conflito (CONFLICT_MESSAGES), 404 para
+    referência inexistente. `mensagens` sobrepõe as
+    mensagens padrão para um caso específico (mesma chave (tabela, colunas)).
+    Devolve None para violações não reconhecidas.
+    """
+    violacao = parse_integrity_error(exc)
+    if violacao is None:
+        return None
+
+    chave = (violacao.tabela, violacao.colunas)
+    conflito = violacao.tipo == "unique" and chave in CONFLICT_MESSAGES
+    if mensagens and chave in mensagens:
+        detalhe = mensagens[chave]
+    elif conflito:
+        detalhe = CONFLICT_MESSAGES[chave]
+    elif violacao.tipo == "unique":
+        detalhe = UNIQUE_MESSAGES.get(chave, "Registro já cadastrado.")
+    elif violacao.tipo == "foreign_key":
+        detalhe = FOREIGN_KEY_MESSAGES.get(chave, "Registro relacionado não encontrado.")
+    else:
+        detalhe = "O registro está em uso e não pode ser removido."
+
+    if conflito:
+        codigo = status.HTTP_409_CONFLICT
+    elif violacao.tipo == "foreign_key":
+        codigo = status.HTTP_404_NOT_FOUND
+    else:
+        codigo = status.HTTP_400_BAD_REQUEST
+    return HTTPException(status_code=codigo, detail=detalhe)
+
+
+def missing_reference_http_error(db: Session, exc: IntegrityError, referencias: dict) -> Optional[HTTPException]:
+    """
+    404 com a mensagem do serviço para a referência inexistente.
+    `referencias` mapeia (tabela, colunas) -> (modelo referenciado, id,
+    mensagem). Quando o banco não informa qual chave falhou (SQLite), cada id
+    é procurado, depois de desfazer a transação (que não aceita mais comandos
+    após o erro). Só é consultado no caminho da falha. Devolve None se a
+    violação não for de uma dessas referências.
+    """
+    violacao = parse_integrity_error(exc)
+    if violacao is None or violacao.tipo != "foreign_key":
+        return None
+    chave = (violacao.tabela, violacao.colunas)
+    if chave in referencias:
+        return HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=referencias[chave][2])
+    if violacao.tabela is not None:
+        return None
+
+    db.rollback()
+    for modelo, id, mensagem in referencias.values():
+        if id is not None and db.get(modelo, id) is None:
+            return HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=mensagem)
+    return None
@@ -0,0 +1,61 @@
+# app/db/metrics.py
+import logging
+from contextvars import ContextVar
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+# Contadores da requisição corrente: {"statements": int, "commits": int}
+_request_counters: ContextVar[Optional[dict]] = ContextVar("db_request_counters", default=None)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _count_statement(conn, cursor, statement, parameters, context, executemany):
+    counters = _request_counters.get()
+    if counters is not None:
+        counters["statements"] += 1
+
+
+@event.listens_for(Engine, "commit")
+def _count_commit(conn):
+    counters = _request_counters.get()
+    if counters is not None:
+        counters["commits"] += 1
+
+
+class DBMetricsMiddleware:
+    """
+    Middleware ASGI que mede, por requisição, quantos comandos SQL (round trips)
+    e quantos commits foram executados. Os valores são devolvidos nos cabeçalhos
+    X-DB-Statements e X-DB-Commits e registrados no log em nível DEBUG.
+    """
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        counters = {"statements": 0, "commits": 0}
+        token = _request_counters.set(counters)
+
+        async def send_with_metrics(message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((b"x-db-statements", str(counters["statements"]).encode()))
+                headers.append((b"x-db-commits", str(counters["commits"]).encode()))
+                message["headers"] = headers
+                logger.debug(
+                    "%s %s: %d comandos SQL, %d commits",
+                    scope["method"], scope["path"], counters["statements"], counters["commits"]
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_metrics)
+        finally:
+            _request_counters.reset(token)
@@ -0,0 +1,148 @@
+# app/db/pagination.py
+"""
+Paginação das listagens.
+
+Além do `skip`/`limit` tradicional, aceita um `cursor` opaco (keyset): a
+página seguinte é buscada com `id > último id`, usando o índice da chave
+primária, e o tempo de resposta não cresce com a profundidade da página.
+
+- `cursor` ausente: paginação por offset, como antes;
+- `cursor` vazio (`?cursor=`): primeira página por cursor;
+- `cursor` recebido em `next_cursor`: página seguinte.
+
+Com cursor a ordem é sempre pelo id; a ordenação por relevância da busca
+textual só vale na paginação por offset.
+
+O total vem na mesma consulta da página, como uma subconsulta escalar
+`(SELECT count(*) ...)` que o banco avalia uma única vez. `count(*) OVER ()`
+obrigaria a materializar todas as linhas filtradas (com todas as colunas)
+antes do LIMIT. O total também pode ser omitido (`include_total=false`) ou
+estimado pelo planejador do banco (`estimate=true`), útil em tabelas grandes.
+"""
+import base64
+import binascii
+import json
+from typing import Any, NamedTuple, Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy import func, select
+from sqlalchemy.orm import Query
+
+from app.db.projection import Projection
+
+# Abaixo disso a estimativa do planejador não compensa: faz a contagem exata
+ESTIMATE_MIN_ROWS = 1000
+
+
+class Page(NamedTuple):
+    items: list[Any]
+    total: Optional[int]
+    next_cursor: Optional[str]
+
+
+def encode_cursor(ultimo_id: int) -> str:
+    return base64.urlsafe_b64encode(json.dumps({"id": ultimo_id}).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Optional[int]:
+    """Devolve o último id visto (None para o início da listagem)."""
+    if not cursor:
+        return None
+    try:
+        dados = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        return int(dados["id"])
+    except (binascii.Error, ValueError, TypeError, KeyError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Cursor de paginação inválido.")
+
+
+def _count(query: Query) -> int:
+    return query.order_by(None).count()
+
+
+def _estimate(query: Query) -> int:
+    """
+    Número de linhas estimado pelo planejador (EXPLAIN), sem executar a
+    contagem. Bancos sem estimativa utilizável (SQLite) fazem a contagem exata.
+    """
+    session = query.session
+    dialect = session.get_bind().dialect
+    if dialect.name not in ("postgresql", "mysql"):
+        return _count(query)
+
+    compiled = query.order_by(None).statement.compile(dialect=dialect)
+    params = tuple(compiled.params[k] for k in compiled.positiontup) if compiled.positional else compiled.params
+    conn = session.connection()
+
+    if dialect.name == "postgresql":
+        plano = conn.exec_driver_sql("EXPLAIN (FORMAT JSON) " + str(compiled), params).scalar()
+        if isinstance(plano, str):
+            plano = json.loads(plano)
+        estimativa = int(plano[0]["Plan"]["Plan Rows"])
+    else:
+        # Linha da tabela principal: linhas lidas x % que passa pelo WHERE
+        linha = conn.exec_driver_sql("EXPLAIN " + str(compiled), params).mappings().first()
+        estimativa = int((linha["rows"] or 0) * float(linha.get("filtered") or 100) / 100)
+
+    return estimativa if estimativa >= ESTIMATE_MIN_ROWS else _count(query)
+
+
+def paginate(
+    query: Query,
+    id_column,
+    *,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    por_relevancia: bool = False,
+    include_total: bool = True,
+    estimate: bool = False,
+    projecao: Optional[Projection] = None
+) -> Page:
+    """
+    Aplica a paginação à consulta e calcula o total. `por_relevancia` indica
+    que a consulta já vem ordenada pela busca textual (nesse caso não há
+    `next_cursor`). Com `projecao`, os itens são schemas montados direto das
+    colunas (ver app/db/projection.py), e não instâncias ORM.
+    """
+    base = query
+    if cursor is not None:
+        ultimo_id = decode_cursor(cursor)
+        if ultimo_id is not None:
+            query = query.filter(id_column > ultimo_id)
+        skip = 0
+
+    if projecao is not None:
+        query = projecao.apply(query)
+
+    # O id é a chave estável da ordenação (e o desempate da relevância)
+    query = query.order_by(id_column).offset(skip).limit(limit + 1)
+
+    # Contagem na mesma consulta, sobre o filtro original (sem o id > x do cursor)
+    na_consulta = include_total and not estimate
+    if na_consulta:
+        contagem = select(func.count()).select_from(
+            base.order_by(None).with_entities(id_column).subquery()
+        ).scalar_subquery()
+        rows = query.add_columns(contagem).all()
+        items = projecao.build_all(rows) if projecao else [row[0] for row in rows]
+    else:
+        rows = query.all()
+        items = projecao.build_all(rows) if projecao else rows
+
+    # Busca um registro a mais só para saber se existe próxima página
+    next_cursor = None
+    if limit > 0 and len(items) > limit and (cursor is not None or not por_relevancia):
+        next_cursor = encode_cursor(getattr(items[limit - 1], id_column.key))
+
+    total = None
+    if na_consulta:
+        # Página além do fim não traz linhas (nem o total): conta à parte. Só a
+        # primeira página vazia, com limit positivo, prova que não há registros
+        if rows:
+            total = rows[0][-1]
+        else:
+            total = 0 if skip == 0 and not cursor and limit > 0 else _count(base)
+    elif include_total:
+        total = _estimate(base) if estimate else _count(base)
+
+    return Page(items[:limit], total, next_cursor)
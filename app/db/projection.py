@@ -0,0 +1,165 @@
+# app/db/projection.py
+"""
+Leitura por projeção para listagens grandes.
+
+Em vez de montar instâncias ORM (identity map, rastreamento de estado) e
+depois deixar o Pydantic relê-las com `from_attributes`, a consulta passa a
+selecionar só as colunas que o schema de resposta usa, e os schemas são
+montados direto das linhas.
+
+Relacionamentos aninhados no schema (ex.: `MandatoVereadorPublic.vereador`)
+viram LEFT JOINs com aliases, com as colunas prefixadas por `<relação>__`.
+
+Com `confiavel=True` (padrão) a validação é pulada (`model_construct`): os
+dados vêm do próprio banco, já com os tipos das colunas.
+
+`only` restringe a projeção a alguns campos (`?fields=`, ver
+app/db/fields.py): só essas colunas e os JOINs das relações pedidas.
+
+`version` agrega a versão dos dados de uma listagem (ETag, ver
+app/core/etag.py), com os mesmos JOINs, sem ler as linhas.
+"""
+import copy
+import typing
+from functools import lru_cache
+from typing import Any, Iterable, Iterator, Optional
+
+from pydantic import BaseModel
+from sqlalchemy import Boolean, Integer, cast, func, inspect
+from sqlalchemy.orm import Query, aliased
+
+
+def _schema_aninhado(annotation) -> Optional[type[BaseModel]]:
+    """Devolve o schema de um campo aninhado (`X` ou `Optional[X]`)."""
+    for tipo in (annotation, *typing.get_args(annotation)):
+        if isinstance(tipo, type) and issubclass(tipo, BaseModel):
+            return tipo
+    return None
+
+
+def _dependencias(schema: type[BaseModel], nome: str) -> Iterable[str]:
+    """
+    Campos de que um campo calculado depende, pela convenção dos schemas:
+    `<campo>_formatada` e `<campo>_desc` derivam de `<campo>`. Fora dela,
+    todos os campos do schema.
+    """
+    for sufixo in ("_formatada", "_desc"):
+        if nome.endswith(sufixo) and nome[:-len(sufixo)] in schema.model_fields:
+            return (nome[:-len(sufixo)],)
+    return schema.model_fields
+
+
+class Projection:
+    def __init__(self, schema: type[BaseModel], model, confiavel: bool = True):
+        self.schema = schema
+        self.model = model
+        self.confiavel = confiavel
+
+        mapper = inspect(model)
+        self.campos: list[str] = []
+        self.relacoes: dict[str, Projection] = {}
+        for nome, field in schema.model_fields.items():
+            if nome in mapper.columns:
+                self.campos.append(nome)
+            elif nome in mapper.relationships:
+                sub_schema = _schema_aninhado(field.annotation)
+                self.relacoes[nome] = Projection(sub_schema, mapper.relationships[nome].mapper.class_, confiavel)
+
+    @lru_cache(maxsize=128)
+    def only(self, campos: frozenset[str]) -> "Projection":
+        """
+        Cópia da projeção só com os `campos` (caminhos `campo` ou
+        `relação.campo`; a relação sozinha traz o objeto inteiro), mais as
+        colunas de que os campos calculados pedidos dependem. O `id` vem sempre.
+        """
+        raiz = {"id"}
+        sub: dict[str, Optional[set[str]]] = {}
+        for caminho in campos:
+            nome, _, resto = caminho.partition(".")
+            if nome in self.relacoes:
+                if not resto:
+                    sub[nome] = None
+                elif sub.get(nome, set()) is not None:
+                    sub.setdefault(nome, set()).add(resto)
+            elif nome in self.schema.model_computed_fields:
+                raiz.update(_dependencias(self.schema, nome))
+            else:
+                raiz.add(nome)
+
+        nova = copy.copy(self)
+        nova.campos = [nome for nome in self.campos if nome in raiz]
+        nova.relacoes = {
+            nome: projecao if sub[nome] is None else projecao.only(frozenset(sub[nome]))
+            for nome, projecao in self.relacoes.items() if nome in sub
+        }
+        return nova
+
+    def _plano(self, entidade, prefixo: str, colunas: list, joins: list) -> None:
+        for nome in self.campos:
+            coluna = getattr(entidade, nome)
+            # Campos booleanos expostos como int (ativo: int) já saem convertidos do banco
+            if self.schema.model_fields[nome].annotation is int and isinstance(coluna.type, Boolean):
+                coluna = cast(coluna, Integer)
+            colunas.append(coluna.label(prefixo + nome))
+        for nome, sub in self.relacoes.items():
+            alias = aliased(sub.model)
+            joins.append(getattr(entidade, nome).of_type(alias))
+            sub._plano(alias, f"{prefixo}{nome}__", colunas, joins)
+
+    def apply(self, query: Query) -> Query:
+        """Troca as entidades da consulta pelas colunas do schema (mantendo filtros e ordem)."""
+        colunas: list = []
+        joins: list = []
+        self._plano(self.model, "", colunas, joins)
+        query = query.with_entities(*colunas)
+        for join in joins:
+            query = query.outerjoin(join)
+        return query
+
+    def _versao(self, entidade, colunas: list, joins: list) -> None:
+        if "dt_atualizado" in inspect(self.model).columns:
+            colunas.append(func.max(entidade.dt_atualizado))
+        for nome, sub in self.relacoes.items():
+            alias = aliased(sub.model)
+            joins.append(getattr(entidade, nome).of_type(alias))
+            sub._versao(alias, colunas, joins)
+
+    def version(self, query: Query) -> tuple:
+        """
+        Versão dos dados da consulta: o número de linhas e o maior
+        dt_atualizado da tabela e de cada relação do schema, numa única
+        consulta de agregação (sem ORDER BY nem paginação).
+        """
+        colunas: list = [func.count(self.model.id)]
+        joins: list = []
+        self._versao(self.model, colunas, joins)
+        query = query.order_by(None).with_entities(*colunas)
+        for join in joins:
+            query = query.outerjoin(join)
+        return tuple(query.one())
+
+    def build(self, row: Any, prefixo: str = "") -> Optional[BaseModel]:
+        """Monta o schema a partir de uma linha da consulta projetada."""
+        linha = row._mapping if hasattr(row, "_mapping") else row
+        if prefixo and "id" in self.campos and linha[prefixo + "id"] is None:
+            return None  # LEFT JOIN sem correspondência
+
+        dados = {nome: linha[prefixo + nome] for nome in self.campos}
+        for nome, sub in self.relacoes.items():
+            dados[nome] = sub.build(linha, f"{prefixo}{nome}__")
+
+        if self.confiavel:
+            return self.schema.model_construct(**dados)
+        return self.schema.model_validate(dados)
+
+    def build_all(self, rows) -> list[BaseModel]:
+        return [self.build(row) for row in rows]
+
+    def stream(self, query: Query, lote: int = 1000) -> Iterator[BaseModel]:
+        """
+        Percorre a consulta projetada com cursor no servidor (`yield_per`,
+        que implica `stream_results`), `lote` linhas por vez: a memória não
+        cresce com o tamanho do resultado.
+        """
+        for row in self.apply(query).yield_per(lote):
+            yield self.build(row)
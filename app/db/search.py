@@ -0,0 +1,228 @@
+# app/db/search.py
+"""
+Backend de busca textual para o parâmetro `filtro` das listagens.
+
+Cada banco usa o recurso nativo de busca, sempre por trecho ("ilva"
+encontra "Silva", como o `ilike('%filtro%')` original), sem diferenciar
+acentos ("joao" encontra "João") e ordenando os resultados por relevância:
+
+- PostgreSQL: pg_trgm + unaccent, com índices GIN de trigramas;
+- MySQL: índices FULLTEXT com o parser ngram (a collation utf8mb4_0900_ai_ci
+  já ignora acentos);
+- SQLite: tabelas virtuais FTS5 com o tokenizer trigram, mantidas por
+  triggers sobre o texto sem acentos (função f_unaccent, registrada em cada
+  conexão por register_sqlite_functions; uso local).
+
+Palavras curtas demais para os índices de n-gramas (e outros bancos) caem
+no `ilike('%filtro%')` original.
+"""
+import re
+import unicodedata
+from typing import Iterable, Optional
+
+from sqlalchemy import DDL, event, func, literal_column, or_, select, table, column
+from sqlalchemy.orm import Query, Session
+
+# Colunas pesquisáveis de cada tabela (índices criados pela migração 0003)
+SEARCH_COLUMNS = {
+    "camara": ("nome", "municipio", "uf"),
+    "usuario": ("nome", "email"),
+    "vereador": ("nome", "email", "partido"),
+    "mandato": ("descricao",),
+    "comissao": ("nome",),
+}
+
+# Tamanho dos n-gramas indexados pelo parser ngram do InnoDB (ngram_token_size)
+MYSQL_MIN_TOKEN = 2
+
+# O tokenizer trigram do FTS5 não encontra trechos com menos de 3 caracteres
+SQLITE_MIN_TOKEN = 3
+
+# Função imutável que envolve unaccent, exigida para usá-la em índices do PostgreSQL
+PG_SETUP_DDL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE EXTENSION IF NOT EXISTS unaccent",
+    "CREATE OR REPLACE FUNCTION f_unaccent(text) RETURNS text "
+    "LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT "
+    "AS $$ SELECT public.unaccent('public.unaccent'::regdictionary, $1) $$",
+]
+
+
+def f_unaccent(texto: Optional[str]) -> Optional[str]:
+    """Remove os acentos do texto (equivalente ao f_unaccent do PostgreSQL)."""
+    if texto is None:
+        return None
+    decomposto = unicodedata.normalize("NFKD", texto)
+    return "".join(c for c in decomposto if not unicodedata.combining(c))
+
+
+def register_sqlite_functions(dbapi_connection) -> None:
+    """
+    Registra f_unaccent numa conexão SQLite: os triggers das tabelas FTS5 e
+    a busca simples dependem dela, então toda conexão que escreve nas tabelas
+    pesquisáveis precisa registrá-la (app/db/database.py e migrations/env.py).
+    """
+    dbapi_connection.create_function("f_unaccent", 1, f_unaccent, deterministic=True)
+
+
+# ------------------- DDL dos índices de busca -------------------
+
+def create_search_ddl(dialect: str, tabela: str, por_trecho: bool = True) -> list[str]:
+    """
+    Comandos que criam a estrutura de busca de uma tabela no dialeto informado.
+
+    Com `por_trecho` falso, cria a estrutura original da migração 0003 (busca
+    por palavra/prefixo no MySQL e no SQLite), usada só pelas migrações.
+    """
+    colunas = SEARCH_COLUMNS[tabela]
+    if dialect == "postgresql":
+        return [
+            f"CREATE INDEX ix_{tabela}_{c}_trgm ON {tabela} USING gin (f_unaccent({c}) gin_trgm_ops)"
+            for c in colunas
+        ]
+    if dialect == "mysql" and por_trecho:
+        # Com stopwords, o parser ngram descarta todo n-grama que contenha uma
+        # delas (as do InnoDB incluem "a", "i", ...): os índices são criados sem
+        return ["SET SESSION innodb_ft_enable_stopword = OFF"] + [
+            f"CREATE FULLTEXT INDEX ix_{tabela}_{c}_ft ON {tabela} ({c}) WITH PARSER ngram" for c in colunas
+        ]
+    if dialect == "mysql":
+        return [f"CREATE FULLTEXT INDEX ix_{tabela}_{c}_ft ON {tabela} ({c})" for c in colunas]
+    if dialect == "sqlite" and por_trecho:
+        # Tabela sem conteúdo próprio (content=''): indexa o texto sem acentos,
+        # que não existe na tabela original, e a remoção informa os mesmos valores
+        lista = ", ".join(colunas)
+        novos = ", ".join(f"f_unaccent(new.{c})" for c in colunas)
+        antigos = ", ".join(f"f_unaccent(old.{c})" for c in colunas)
+        atuais = ", ".join(f"f_unaccent({c})" for c in colunas)
+        return [
+            f"CREATE VIRTUAL TABLE {tabela}_fts USING fts5({lista}, content='', tokenize='trigram')",
+            f"CREATE TRIGGER {tabela}_fts_ai AFTER INSERT ON {tabela} BEGIN "
+            f"INSERT INTO {tabela}_fts(rowid, {lista}) VALUES (new.id, {novos}); END",
+            f"CREATE TRIGGER {tabela}_fts_ad AFTER DELETE ON {tabela} BEGIN "
+            f"INSERT INTO {tabela}_fts({tabela}_fts, rowid, {lista}) VALUES ('delete', old.id, {antigos}); END",
+            f"CREATE TRIGGER {tabela}_fts_au AFTER UPDATE ON {tabela} BEGIN "
+            f"INSERT INTO {tabela}_fts({tabela}_fts, rowid, {lista}) VALUES ('delete', old.id, {antigos}); "
+            f"INSERT INTO {tabela}_fts(rowid, {lista}) VALUES (new.id, {novos}); END",
+            # Indexa as linhas que já existiam na tabela
+            f"INSERT INTO {tabela}_fts(rowid, {lista}) SELECT id, {atuais} FROM {tabela}",
+        ]
+    if dialect == "sqlite":
+        lista = ", ".join(colunas)
+        novos = ", ".join(f"new.{c}" for c in colunas)
+        antigos = ", ".join(f"old.{c}" for c in colunas)
+        return [
+            f"CREATE VIRTUAL TABLE {tabela}_fts USING fts5({lista}, content='{tabela}', "
+            f"content_rowid='id', tokenize='unicode61 remove_diacritics 2')",
+            f"CREATE TRIGGER {tabela}_fts_ai AFTER INSERT ON {tabela} BEGIN "
+            f"INSERT INTO {tabela}_fts(rowid, {lista}) VALUES (new.id, {novos}); END",
+            f"CREATE TRIGGER {tabela}_fts_ad AFTER DELETE ON {tabela} BEGIN "
+            f"INSERT INTO {tabela}_fts({tabela}_fts, rowid, {lista}) VALUES ('delete', old.id, {antigos}); END",
+            f"CREATE TRIGGER {tabela}_fts_au AFTER UPDATE ON {tabela} BEGIN "
+            f"INSERT INTO {tabela}_fts({tabela}_fts, rowid, {lista}) VALUES ('delete', old.id, {antigos}); "
+            f"INSERT INTO {tabela}_fts(rowid, {lista}) VALUES (new.id, {novos}); END",
+            # Indexa as linhas que já existiam na tabela
+            f"INSERT INTO {tabela}_fts({tabela}_fts) VALUES ('rebuild')",
+        ]
+    return []
+
+
+def drop_search_ddl(dialect: str, tabela: str) -> list[str]:
+    """Comandos que removem a estrutura de busca de uma tabela."""
+    colunas = SEARCH_COLUMNS[tabela]
+    if dialect == "postgresql":
+        return [f"DROP INDEX IF EXISTS ix_{tabela}_{c}_trgm" for c in colunas]
+    if dialect == "mysql":
+        return [f"DROP INDEX ix_{tabela}_{c}_ft ON {tabela}" for c in colunas]
+    if dialect == "sqlite":
+        return [f"DROP TRIGGER IF EXISTS {tabela}_fts_{t}" for t in ("ai", "ad", "au")] + [
+            f"DROP TABLE IF EXISTS {tabela}_fts"
+        ]
+    return []
+
+
+def register_search_ddl(metadata) -> None:
+    """
+    Liga a DDL de busca ao metadata, para que o create_all (usado em testes e
+    bancos locais) crie a mesma estrutura que a migração.
+    """
+    for stmt in PG_SETUP_DDL:
+        event.listen(metadata, "before_create", DDL(stmt).execute_if(dialect="postgresql"))
+    for nome_tabela in SEARCH_COLUMNS:
+        tabela = metadata.tables[nome_tabela]
+        for dialect in ("postgresql", "mysql", "sqlite"):
+            for stmt in create_search_ddl(dialect, nome_tabela):
+                event.listen(tabela, "after_create", DDL(stmt).execute_if(dialect=dialect))
+
+
+# ------------------- Aplicação do filtro -------------------
+
+def _termos(filtro: str) -> list[str]:
+    """Quebra o filtro em palavras, descartando operadores das sintaxes de busca."""
+    return [t for t in re.split(r"[\s\"'+\-<>()~*@:{}^]+", filtro) if t]
+
+
+def apply_search(
+    query: Query,
+    db: Session,
+    model,
+    colunas: Iterable[str],
+    filtro: Optional[str],
+    rank: bool = True
+) -> Query:
+    """
+    Aplica o `filtro` sobre as colunas informadas de `model` e, se `rank`
+    for verdadeiro, ordena o resultado por relevância.
+
+    As colunas devem fazer parte de SEARCH_COLUMNS[model.__tablename__]
+    (são as que possuem índice de busca).
+    """
+    if not filtro:
+        return query
+
+    colunas = tuple(colunas)
+    attrs = [getattr(model, c) for c in colunas]
+    dialect = db.get_bind().dialect.name
+    termos = _termos(filtro)
+
+    if dialect == "postgresql":
+        padrao = func.f_unaccent(f"%{filtro}%")
+        query = query.filter(or_(*(func.f_unaccent(a).ilike(padrao) for a in attrs)))
+        if rank:
+            alvo = func.f_unaccent(filtro)
+            query = query.order_by(func.greatest(*(func.similarity(func.f_unaccent(a), alvo) for a in attrs)).desc())
+        return query
+
+    if dialect == "mysql" and termos and all(len(t) >= MYSQL_MIN_TOKEN for t in termos):
+        # Modo booleano: todas as palavras obrigatórias; com o parser ngram,
+        # cada uma vira a frase dos seus n-gramas, ou seja, busca por trecho
+        expressao = " ".join(f'+"{t}"' for t in termos)
+        matches = [a.match(expressao) for a in attrs]
+        query = query.filter(or_(*matches))
+        if rank:
+            relevancia = matches[0]
+            for m in matches[1:]:
+                relevancia = relevancia + m
+            query = query.order_by(relevancia.desc())
+        return query
+
+    if dialect == "sqlite" and termos and all(len(t) >= SQLITE_MIN_TOKEN for t in termos):
+        nome_fts = f"{model.__tablename__}_fts"
+        fts = table(nome_fts, column("rowid"), column("rank"))
+        # Cada palavra (sem acentos, como o texto indexado) é um trecho obrigatório
+        expressao = "{%s} : %s" % (" ".join(colunas), " ".join('"%s"' % f_unaccent(t) for t in termos))
+        encontrados = (
+            select(fts.c.rowid, fts.c.rank)
+            .where(literal_column(nome_fts).op("MATCH")(expressao))
+            .subquery()
+        )
+        query = query.join(encontrados, encontrados.c.rowid == model.id)
+        if rank:
+            query = query.order_by(encontrados.c.rank)
+        return query
+
+    # Busca simples (outros bancos ou palavras curtas demais para os n-gramas)
+    if dialect == "sqlite":
+        padrao = f_unaccent(f"%{filtro}%")
+        return query.filter(or_(*(func.f_unaccent(a).ilike(padrao) for a in attrs)))
+    return query.filter(or_(*(a.ilike(f"%{filtro}%") for a in attrs)))
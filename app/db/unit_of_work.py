@@ -0,0 +1,56 @@
+# app/db/unit_of_work.py
+from functools import wraps
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.db.integrity import integrity_http_error
+
+
+def _find_session(args, kwargs) -> Session:
+    """Localiza a sessão do serviço: atributo `self.db` ou argumento `db`."""
+    if args and isinstance(getattr(args[0], "db", None), Session):
+        return args[0].db
+    for value in (*args, *kwargs.values()):
+        if isinstance(value, Session):
+            return value
+    raise RuntimeError("Nenhuma sessão do banco encontrada para a transação.")
+
+
+def transactional(func):
+    """
+    Decorator dos métodos de escrita dos serviços (unidade de trabalho).
+
+    Os repositórios apenas fazem flush; o commit acontece uma única vez, ao fim do
+    método mais externo decorado. Qualquer exceção (inclusive HTTPException)
+    desfaz toda a operação. Chamadas aninhadas entre serviços, como
+    CamaraUsuarioService -> UsuarioService, participam da mesma transação.
+
+    Violações de unique/chave estrangeira (IntegrityError) viram a
+    HTTPException 400/404/409 correspondente (app/db/integrity.py).
+    """
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        db = _find_session(args, kwargs)
+        depth = db.info.get("uow_depth", 0)
+        db.info["uow_depth"] = depth + 1
+        try:
+            result = func(*args, **kwargs)
+            if depth == 0:
+                db.commit()
+            return result
+        except IntegrityError as e:
+            if depth == 0:
+                db.rollback()
+            erro = integrity_http_error(e)
+            if erro is None:
+                raise
+            raise erro from e
+        except Exception:
+            if depth == 0:
+                db.rollback()
+            raise
+        finally:
+            db.info["uow_depth"] = depth
+
+    return wrapper
@@ -1,8 +1,13 @@
 from fastapi import FastAPI
+from fastapi.datastructures import Default
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.core.compression import CompressionMiddleware
+from app.core.config import settings
+from app.core.serialization import JSONBytesResponse
 from app.db.base import Base
-from app.db.database import engine
+from app.db.database import ReadAfterWriteMiddleware, engine
+from app.db.metrics import DBMetricsMiddleware
 from app.api.v1 import (
     auth_router, 
     camara_router, 
@@ -12,16 +17,21 @@ from app.api.v1 import (
     vereador_router, 
     mandato_vereador_router,
     comissao_router,
-    comissao_membro_router  
+    comissao_membro_router,
+    async_router,
+    metrics_router
 )
 
 # Esta linha cria as tabelas no seu banco de dados se elas não existirem
 # Base.metadata.create_all(bind=engine)
 
+# Resposta padrão serializada direto para bytes (app/core/serialization.py).
+# Registrada com Default para as rotas com response_model manterem o dump_json do FastAPI.
 app = FastAPI(
     title="API de Votação",
     description="API para o sistema de votação.",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=Default(JSONBytesResponse)
 )
 
 # Defina as origens permitidas (de onde seu front-end fará as requisições)
@@ -39,10 +49,26 @@ app.add_middleware(
     allow_credentials=True, # Permite cookies (importante para autenticação)
     allow_methods=["*"],    # Permite todos os métodos (GET, POST, etc.)
     allow_headers=["*"],    # Permite todos os cabeçalhos
+    expose_headers=["ETag"],  # Lido pelo front-end nas requisições condicionais (app/core/etag.py)
 )
 
+# Compressão brotli/gzip das respostas maiores (app/core/compression.py)
+app.add_middleware(CompressionMiddleware)
+
+# Cookie de leitura das próprias escritas, com réplicas de leitura (app/db/database.py)
+if settings.SQLALCHEMY_REPLICA_URIS:
+    app.add_middleware(ReadAfterWriteMiddleware)
+
+# Contadores de comandos SQL e commits por requisição (DB_METRICS=true)
+if settings.DB_METRICS:
+    app.add_middleware(DBMetricsMiddleware)
+
 
 # Inclui os roteadores da API
+# No modo assíncrono, as rotas de leitura assíncronas têm precedência sobre as síncronas
+if settings.DB_ASYNC:
+    app.include_router(async_router.router, prefix="/api/v1")
+
 app.include_router(auth_router.router, prefix="/api/v1")
 app.include_router(usuario_router.router, prefix="/api/v1")
 app.include_router(camara_router.router, prefix="/api/v1")
@@ -52,3 +78,4 @@ app.include_router(vereador_router.router, prefix="/api/v1")
 app.include_router(mandato_vereador_router.router, prefix="/api/v1")
 app.include_router(comissao_router.router, prefix="/api/v1")
 app.include_router(comissao_membro_router.router, prefix="/api/v1")
+app.include_router(metrics_router.router, prefix="/api/v1")
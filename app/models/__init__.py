@@ -0,0 +1,17 @@
+# Importa todos os modelos para que fiquem registrados em Base.metadata
+# (usado pelas migrações do Alembic)
+from app.models.camara_model import Camara
+from app.models.usuario_model import Usuario
+from app.models.camara_usuario_model import CamaraUsuario
+from app.models.permissao_model import Permissao
+from app.models.refresh_token_model import RefreshToken
+from app.models.vereador_model import Vereador
+from app.models.mandato_model import Mandato
+from app.models.mandato_vereador_model import MandatoVereador
+from app.models.comissao_model import Comissao
+from app.models.comissao_membro import ComissaoMembro
+
+# Estrutura de busca textual (FTS5/FULLTEXT/pg_trgm) também no create_all
+from app.db.base import Base
+from app.db.search import register_search_ddl
+register_search_ddl(Base.metadata)
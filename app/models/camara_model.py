@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, TIMESTAMP, func
+from sqlalchemy import Column, Integer, String, Boolean, TIMESTAMP, func, Index, text
 from sqlalchemy.orm import relationship
 from app.db.base import Base
 
@@ -8,6 +8,21 @@ class Camara(Base):
     """
     __tablename__ = "camara"
 
+    # Busca dt_cadastro/dt_atualizado gerados pelo banco no próprio INSERT/UPDATE
+    # (RETURNING), dispensando o SELECT extra de db.refresh()
+    __mapper_args__ = {"eager_defaults": True}
+
+    __table_args__ = (
+        # Todas as consultas filtram as câmaras não excluídas: índice parcial
+        # no PostgreSQL/SQLite e composto no MySQL, que não tem índice parcial
+        Index(
+            "ix_camara_nao_excluidas", "id",
+            postgresql_where=text("excluido = false"),
+            sqlite_where=text("excluido = 0"),
+        ).ddl_if(dialect=("postgresql", "sqlite")),
+        Index("ix_camara_excluido_id", "excluido", "id").ddl_if(dialect="mysql"),
+    )
+
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     nome = Column(String(120), nullable=False)
     cnpj = Column(String(20), unique=True, index=True)
@@ -19,7 +34,7 @@ class Camara(Base):
     numero_cadeiras = Column(Integer)
     
     dt_cadastro = Column(TIMESTAMP, server_default=func.now())
-    dt_atualizado = Column(TIMESTAMP, onupdate=func.now())
+    dt_atualizado = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now())
     excluido = Column(Boolean, default=False)
 
     # Relacionamento de volta para a tabela de associação
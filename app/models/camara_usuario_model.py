@@ -1,5 +1,5 @@
 # app/models/camara_usuario_model.py
-from sqlalchemy import Column, Integer, Boolean, TIMESTAMP, Text, func, ForeignKey
+from sqlalchemy import BigInteger, Column, Integer, Boolean, TIMESTAMP, Text, func, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from app.db.base import Base
 
@@ -9,6 +9,14 @@ class CamaraUsuario(Base):
     definindo o papel de cada usuário em uma câmara.
     """
     __tablename__ = "camara_usuario"
+    __mapper_args__ = {"eager_defaults": True}  # datas do servidor via RETURNING
+
+    __table_args__ = (
+        # Usuários de uma câmara (listagem) e câmaras de um usuário (login)
+        Index("ix_camara_usuario_camara_id_excluido", "camara_id", "excluido"),
+        # Único: um usuário só se associa uma vez a cada câmara (a exclusão é lógica)
+        Index("ux_camara_usuario_usuario_id_camara_id", "usuario_id", "camara_id", unique=True),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     
@@ -16,6 +24,8 @@ class CamaraUsuario(Base):
     papel = Column(Integer, nullable=False, comment="Define o nível de permissão do usuário na câmara.")
 
     permissao = Column(Text, nullable=False, comment="Define as permissões específicas do usuário em formato de texto (ex: JSON).")
+    # As mesmas permissões compiladas em bits (app/core/permissions.py), gravadas junto com `permissao`
+    permissao_mask = Column(BigInteger, nullable=False, default=0, server_default="0")
     
     ativo = Column(Boolean, default=True)
     excluido = Column(Boolean, default=False)
@@ -9,6 +9,7 @@ class ComissaoMembro(Base):
     definindo o papel de cada Vereador em uma comissão.
     """
     __tablename__ = "comissao_membro"
+    __mapper_args__ = {"eager_defaults": True}  # dt_cadastro/dt_atualizado via RETURNING
 
     id = Column(Integer, primary_key=True, index=True)
     funcao = Column(Integer, nullable=False, comment="Define a função do vereador na comissao.")
@@ -17,10 +18,11 @@ class ComissaoMembro(Base):
     data_fim = Column(Date, nullable=False)
 
     dt_cadastro = Column(TIMESTAMP, server_default=func.now())
+    dt_atualizado = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now())
 
     # Chaves Estrangeiras
-    comissao_id = Column(Integer, ForeignKey("comissao.id"), nullable=False)
-    mandato_vereador_id = Column(Integer, ForeignKey("mandato_vereador.id"), nullable=False)
+    comissao_id = Column(Integer, ForeignKey("comissao.id"), nullable=False, index=True)
+    mandato_vereador_id = Column(Integer, ForeignKey("mandato_vereador.id"), nullable=False, index=True)
 
     # Relacionamentos (permite acessar os objetos completos)
     comissao = relationship("Comissao", back_populates="associacoes")
@@ -7,6 +7,7 @@ class Comissao(Base):
     Modelo SQLAlchemy que representa a tabela 'comissao' no banco de dados.
     """
     __tablename__ = "comissao"
+    __mapper_args__ = {"eager_defaults": True}  # dt_cadastro/dt_atualizado via RETURNING
 
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     nome = Column(String(120), nullable=False)
@@ -15,9 +16,10 @@ class Comissao(Base):
     data_fim = Column(DateTime, nullable=True)
     
     dt_cadastro = Column(TIMESTAMP, server_default=func.now())
+    dt_atualizado = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now())
 
     # Chave Estrangeira para a câmara
-    camara_id = Column(Integer, ForeignKey("camara.id"), nullable=False)
+    camara_id = Column(Integer, ForeignKey("camara.id"), nullable=False, index=True)
 
     # Relacionamento de volta para a Câmara
     camara = relationship("Camara")
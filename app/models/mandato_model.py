@@ -1,5 +1,5 @@
 # votacao-backend/app/models/mandato_model.py
-from sqlalchemy import Column, Integer, String, Date, TIMESTAMP, func, ForeignKey, Boolean
+from sqlalchemy import Column, Integer, String, Date, TIMESTAMP, func, ForeignKey, Boolean, Index, text
 from sqlalchemy.orm import relationship
 from app.db.base import Base
 
@@ -8,6 +8,23 @@ class Mandato(Base):
     Modelo SQLAlchemy que representa a tabela 'mandato' no banco de dados.
     """
     __tablename__ = "mandato"
+    __mapper_args__ = {"eager_defaults": True}  # datas do servidor via RETURNING
+
+    __table_args__ = (
+        # Mandatos de uma câmara e busca do mandato ativo
+        Index("ix_mandato_camara_id_ativo", "camara_id", "ativo"),
+        # No máximo um mandato ativo por câmara, garantido pelo banco
+        Index(
+            "ux_mandato_camara_id_ativo", "camara_id", unique=True,
+            postgresql_where=text("ativo = true"),
+            sqlite_where=text("ativo = 1"),
+        ).ddl_if(dialect=("postgresql", "sqlite")),
+        # MySQL não tem índice parcial: índice funcional, NULL para os inativos
+        Index(
+            "ux_mandato_camara_id_ativo_fn", text("IF(ativo, camara_id, NULL)"), unique=True,
+            info={"colunas": ("camara_id",)},  # colunas da expressão, para app/db/integrity.py
+        ).ddl_if(dialect="mysql"),
+    )
 
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     descricao = Column(String(120), nullable=False)
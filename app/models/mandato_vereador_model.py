@@ -1,5 +1,5 @@
 from tokenize import String
-from sqlalchemy import Column, Integer, ForeignKey
+from sqlalchemy import Column, Integer, ForeignKey, Index, TIMESTAMP, func
 from sqlalchemy.orm import relationship
 from app.db.base import Base
 
@@ -9,13 +9,21 @@ class MandatoVereador(Base):
     definindo o papel de cada Vereador em um mandato.
     """
     __tablename__ = "mandato_vereador"
+    __mapper_args__ = {"eager_defaults": True}  # dt_atualizado via RETURNING
+
+    __table_args__ = (
+        # Vereadores de um mandato; único: um vereador só entra uma vez em cada mandato
+        Index("ux_mandato_vereador_mandato_id_vereador_id", "mandato_id", "vereador_id", unique=True),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     funcao = Column(Integer, nullable=False, comment="Define a função do vereador no mandato.")
 
+    dt_atualizado = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now())
+
     # Chaves Estrangeiras
     mandato_id = Column(Integer, ForeignKey("mandato.id"), nullable=False)
-    vereador_id = Column(Integer, ForeignKey("vereador.id"), nullable=False)
+    vereador_id = Column(Integer, ForeignKey("vereador.id"), nullable=False, index=True)
 
     # Relacionamentos (permite acessar os objetos completos)
     mandato = relationship("Mandato", back_populates="associacoes")
@@ -0,0 +1,14 @@
+# app/models/permissao_model.py
+from sqlalchemy import Column, Integer, String
+from app.db.base import Base
+
+class Permissao(Base):
+    """
+    Catálogo dos nomes de permissão usados em CamaraUsuario.permissao. O id
+    define o bit da permissão (id - 1) em CamaraUsuario.permissao_mask; novos
+    nomes são registrados quando aparecem numa associação.
+    """
+    __tablename__ = "permissao"
+
+    id = Column(Integer, primary_key=True, index=True)
+    nome = Column(String(100), unique=True, nullable=False)
@@ -0,0 +1,27 @@
+# app/models/refresh_token_model.py
+from sqlalchemy import Column, Integer, String, Boolean, TIMESTAMP, func, ForeignKey
+from app.db.base import Base
+
+class RefreshToken(Base):
+    """
+    Refresh tokens emitidos no login. Só o hash SHA-256 do token é gravado.
+    Cada uso gera um novo token da mesma família (rotação) e marca o anterior
+    como usado; reapresentar um token já usado revoga a família inteira.
+    """
+    __tablename__ = "refresh_token"
+
+    id = Column(Integer, primary_key=True, index=True)
+    token_hash = Column(String(64), unique=True, index=True, nullable=False)
+    # Identifica a cadeia de rotações iniciada num login
+    familia = Column(String(32), index=True, nullable=False)
+    # Versão dos tokens do usuário na emissão (revogada junto com os access tokens)
+    token_version = Column(Integer, nullable=False)
+
+    # Datas em UTC
+    expira_em = Column(TIMESTAMP, nullable=False)
+    usado_em = Column(TIMESTAMP, nullable=True)
+    revogado = Column(Boolean, nullable=False, default=False)
+
+    dt_cadastro = Column(TIMESTAMP, server_default=func.now())
+
+    usuario_id = Column(Integer, ForeignKey("usuario.id"), index=True, nullable=False)
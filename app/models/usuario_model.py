@@ -8,6 +8,7 @@ class Usuario(Base):
     Modelo SQLAlchemy que representa a tabela 'usuario' no banco de dados.
     """
     __tablename__ = "usuario"
+    __mapper_args__ = {"eager_defaults": True}  # datas do servidor via RETURNING
 
     id = Column(Integer, primary_key=True, index=True)
     nome = Column(String(120), nullable=False)
@@ -15,6 +16,8 @@ class Usuario(Base):
     senha_hash = Column(String(255), nullable=False)
     ativo = Column(Boolean, default=True)
     is_superuser = Column(Boolean, default=False)
+    # Incrementada para revogar os access tokens já emitidos (app/core/token_version.py)
+    token_version = Column(Integer, nullable=False, default=0, server_default="0")
     
     dt_cadastro = Column(TIMESTAMP, server_default=func.now())
     dt_atualizado = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now())
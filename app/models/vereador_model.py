@@ -8,6 +8,7 @@ class Vereador(Base):
     Modelo SQLAlchemy que representa a tabela 'vereador' no banco de dados.
     """
     __tablename__ = "vereador"
+    __mapper_args__ = {"eager_defaults": True}  # datas do servidor via RETURNING
 
     id = Column(Integer, primary_key=True, index=True)
     nome = Column(String(120), nullable=False)
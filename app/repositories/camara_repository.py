@@ -1,9 +1,15 @@
 # app/repositories/camara_repository.py
 from sqlalchemy.orm import Session
 from app.models.camara_model import Camara
-from app.schemas.camara_schema import CamaraCreate, CamaraUpdate
+from app.schemas.camara_schema import Camara as CamaraSchema, CamaraCreate, CamaraUpdate
 from typing import List, Optional
-from sqlalchemy import or_
+from app.db.fields import FieldSelection
+from app.db.pagination import Page, paginate
+from app.db.projection import Projection
+from app.db.search import apply_search
+
+# Colunas do schema Camara, para a listagem sem instâncias ORM
+CAMARA_PROJECTION = Projection(CamaraSchema, Camara)
 
 class CamaraRepository:
     def get(self, db: Session, camara_id: int) -> Optional[Camara]:
@@ -11,24 +17,27 @@ class CamaraRepository:
         Busca uma única câmara pelo ID.
         """
         return db.query(Camara).filter(Camara.id == camara_id, Camara.excluido == False).first()
+
+    def _query(self, db: Session, filtro: Optional[str], rank: bool):
+        query = db.query(Camara).filter(Camara.excluido == False)
+
+        # Busca textual sem acentos, ordenada por relevância
+        return apply_search(query, db, Camara, ("nome", "municipio", "uf"), filtro, rank=rank)
     
-    def get_multi(self, db: Session, *, skip: int = 0, limit: int = 100, filtro: Optional[str] = None) -> List[Camara]:
+    def get_multi(self, db: Session, *, skip: int = 0, limit: int = 100, filtro: Optional[str] = None, cursor: Optional[str] = None, include_total: bool = True, estimate: bool = False, projetar: bool = False, selecao: Optional[FieldSelection] = None) -> Page:
         """
-        Busca uma lista de câmaras com paginação.
+        Busca uma lista de câmaras com paginação. Com `projetar`, devolve
+        schemas Camara montados direto das colunas; com `selecao`, só as
+        colunas dos campos pedidos.
         """
-        query = db.query(Camara).filter(Camara.excluido == False)
-
-        if filtro:
-            query = query.filter(
-                or_(
-                    Camara.nome.ilike(f"%{filtro}%"),
-                    Camara.municipio.ilike(f"%{filtro}%"),
-                    Camara.uf.ilike(f"%{filtro}%"),
-                )
-            )
+        query = self._query(db, filtro, rank=cursor is None)
+        return paginate(query, Camara.id, skip=skip, limit=limit, cursor=cursor, por_relevancia=bool(filtro),
+                        include_total=include_total, estimate=estimate,
+                        projecao=CAMARA_PROJECTION.only(selecao.campos) if selecao else (CAMARA_PROJECTION if projetar else None))
 
-
-        return query.offset(skip).limit(limit).all()
+    def get_version(self, db: Session, *, filtro: Optional[str] = None) -> tuple:
+        """Versão das câmaras do filtro (ETag da listagem)."""
+        return CAMARA_PROJECTION.version(self._query(db, filtro, rank=False))
     
     def create(self, db: Session, *, obj_in: CamaraCreate) -> Camara:
         """
@@ -37,8 +46,7 @@ class CamaraRepository:
         # Atualizado para Pydantic V2
         db_obj = Camara(**obj_in.model_dump())
         db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
+        db.flush()
         return db_obj
 
     def update(
@@ -53,8 +61,7 @@ class CamaraRepository:
             setattr(db_obj, field, value)
         
         db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
+        db.flush()
         return db_obj
 
     def remove(self, db: Session, *, camara_id: int) -> Optional[Camara]:
@@ -67,25 +74,8 @@ class CamaraRepository:
         
         db_obj.excluido = True
         db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
+        db.flush()
         return db_obj
     
-    def count(self, db: Session, filtro: Optional[str] = None) -> int:
-        """
-        Conta o número total de câmaras não excluídas, aplicando o filtro se houver.
-        """
-        query = db.query(Camara).filter(Camara.excluido == False)
-
-        if filtro:
-            query = query.filter(
-                or_(
-                    Camara.nome.ilike(f"%{filtro}%"),
-                    Camara.municipio.ilike(f"%{filtro}%"),
-                    Camara.uf.ilike(f"%{filtro}%")
-                )
-            )
-        return query.count()
-
 camara_repository = CamaraRepository()
 
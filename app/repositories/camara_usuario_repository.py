@@ -1,27 +1,69 @@
 # app/repositories/camara_usuario_repository.py
-from sqlalchemy.orm import Session
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session, joinedload
+from app.models.camara_model import Camara
 from app.models.camara_usuario_model import CamaraUsuario
 # ATUALIZADO: Importe CamaraUsuarioBase em vez de CamaraUsuarioCreate
 from app.models.usuario_model import Usuario
-from app.schemas.camara_usuario_schema import CamaraUsuarioBase, CamaraUsuarioUpdate
-from typing import List, Optional
-from sqlalchemy import or_
+from app.schemas.camara_usuario_schema import CamaraUsuarioBase, CamaraUsuarioPublic, CamaraUsuarioUpdate
+from typing import Iterator, List, Optional
+from app.db.fields import FieldSelection
+from app.db.pagination import Page, paginate
+from app.db.projection import Projection
+from app.db.search import apply_search
+
+# Perfil de carregamento do CamaraUsuarioPublic (usuário, câmara e vereador)
+PUBLIC_LOAD = (
+    joinedload(CamaraUsuario.usuario),
+    joinedload(CamaraUsuario.camara),
+    joinedload(CamaraUsuario.vereador),
+)
+
+# Mesmo conteúdo do CamaraUsuarioPublic, lido por projeção (exportação, seleção de campos e versão da listagem)
+PUBLIC_PROJECTION = Projection(CamaraUsuarioPublic, CamaraUsuario)
 
 class CamaraUsuarioRepository:
     def get(self, db: Session, id: int) -> Optional[CamaraUsuario]:
-        return db.query(CamaraUsuario).filter(CamaraUsuario.id == id, CamaraUsuario.excluido == False).first()
+        return db.query(CamaraUsuario).options(*PUBLIC_LOAD).filter(CamaraUsuario.id == id, CamaraUsuario.excluido == False).first()
+
+    def reactivate(self, db: Session, *, usuario_id: int, camara_id: int, papel: int, permissao: str, permissao_mask: int) -> Optional[CamaraUsuario]:
+        """
+        Reativa, com um único UPDATE, a associação excluída (exclusão lógica)
+        do usuário com a câmara. Devolve a associação ou None se não houver.
+        A câmara (também com exclusão lógica) é verificada antes, pelo serviço.
+        """
+        stmt = update(CamaraUsuario).where(
+            CamaraUsuario.usuario_id == usuario_id,
+            CamaraUsuario.camara_id == camara_id,
+            CamaraUsuario.excluido == True
+        ).values(excluido=False, ativo=True, papel=papel, permissao=permissao, permissao_mask=permissao_mask)
 
-    def get_by_usuario_and_camara(self, db: Session, *, usuario_id: int, camara_id: int) -> Optional[CamaraUsuario]:
-        return db.query(CamaraUsuario).filter(
+        if db.execute(stmt).rowcount == 0:
+            return None
+        return db.query(CamaraUsuario).options(*PUBLIC_LOAD).filter(
             CamaraUsuario.usuario_id == usuario_id,
             CamaraUsuario.camara_id == camara_id
         ).first()
 
-    def get_all_by_camara_id(self, db: Session, *, camara_id: int, skip: int = 0, limit: int = 100, filtro: Optional[str] = None) -> List[CamaraUsuario]:
+    def get_active_by_usuario_id(self, db: Session, *, usuario_id: int) -> list:
         """
-        Busca uma lista de associações de uma câmara, com JOIN para permitir
-        filtrar pelo nome ou e-mail do usuário.
+        Câmaras ativas do usuário (login): id e nome da câmara, papel e máscara
+        de permissões, numa consulta só com essas colunas.
         """
+        stmt = (
+            select(CamaraUsuario.camara_id, Camara.nome.label("camara_nome"), CamaraUsuario.papel, CamaraUsuario.permissao_mask)
+            .join(Camara, Camara.id == CamaraUsuario.camara_id)
+            .where(
+                CamaraUsuario.usuario_id == usuario_id,
+                CamaraUsuario.ativo == True,
+                CamaraUsuario.excluido == False,
+                Camara.excluido == False
+            )
+            .order_by(CamaraUsuario.id)
+        )
+        return db.execute(stmt).all()
+
+    def _query_by_camara(self, db: Session, camara_id: int, filtro: Optional[str], rank: bool):
         query = db.query(CamaraUsuario).filter(
             CamaraUsuario.camara_id == camara_id, 
             CamaraUsuario.excluido == False
@@ -31,53 +73,44 @@ class CamaraUsuarioRepository:
             # Adiciona o JOIN com a tabela Usuario
             query = query.join(Usuario, CamaraUsuario.usuario_id == Usuario.id)
             # Adiciona o filtro para nome ou e-mail
-            query = query.filter(
-                or_(
-                    Usuario.nome.ilike(f"%{filtro}%"),
-                    Usuario.email.ilike(f"%{filtro}%")
-                )
-            )
+            query = apply_search(query, db, Usuario, ("nome", "email"), filtro, rank=rank)
+        return query
 
-        return query.offset(skip).limit(limit).all()
-
-    # --- 3. FUNÇÃO DE CONTAGEM ATUALIZADA ---
-    def count_by_camara_id(self, db: Session, *, camara_id: int, filtro: Optional[str] = None) -> int:
+    def get_all_by_camara_id(self, db: Session, *, camara_id: int, skip: int = 0, limit: int = 100, filtro: Optional[str] = None, cursor: Optional[str] = None, include_total: bool = True, estimate: bool = False, selecao: Optional[FieldSelection] = None) -> Page:
         """
-        Conta o número total de associações para uma câmara específica,
-        aplicando o filtro de nome ou e-mail se fornecido.
+        Busca uma lista de associações de uma câmara, com JOIN para permitir
+        filtrar pelo nome ou e-mail do usuário. Com `selecao`, lê por projeção
+        só as colunas (e os JOINs) dos campos pedidos.
         """
-        query = db.query(CamaraUsuario).filter(
-            CamaraUsuario.camara_id == camara_id, 
-            CamaraUsuario.excluido == False
-        )
+        query = self._query_by_camara(db, camara_id, filtro, rank=cursor is None)
+        if selecao:
+            return paginate(query, CamaraUsuario.id, skip=skip, limit=limit, cursor=cursor, por_relevancia=bool(filtro),
+                            include_total=include_total, estimate=estimate, projecao=PUBLIC_PROJECTION.only(selecao.campos))
+        return paginate(query.options(*PUBLIC_LOAD), CamaraUsuario.id, skip=skip, limit=limit, cursor=cursor, por_relevancia=bool(filtro),
+                        include_total=include_total, estimate=estimate)
 
-        if filtro:
-            # Adiciona o JOIN com a tabela Usuario
-            query = query.join(Usuario, CamaraUsuario.usuario_id == Usuario.id)
-            # Adiciona o filtro para nome ou e-mail
-            query = query.filter(
-                or_(
-                    Usuario.nome.ilike(f"%{filtro}%"),
-                    Usuario.email.ilike(f"%{filtro}%")
-                )
-            )
-            
-        return query.count()
+    def get_version_by_camara_id(self, db: Session, *, camara_id: int, filtro: Optional[str] = None) -> tuple:
+        """Versão das associações da câmara no filtro (ETag da listagem)."""
+        return PUBLIC_PROJECTION.version(self._query_by_camara(db, camara_id, filtro, rank=False))
+
+    def stream_all_by_camara_id(self, db: Session, *, camara_id: int, filtro: Optional[str] = None) -> Iterator[CamaraUsuarioPublic]:
+        """Todas as associações da câmara, em ordem de id, lidas aos poucos (exportação)."""
+        query = self._query_by_camara(db, camara_id, filtro, rank=False).order_by(CamaraUsuario.id)
+        return PUBLIC_PROJECTION.stream(query)
 
     # --- CORREÇÃO APLICADA AQUI ---
     # A função agora espera `CamaraUsuarioBase`, que tem `permissao` como uma string.
-    def create(self, db: Session, *, obj_in: CamaraUsuarioBase) -> CamaraUsuario:
+    def create(self, db: Session, *, obj_in: CamaraUsuarioBase, permissao_mask: int = 0) -> CamaraUsuario:
         """
         Cria uma nova associação na base de dados.
         """
         # Usamos model_dump() para criar um dicionário a partir do schema Pydantic,
         # garantindo a compatibilidade com o construtor do SQLAlchemy.
         db_obj_data = obj_in.model_dump()
-        db_obj = CamaraUsuario(**db_obj_data)
+        db_obj = CamaraUsuario(**db_obj_data, permissao_mask=permissao_mask)
         
         db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
+        db.flush()
         return db_obj
 
     def update(self, db: Session, *, db_obj: CamaraUsuario, obj_in: CamaraUsuarioUpdate) -> CamaraUsuario:
@@ -86,8 +119,7 @@ class CamaraUsuarioRepository:
             setattr(db_obj, field, value)
         
         db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
+        db.flush()
         return db_obj
 
     def remove(self, db: Session, *, id: int) -> Optional[CamaraUsuario]:
@@ -97,8 +129,7 @@ class CamaraUsuarioRepository:
         
         db_obj.excluido = True
         db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
+        db.flush()
         return db_obj
 
    
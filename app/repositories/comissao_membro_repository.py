@@ -1,50 +1,63 @@
 # votacao-backend/app/repositories/comissao_membro_repository.py
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 from app.models.comissao_membro import ComissaoMembro
 from app.models.mandato_vereador_model import MandatoVereador
+from app.repositories.mandato_vereador_repository import PUBLIC_LOAD as MANDATO_VEREADOR_LOAD
 from app.models.vereador_model import Vereador
-from app.schemas.comissao_membro_schema import ComissaoMembroCreate, ComissaoMembroUpdate
-from typing import List, Optional
-from sqlalchemy import or_
+from app.schemas.comissao_membro_schema import ComissaoMembroCreate, ComissaoMembroPublic, ComissaoMembroUpdate
+from typing import Iterator, List, Optional
+from app.db.fields import FieldSelection
+from app.db.pagination import Page, paginate
+from app.db.projection import Projection
+from app.db.search import apply_search
+
+# Perfil de carregamento do ComissaoMembroPublic: a comissão e o
+# mandato_vereador, este com o mesmo perfil do MandatoVereadorPublic
+PUBLIC_LOAD = (
+    joinedload(ComissaoMembro.comissao),
+    joinedload(ComissaoMembro.mandato_vereador).options(*MANDATO_VEREADOR_LOAD),
+)
+
+# Mesmo conteúdo do ComissaoMembroPublic, lido por projeção (exportação e versão da listagem)
+PUBLIC_PROJECTION = Projection(ComissaoMembroPublic, ComissaoMembro)
 
 class ComissaoMembroRepository:
     def __init__(self, db: Session):
         self.db = db
 
     def get_by_id(self, id: int) -> Optional[ComissaoMembro]:
-        return self.db.query(ComissaoMembro).filter(ComissaoMembro.id == id).first()
+        return self.db.query(ComissaoMembro).options(*PUBLIC_LOAD).filter(ComissaoMembro.id == id).first()
 
-    def get_all_by_comissao_id(self, comissao_id: int, skip: int = 0, limit: int = 100, filtro: Optional[str] = None) -> List[ComissaoMembro]:
+    def _query_by_comissao(self, comissao_id: int, filtro: Optional[str], rank: bool):
         query = self.db.query(ComissaoMembro).filter(ComissaoMembro.comissao_id == comissao_id)
 
         if filtro:
-            query = query.join(MandatoVereador).join(Vereador).filter(
-                or_(
-                    Vereador.nome.ilike(f"%{filtro}%"),
-                    Vereador.partido.ilike(f"%{filtro}%")
-                )
-            )
+            query = query.join(MandatoVereador).join(Vereador)
+            query = apply_search(query, self.db, Vereador, ("nome", "partido"), filtro, rank=rank)
+        return query
 
-        return query.offset(skip).limit(limit).all()
+    def get_all_by_comissao_id(self, comissao_id: int, skip: int = 0, limit: int = 100, filtro: Optional[str] = None, cursor: Optional[str] = None, include_total: bool = True, estimate: bool = False, selecao: Optional[FieldSelection] = None) -> Page:
+        query = self._query_by_comissao(comissao_id, filtro, rank=cursor is None)
+        if selecao:
+            # Só as colunas (e os JOINs) dos campos pedidos
+            return paginate(query, ComissaoMembro.id, skip=skip, limit=limit, cursor=cursor, por_relevancia=bool(filtro),
+                            include_total=include_total, estimate=estimate, projecao=PUBLIC_PROJECTION.only(selecao.campos))
+        return paginate(query.options(*PUBLIC_LOAD), ComissaoMembro.id, skip=skip, limit=limit, cursor=cursor, por_relevancia=bool(filtro),
+                        include_total=include_total, estimate=estimate)
 
-    def count_by_comissao_id(self, comissao_id: int, filtro: Optional[str] = None) -> int:
-        query = self.db.query(ComissaoMembro).filter(ComissaoMembro.comissao_id == comissao_id)
+    def get_version_by_comissao_id(self, comissao_id: int, filtro: Optional[str] = None) -> tuple:
+        """Versão dos membros da comissão no filtro (ETag da listagem)."""
+        return PUBLIC_PROJECTION.version(self._query_by_comissao(comissao_id, filtro, rank=False))
 
-        if filtro:
-            query = query.join(MandatoVereador).join(Vereador).filter(
-                or_(
-                    Vereador.nome.ilike(f"%{filtro}%"),
-                    Vereador.partido.ilike(f"%{filtro}%")
-                )
-            )
-        
-        return query.count()
+    def stream_all_by_comissao_id(self, comissao_id: int, filtro: Optional[str] = None) -> Iterator[ComissaoMembroPublic]:
+        """Todos os membros da comissão, em ordem de id, lidos aos poucos (exportação)."""
+        query = self._query_by_comissao(comissao_id, filtro, rank=False).order_by(ComissaoMembro.id)
+        return PUBLIC_PROJECTION.stream(query)
 
     def create(self, obj_in: ComissaoMembroCreate) -> ComissaoMembro:
         db_obj = ComissaoMembro(**obj_in.model_dump())
         self.db.add(db_obj)
-        self.db.commit()
-        self.db.refresh(db_obj)
+        self.db.flush()
         return db_obj
 
     def update(self, db_obj: ComissaoMembro, obj_in: ComissaoMembroUpdate) -> ComissaoMembro:
@@ -53,13 +66,12 @@ class ComissaoMembroRepository:
             setattr(db_obj, field, value)
         
         self.db.add(db_obj)
-        self.db.commit()
-        self.db.refresh(db_obj)
+        self.db.flush()
         return db_obj
 
     def remove(self, id: int) -> Optional[ComissaoMembro]:
         db_obj = self.get_by_id(id)
         if db_obj:
             self.db.delete(db_obj)
-            self.db.commit()
+            self.db.flush()
         return db_obj
\ No newline at end of file
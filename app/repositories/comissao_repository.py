@@ -1,25 +1,38 @@
 # app/repositories/comissao_repository.py
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
+from app.db.fields import FieldSelection
+from app.db.pagination import Page, paginate
+from app.db.projection import Projection
+from app.db.search import apply_search
 from app.models.comissao_model import Comissao
-from app.schemas.comissao_schema import ComissaoCreate, ComissaoUpdate
+from app.schemas.comissao_schema import ComissaoCreate, ComissaoPublic, ComissaoUpdate
 from typing import List, Optional
 
+# Colunas do ComissaoPublic (versão da listagem)
+PUBLIC_PROJECTION = Projection(ComissaoPublic, Comissao)
+
 class ComissaoRepository:
     def get(self, db: Session, id: int) -> Optional[Comissao]:
         return db.query(Comissao).filter(Comissao.id == id).first()
 
-    def get_all_by_camara_id(self, db: Session, *, camara_id: int, skip: int = 0, limit: int = 100, filtro: Optional[str] = None) -> List[Comissao]:
+    def _query_by_camara(self, db: Session, camara_id: int, filtro: Optional[str], rank: bool):
         query = db.query(Comissao).filter(Comissao.camara_id == camara_id)
-        if filtro:
-            query = query.filter(Comissao.nome.ilike(f"%{filtro}%"))
-        return query.offset(skip).limit(limit).all()
+        return apply_search(query, db, Comissao, ("nome",), filtro, rank=rank)
+
+    def get_all_by_camara_id(self, db: Session, *, camara_id: int, skip: int = 0, limit: int = 100, filtro: Optional[str] = None, cursor: Optional[str] = None, include_total: bool = True, estimate: bool = False, selecao: Optional[FieldSelection] = None) -> Page:
+        query = self._query_by_camara(db, camara_id, filtro, rank=cursor is None)
+        return paginate(query, Comissao.id, skip=skip, limit=limit, cursor=cursor, por_relevancia=bool(filtro),
+                        include_total=include_total, estimate=estimate,
+                        projecao=PUBLIC_PROJECTION.only(selecao.campos) if selecao else None)
+
+    def get_version_by_camara_id(self, db: Session, *, camara_id: int, filtro: Optional[str] = None) -> tuple:
+        """Versão das comissões da câmara no filtro (ETag da listagem)."""
+        return PUBLIC_PROJECTION.version(self._query_by_camara(db, camara_id, filtro, rank=False))
 
     def create(self, db: Session, *, obj_in: ComissaoCreate) -> Comissao:
         db_obj = Comissao(**obj_in.model_dump())
         db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
+        db.flush()
         return db_obj
 
     def update(self, db: Session, *, db_obj: Comissao, obj_in: ComissaoUpdate) -> Comissao:
@@ -27,8 +40,7 @@ class ComissaoRepository:
         for field, value in update_data.items():
             setattr(db_obj, field, value)
         db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
+        db.flush()
         return db_obj
 
     def remove(self, db: Session, *, id: int) -> Optional[Comissao]:
@@ -36,13 +48,7 @@ class ComissaoRepository:
         if not db_obj:
             return None
         db.delete(db_obj)
-        db.commit()
+        db.flush()
         return db_obj
 
-    def count_by_camara_id(self, db: Session, *, camara_id: int, filtro: Optional[str] = None) -> int:
-        query = db.query(Comissao).filter(Comissao.camara_id == camara_id)
-        if filtro:
-            query = query.filter(Comissao.nome.ilike(f"%{filtro}%"))
-        return query.count()
-
 comissao_repository = ComissaoRepository()
@@ -1,10 +1,17 @@
 # votacao-backend/app/repositories/mandato_repository.py
-from sqlalchemy.orm import Session
-from sqlalchemy import or_
+from sqlalchemy import update
+from sqlalchemy.orm import Session, joinedload
 from typing import List, Optional
 
+from app.db.fields import FieldSelection
+from app.db.pagination import Page, paginate
+from app.db.projection import Projection
+from app.db.search import apply_search
 from app.models.mandato_model import Mandato
-from app.schemas.mandato_schema import MandatoCreate, MandatoUpdate
+from app.schemas.mandato_schema import MandatoCreate, MandatoPublic, MandatoUpdate
+
+# Colunas e relações do MandatoPublic (versão da listagem)
+PUBLIC_PROJECTION = Projection(MandatoPublic, Mandato)
 
 class MandatoRepository:
     def get(self, db: Session, id: int) -> Optional[Mandato]:
@@ -13,29 +20,29 @@ class MandatoRepository:
         """
         return db.query(Mandato).filter(Mandato.id == id).first()
 
-    def get_all_by_camara_id(self, db: Session, *, camara_id: int, skip: int = 0, limit: int = 100, filtro: Optional[str] = None) -> List[Mandato]:
-        """
-        Busca uma lista de mandatos de uma câmara, com paginação e filtro.
-        """
+    def _query_by_camara(self, db: Session, camara_id: int, filtro: Optional[str], rank: bool):
         query = db.query(Mandato).filter(Mandato.camara_id == camara_id)
 
-        if filtro:
-            # Filtra pela descrição do mandato
-            query = query.filter(Mandato.descricao.ilike(f"%{filtro}%"))
+        # Filtra pela descrição do mandato
+        return apply_search(query, db, Mandato, ("descricao",), filtro, rank=rank)
 
-        return query.offset(skip).limit(limit).all()
-
-    def count_by_camara_id(self, db: Session, *, camara_id: int, filtro: Optional[str] = None) -> int:
+    def get_all_by_camara_id(self, db: Session, *, camara_id: int, skip: int = 0, limit: int = 100, filtro: Optional[str] = None, cursor: Optional[str] = None, include_total: bool = True, estimate: bool = False, selecao: Optional[FieldSelection] = None) -> Page:
         """
-        Conta o número total de mandatos para uma câmara específica,
-        aplicando o filtro se fornecido.
+        Busca uma lista de mandatos de uma câmara, com paginação e filtro. Com
+        `selecao`, lê por projeção só as colunas (e os JOINs) dos campos pedidos.
         """
-        query = db.query(Mandato).filter(Mandato.camara_id == camara_id)
+        query = self._query_by_camara(db, camara_id, filtro, rank=cursor is None)
+        if selecao:
+            return paginate(query, Mandato.id, skip=skip, limit=limit, cursor=cursor, por_relevancia=bool(filtro),
+                            include_total=include_total, estimate=estimate, projecao=PUBLIC_PROJECTION.only(selecao.campos))
+
+        # MandatoPublic inclui a câmara
+        return paginate(query.options(joinedload(Mandato.camara)), Mandato.id, skip=skip, limit=limit, cursor=cursor, por_relevancia=bool(filtro),
+                        include_total=include_total, estimate=estimate)
 
-        if filtro:
-            query = query.filter(Mandato.descricao.ilike(f"%{filtro}%"))
-            
-        return query.count()
+    def get_version_by_camara_id(self, db: Session, *, camara_id: int, filtro: Optional[str] = None) -> tuple:
+        """Versão dos mandatos da câmara no filtro (ETag da listagem)."""
+        return PUBLIC_PROJECTION.version(self._query_by_camara(db, camara_id, filtro, rank=False))
 
     def create(self, db: Session, *, obj_in: MandatoCreate) -> Mandato:
         """
@@ -45,8 +52,7 @@ class MandatoRepository:
         db_obj = Mandato(**db_obj_data)
         
         db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
+        db.flush()
         return db_obj
 
     def update(self, db: Session, *, db_obj: Mandato, obj_in: MandatoUpdate) -> Mandato:
@@ -58,8 +64,7 @@ class MandatoRepository:
             setattr(db_obj, field, value)
         
         db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
+        db.flush()
         return db_obj
 
     def remove(self, db: Session, *, id: int) -> Optional[Mandato]:
@@ -71,25 +76,24 @@ class MandatoRepository:
             return None
         
         db.delete(db_obj)
-        db.commit()
+        db.flush()
         return db_obj
 
     def deactivate_all_active_by_camara(self, db: Session, *, camara_id: int, exclude_id: Optional[int] = None):
         """
         Desativa todos os mandatos ativos de uma câmara, opcionalmente excluindo um ID.
+
+        Um único UPDATE, na transação de quem chama; os mandatos já carregados
+        na sessão são atualizados junto. O índice único parcial
+        `ux_mandato_camara_id_ativo` impede dois mandatos ativos mesmo com
+        ativações concorrentes.
         """
-        query = db.query(Mandato).filter(Mandato.camara_id == camara_id, Mandato.ativo == True)
-        
+        stmt = update(Mandato).where(Mandato.camara_id == camara_id, Mandato.ativo == True)
+
         if exclude_id:
-            query = query.filter(Mandato.id != exclude_id)
-            
-        mandatos_to_deactivate = query.all()
-        
-        for mandato in mandatos_to_deactivate:
-            mandato.ativo = False
-            db.add(mandato)
-        
-        db.commit()
+            stmt = stmt.where(Mandato.id != exclude_id)
+
+        db.execute(stmt.values(ativo=False))
 
 
 # Instância única do repositório para ser usada em toda a aplicação
@@ -1,11 +1,25 @@
 # app/repositories/mandato_vereador_repository.py
-from sqlalchemy.orm import Session
+from sqlalchemy import insert
+from sqlalchemy.orm import Session, joinedload
 from app.models.vereador_model import Vereador
 from app.models.mandato_model import Mandato
 from app.models.mandato_vereador_model import MandatoVereador
-from app.schemas.mandato_vereador_schema import MandatoVereadorBase, MandatoVereadorUpdate
+from app.schemas.mandato_vereador_schema import MandatoVereadorBase, MandatoVereadorPublic, MandatoVereadorUpdate
 from typing import List, Optional
-from sqlalchemy import or_
+from app.db.fields import FieldSelection
+from app.db.pagination import Page, paginate
+from app.db.projection import Projection
+from app.db.search import apply_search
+
+# Perfil de carregamento do MandatoVereadorPublic: vereador e mandato (com a
+# câmara do MandatoPublic) vêm na mesma consulta, em vez de um SELECT por linha
+PUBLIC_LOAD = (
+    joinedload(MandatoVereador.vereador),
+    joinedload(MandatoVereador.mandato).joinedload(Mandato.camara),
+)
+
+# Mesmo conteúdo do MandatoVereadorPublic, lido por projeção (sem instâncias ORM)
+PUBLIC_PROJECTION = Projection(MandatoVereadorPublic, MandatoVereador)
 
 class MandatoVereadorRepository:
     def __init__(self, db: Session):
@@ -13,41 +27,43 @@ class MandatoVereadorRepository:
     
     def get_by_id(self, id: int) -> Optional[MandatoVereador]:
         """Busca uma associação pelo seu ID."""
-        return self.db.query(MandatoVereador).filter(MandatoVereador.id == id).first()
-    
-    def get_by_vereador_and_mandato(self, *, vereador_id: int, mandato_id: int) -> Optional[MandatoVereador]:
-        """Busca uma associação específica pelo ID do vereador e do mandato."""
-        return self.db.query(MandatoVereador).filter(
-            MandatoVereador.vereador_id == vereador_id,
-            MandatoVereador.mandato_id == mandato_id
-        ).first()
+        return self.db.query(MandatoVereador).options(*PUBLIC_LOAD).filter(MandatoVereador.id == id).first()
     
-    def get_all_by_mandato_id(self, mandato_id: int, skip: int = 0, limit: int = 100, filtro: Optional[str] = None) -> List[MandatoVereador]:
-        """Busca todas as associações de um mandato, com filtro e paginação."""
-        query = self.db.query(MandatoVereador).filter(MandatoVereador.mandato_id == mandato_id)
+    def get_vereador_ids_by_mandato(self, *, mandato_id: int, vereador_ids: List[int]) -> set[int]:
+        """Dentre os vereadores informados, os que já estão associados ao mandato."""
+        if not vereador_ids:
+            return set()
+        rows = self.db.query(MandatoVereador.vereador_id).filter(
+            MandatoVereador.mandato_id == mandato_id,
+            MandatoVereador.vereador_id.in_(vereador_ids)
+        )
+        return {row.vereador_id for row in rows}
 
+    def _query_by_mandato(self, mandato_id: int, filtro: Optional[str], rank: bool):
+        query = self.db.query(MandatoVereador).filter(MandatoVereador.mandato_id == mandato_id)
         if filtro:
             query = query.join(Vereador, MandatoVereador.vereador_id == Vereador.id)
-            query = query.filter(
-                or_(
-                    Vereador.nome.ilike(f"%{filtro}%"),
-                    Vereador.email.ilike(f"%{filtro}%")
-                )
-            )
+            query = apply_search(query, self.db, Vereador, ("nome", "email"), filtro, rank=rank)
+        return query
 
-        return query.offset(skip).limit(limit).all()
-    
-    
-    def get_all(
-        self, 
-        db: Session, 
-        *,
-        camara_id: Optional[int] = None,
-        mandato_ativo: Optional[bool] = None
-    ) -> List[MandatoVereador]:
+    def get_all_by_mandato_id(self, mandato_id: int, skip: int = 0, limit: int = 100, filtro: Optional[str] = None, cursor: Optional[str] = None, include_total: bool = True, estimate: bool = False, selecao: Optional[FieldSelection] = None) -> Page:
         """
-        Busca genérica de associações com filtros opcionais.
+        Busca todas as associações de um mandato, com filtro e paginação. Com
+        `selecao`, lê por projeção só as colunas (e os JOINs) dos campos pedidos.
         """
+        query = self._query_by_mandato(mandato_id, filtro, rank=cursor is None)
+        if selecao:
+            return paginate(query, MandatoVereador.id, skip=skip, limit=limit, cursor=cursor, por_relevancia=bool(filtro),
+                            include_total=include_total, estimate=estimate, projecao=PUBLIC_PROJECTION.only(selecao.campos))
+        return paginate(query.options(*PUBLIC_LOAD), MandatoVereador.id, skip=skip, limit=limit, cursor=cursor, por_relevancia=bool(filtro),
+                        include_total=include_total, estimate=estimate)
+
+    def get_version_by_mandato_id(self, mandato_id: int, filtro: Optional[str] = None) -> tuple:
+        """Versão das associações do mandato no filtro (ETag da listagem)."""
+        return PUBLIC_PROJECTION.version(self._query_by_mandato(mandato_id, filtro, rank=False))
+    
+    
+    def _query_all(self, db: Session, camara_id: Optional[int], mandato_ativo: Optional[bool]):
         query = db.query(MandatoVereador)
         
         # Se filtros relacionados ao mandato forem fornecidos, faz o JOIN
@@ -59,18 +75,56 @@ class MandatoVereadorRepository:
             
             if mandato_ativo is not None:
                 query = query.filter(Mandato.ativo == mandato_ativo)
+        return query
 
-        return query.all()
+    def get_all(
+        self, 
+        db: Session, 
+        *,
+        camara_id: Optional[int] = None,
+        mandato_ativo: Optional[bool] = None,
+        projetar: bool = False,
+        selecao: Optional[FieldSelection] = None
+    ) -> List[MandatoVereador]:
+        """
+        Busca genérica de associações com filtros opcionais. Com `projetar`,
+        devolve schemas MandatoVereadorPublic montados direto das colunas; com
+        `selecao`, só as colunas dos campos pedidos.
+        """
+        query = self._query_all(db, camara_id, mandato_ativo)
+
+        if projetar or selecao:
+            # A projeção faz os próprios JOINs das relações do schema
+            projecao = PUBLIC_PROJECTION.only(selecao.campos) if selecao else PUBLIC_PROJECTION
+            return projecao.build_all(projecao.apply(query).all())
+        return query.options(*PUBLIC_LOAD).all()
+
+    def get_version(self, db: Session, *, camara_id: Optional[int] = None, mandato_ativo: Optional[bool] = None) -> tuple:
+        """Versão das associações dos filtros (ETag de get_all)."""
+        return PUBLIC_PROJECTION.version(self._query_all(db, camara_id, mandato_ativo))
     
 
     def create(self, obj_in: MandatoVereadorBase) -> MandatoVereador:
         """Cria uma nova associação no banco de dados."""
         db_obj = MandatoVereador(**obj_in.model_dump())
         self.db.add(db_obj)
-        self.db.commit()
-        self.db.refresh(db_obj)
+        self.db.flush()
         return db_obj
 
+    def create_many(self, objs_in: List[MandatoVereadorBase]) -> dict[int, int]:
+        """
+        Cria várias associações (de um mesmo mandato) com INSERTs de várias
+        linhas e devolve o id de cada associação, indexado pelo id do vereador.
+        """
+        if not objs_in:
+            return {}
+        self.db.execute(insert(MandatoVereador), [obj.model_dump() for obj in objs_in])
+        rows = self.db.query(MandatoVereador.id, MandatoVereador.vereador_id).filter(
+            MandatoVereador.mandato_id == objs_in[0].mandato_id,
+            MandatoVereador.vereador_id.in_([obj.vereador_id for obj in objs_in])
+        )
+        return {row.vereador_id: row.id for row in rows}
+
     def update(self, db_obj: MandatoVereador, obj_in: MandatoVereadorUpdate) -> MandatoVereador:
         """Atualiza uma associação existente."""
         update_data = obj_in.model_dump(exclude_unset=True)
@@ -78,8 +132,7 @@ class MandatoVereadorRepository:
             setattr(db_obj, field, value)
         
         self.db.add(db_obj)
-        self.db.commit()
-        self.db.refresh(db_obj)
+        self.db.flush()
         return db_obj
 
     def remove(self, id: int) -> Optional[MandatoVereador]:
@@ -87,19 +140,6 @@ class MandatoVereadorRepository:
         db_obj = self.get_by_id(id)
         if db_obj:
             self.db.delete(db_obj)
-            self.db.commit()
+            self.db.flush()
         return db_obj
         
-    def count_by_mandato_id(self, mandato_id: int, filtro: Optional[str] = None) -> int:
-        """Conta o total de associações para um mandato, com filtro."""
-        query = self.db.query(MandatoVereador).filter(MandatoVereador.mandato_id == mandato_id)
-        
-        if filtro:
-            query = query.join(Vereador, MandatoVereador.vereador_id == Vereador.id)
-            query = query.filter(
-                or_(
-                    Vereador.nome.ilike(f"%{filtro}%"),
-                    Vereador.email.ilike(f"%{filtro}%")
-                )
-            )
-        return query.count()
\ No newline at end of file
@@ -0,0 +1,39 @@
+# app/repositories/refresh_token_repository.py
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.orm import Session
+
+from app.models.refresh_token_model import RefreshToken
+from app.models.usuario_model import Usuario
+
+class RefreshTokenRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def create(self, *, usuario_id: int, token_hash: str, familia: str, token_version: int, expira_em: datetime) -> None:
+        self.db.execute(insert(RefreshToken).values(
+            usuario_id=usuario_id, token_hash=token_hash, familia=familia,
+            token_version=token_version, expira_em=expira_em, revogado=False
+        ))
+
+    def get_with_usuario(self, token_hash: str) -> Optional[tuple[RefreshToken, Usuario]]:
+        """Token e usuário dono numa única consulta (índice único do hash)."""
+        stmt = select(RefreshToken, Usuario).join(Usuario, Usuario.id == RefreshToken.usuario_id).where(
+            RefreshToken.token_hash == token_hash
+        )
+        return self.db.execute(stmt).tuples().first()
+
+    def mark_used(self, id: int, agora: datetime) -> bool:
+        """Marca o token como usado; False se outra requisição o usou antes."""
+        stmt = update(RefreshToken).where(
+            RefreshToken.id == id, RefreshToken.usado_em.is_(None), RefreshToken.revogado == False
+        ).values(usado_em=agora)
+        return self.db.execute(stmt).rowcount == 1
+
+    def revoke_family(self, familia: str) -> None:
+        self.db.execute(update(RefreshToken).where(RefreshToken.familia == familia).values(revogado=True))
+
+    def delete_expired(self, usuario_id: int, agora: datetime) -> None:
+        self.db.execute(delete(RefreshToken).where(RefreshToken.usuario_id == usuario_id, RefreshToken.expira_em < agora))
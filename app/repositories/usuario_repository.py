@@ -1,9 +1,16 @@
 # app/repositories/usuario_repository.py
+from sqlalchemy import select, update
 from sqlalchemy.orm import Session
 from app.models.usuario_model import Usuario
-from app.schemas.usuario_schema import UsuarioCreate, UsuarioUpdate
+from app.schemas.usuario_schema import Usuario as UsuarioSchema, UsuarioCreate, UsuarioUpdate
 from typing import List, Optional
-from sqlalchemy import or_
+from app.db.fields import FieldSelection
+from app.db.pagination import Page, paginate
+from app.db.projection import Projection
+from app.db.search import apply_search
+
+# Colunas do schema Usuario, para a listagem com seleção de campos
+USUARIO_PROJECTION = Projection(UsuarioSchema, Usuario)
 
 class UsuarioRepository:
     def __init__(self, db: Session):
@@ -14,20 +21,28 @@ class UsuarioRepository:
     
     def get_by_id(self, id: int) -> Usuario | None:
         return self.db.query(Usuario).filter(Usuario.id == id).first()
+
+    def get_token_versions(self) -> dict[int, int]:
+        """Versão dos tokens dos usuários que já tiveram tokens revogados."""
+        stmt = select(Usuario.id, Usuario.token_version).where(Usuario.token_version > 0)
+        return dict(self.db.execute(stmt).all())
+
+    def increment_token_version(self, usuario_id: int) -> Optional[int]:
+        """Incrementa a versão dos tokens no banco e devolve a nova (None se o usuário não existe)."""
+        stmt = update(Usuario).where(Usuario.id == usuario_id).values(token_version=Usuario.token_version + 1)
+        if self.db.execute(stmt).rowcount == 0:
+            return None
+        return self.db.execute(select(Usuario.token_version).where(Usuario.id == usuario_id)).scalar_one()
     
     
-    def get_all(self, skip: int = 0, limit: int = 100, filtro: Optional[str] = None) -> list[Usuario]:
+    def get_all(self, skip: int = 0, limit: int = 100, filtro: Optional[str] = None, cursor: Optional[str] = None, include_total: bool = True, estimate: bool = False, selecao: Optional[FieldSelection] = None) -> Page:
         query = self.db.query(Usuario).filter(Usuario.is_superuser == True)
 
-        if filtro:
-            query = query.filter(
-                or_(
-                    Usuario.email.ilike(f"%{filtro}%"),
-                    Usuario.nome.ilike(f"%{filtro}%")
-                )
-            )
+        query = apply_search(query, self.db, Usuario, ("email", "nome"), filtro, rank=cursor is None)
 
-        return query.offset(skip).limit(limit).all()
+        return paginate(query, Usuario.id, skip=skip, limit=limit, cursor=cursor, por_relevancia=bool(filtro),
+                        include_total=include_total, estimate=estimate,
+                        projecao=USUARIO_PROJECTION.only(selecao.campos) if selecao else None)
     
     
     
@@ -40,8 +55,7 @@ class UsuarioRepository:
             senha_hash=hashed_password
         )
         self.db.add(db_usuario)
-        self.db.commit()
-        self.db.refresh(db_usuario)
+        self.db.flush()
         return db_usuario
     
     def update(self, db_obj: Usuario, obj_in: UsuarioUpdate, hashed_password: Optional[str] = None) -> Usuario:
@@ -55,22 +69,5 @@ class UsuarioRepository:
             setattr(db_obj, field, value)
         
         self.db.add(db_obj)
-        self.db.commit()
-        self.db.refresh(db_obj)
+        self.db.flush()
         return db_obj
-
-    
-    
-
-
-    def count(self, filtro: Optional[str] = None) -> int:
-        query = self.db.query(Usuario).filter(Usuario.is_superuser == True)
-
-        if filtro:
-            query = query.filter(
-                or_(
-                    Usuario.email.ilike(f"%{filtro}%"),
-                    Usuario.nome.ilike(f"%{filtro}%")
-                )
-            )
-        return query.count()
\ No newline at end of file
@@ -1,35 +1,38 @@
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from app.models.vereador_model import Vereador
-from app.schemas.vereador_schema import VereadorCreate, VereadorUpdate, PaginatedVereadorResponse
-from typing import List, Optional
-from sqlalchemy import or_
+from app.schemas.vereador_schema import Vereador as VereadorSchema, VereadorCreate, VereadorUpdate, PaginatedVereadorResponse
+from typing import Iterator, List, Optional
+from app.db.fields import FieldSelection
+from app.db.pagination import Page, paginate
+from app.db.projection import Projection
+from app.db.search import apply_search
+
+# Colunas do schema Vereador, para a listagem sem instâncias ORM
+VEREADOR_PROJECTION = Projection(VereadorSchema, Vereador)
 
 class VereadorRepository:
     def __init__(self, db: Session):
         self.db = db
 
-    def get_all(self, skip: int = 0, limit: int = 100, filtro: Optional[str] = None) -> PaginatedVereadorResponse:
+    def _query(self, filtro: Optional[str], rank: bool):
         query = self.db.query(Vereador)
-        if filtro:
-            query = query.filter(
-                or_(
-                    Vereador.nome.ilike(f"%{filtro}%"),
-                    Vereador.email.ilike(f"%{filtro}%")
-                )
-            )
-        return query.offset(skip).limit(limit).all()
+        return apply_search(query, self.db, Vereador, ("nome", "email"), filtro, rank=rank)
+
+    def get_all(self, skip: int = 0, limit: int = 100, filtro: Optional[str] = None, cursor: Optional[str] = None, include_total: bool = True, estimate: bool = False, projetar: bool = False, selecao: Optional[FieldSelection] = None) -> Page:
+        query = self._query(filtro, rank=cursor is None)
+        return paginate(query, Vereador.id, skip=skip, limit=limit, cursor=cursor, por_relevancia=bool(filtro),
+                        include_total=include_total, estimate=estimate,
+                        projecao=VEREADOR_PROJECTION.only(selecao.campos) if selecao else (VEREADOR_PROJECTION if projetar else None))
     
-    def count(self, filtro: Optional[str] = None) -> int:
-        query = self.db.query(Vereador)
-        if filtro:
-            query = query.filter(
-                or_(
-                    Vereador.nome.ilike(f"%{filtro}%"),
-                    Vereador.email.ilike(f"%{filtro}%")
-                )
-            )
-        return query.count()
+    def get_version(self, filtro: Optional[str] = None) -> tuple:
+        """Versão dos vereadores do filtro (ETag da listagem)."""
+        return VEREADOR_PROJECTION.version(self._query(filtro, rank=False))
 
+    def stream_all(self, filtro: Optional[str] = None) -> Iterator[VereadorSchema]:
+        """Todos os vereadores do filtro, em ordem de id, lidos aos poucos (exportação)."""
+        return VEREADOR_PROJECTION.stream(self._query(filtro, rank=False).order_by(Vereador.id))
+    
     def get_by_email(self, email: str) -> Vereador | None:
         return self.db.query(Vereador).filter(Vereador.email == email).first()
     
@@ -38,12 +41,38 @@ class VereadorRepository:
     
     def get_by_cpf(self, cpf: str) -> Vereador | None:
         return self.db.query(Vereador).filter(Vereador.cpf == cpf).first()
+
+    def get_by_ids(self, ids: List[int]) -> List[Vereador]:
+        if not ids:
+            return []
+        return self.db.query(Vereador).filter(Vereador.id.in_(ids)).all()
+
+    def get_by_emails(self, emails: List[str]) -> List[Vereador]:
+        if not emails:
+            return []
+        return self.db.query(Vereador).filter(Vereador.email.in_(emails)).all()
+
+    def get_by_cpfs(self, cpfs: List[str]) -> List[Vereador]:
+        if not cpfs:
+            return []
+        return self.db.query(Vereador).filter(Vereador.cpf.in_(cpfs)).all()
+
+    def create_many(self, vereadores: List[VereadorCreate]) -> dict[str, int]:
+        """
+        Insere vários vereadores com INSERTs de várias linhas e devolve o id de
+        cada um, indexado pelo e-mail (relido numa única consulta, já que o
+        MySQL não tem RETURNING).
+        """
+        if not vereadores:
+            return {}
+        self.db.execute(insert(Vereador), [v.model_dump(exclude={"id"}) for v in vereadores])
+        emails = [v.email for v in vereadores]
+        return {v.email: v.id for v in self.db.query(Vereador.id, Vereador.email).filter(Vereador.email.in_(emails))}
     
     def create(self, vereador_create: VereadorCreate) -> Vereador:
         vereador_create = Vereador(**vereador_create.model_dump())
         self.db.add(vereador_create)
-        self.db.commit()
-        self.db.refresh(vereador_create)
+        self.db.flush()
 
         return vereador_create
     
@@ -53,8 +82,5 @@ class VereadorRepository:
             setattr(db_obj, field, value)
         
         self.db.add(db_obj)
-        self.db.commit()
-        self.db.refresh(db_obj)
+        self.db.flush()
         return db_obj
-    
-        
\ No newline at end of file
@@ -52,7 +52,8 @@ class Camara(CamaraInDB):
 
 class PaginatedCamaraResponse(BaseModel):
     items: List[Camara]
-    total: int
+    total: Optional[int] = None
+    next_cursor: Optional[str] = None
 
 class CamaraSimple(BaseModel):
     """Schema simplificado para retornar dados básicos da Câmara."""
@@ -59,4 +59,5 @@ class CamaraUsuarioPublic(CamaraUsuarioBase):
 
 class PaginatedCamaraUsuarioResponse(BaseModel):
     items: List[CamaraUsuarioPublic]
-    total: int
\ No newline at end of file
+    total: Optional[int] = None
+    next_cursor: Optional[str] = None
\ No newline at end of file
@@ -38,6 +38,7 @@ class ComissaoMembroUpdate(BaseModel):
 
 class ComissaoMembroPublic(ComissaoMembroBase):
     id: int
+    dt_atualizado: Optional[datetime] = None
     comissao: ComissaoPublic
     mandato_vereador: MandatoVereadorPublic
 
@@ -64,4 +65,5 @@ class ComissaoMembroPublic(ComissaoMembroBase):
 
 class PaginatedComissaoMembroResponse(BaseModel):
     items: List[ComissaoMembroPublic]
-    total: int
\ No newline at end of file
+    total: Optional[int] = None
+    next_cursor: Optional[str] = None
\ No newline at end of file
@@ -27,6 +27,7 @@ class ComissaoUpdate(BaseModel):
 class ComissaoPublic(ComissaoBase):
     id: int
     dt_cadastro: datetime
+    dt_atualizado: Optional[datetime] = None
 
     # Correção 1: Redefinimos 'ativa' como 'int' para a saída da API.
     # Isto corrige o erro do Pydantic, pois o validador agora encontra
@@ -69,5 +70,6 @@ class ComissaoPublic(ComissaoBase):
 # Schema para a resposta paginada
 class PaginatedComissaoResponse(BaseModel):
     items: List[ComissaoPublic]
-    total: int
+    total: Optional[int] = None
+    next_cursor: Optional[str] = None
 
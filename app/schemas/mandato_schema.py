@@ -69,7 +69,8 @@ class MandatoPublic(MandatoBase):
 # Schema para a resposta paginada
 class PaginatedMandatoResponse(BaseModel):
     items: List[MandatoPublic]
-    total: int
+    total: Optional[int] = None
+    next_cursor: Optional[str] = None
     
 class MensagemResposta(BaseModel):
     detalhe: str
@@ -1,5 +1,6 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Optional, List
+from datetime import datetime
 
 from app.schemas.vereador_schema import VereadorCreate, VereadorPublic
 from app.schemas.mandato_schema import MandatoPublic
@@ -36,6 +37,7 @@ class MandatoVereadorUpdate(BaseModel):
 class MandatoVereadorPublic(MandatoVereadorBase):
     id: int
     funcao: int
+    dt_atualizado: Optional[datetime] = None
     vereador: VereadorPublic
     mandato: MandatoPublic
     class Config:
@@ -43,5 +45,33 @@ class MandatoVereadorPublic(MandatoVereadorBase):
 
 class PaginatedMandatoVereadorResponse(BaseModel):
     items: List[MandatoVereadorPublic]
-    total: int
+    total: Optional[int] = None
+    next_cursor: Optional[str] = None
 
+
+# ------------------- Importação em lote -------------------
+
+# Limite de linhas por requisição de importação
+IMPORT_MAX_ITENS = 1000
+
+class MandatoVereadorImportItem(BaseModel):
+    funcao: int
+    vereador: Optional[VereadorCreate] = None
+    vereador_id: Optional[int] = None
+
+class MandatoVereadorImport(BaseModel):
+    mandato_id: int
+    itens: List[MandatoVereadorImportItem] = Field(..., min_length=1, max_length=IMPORT_MAX_ITENS)
+
+class MandatoVereadorImportResult(BaseModel):
+    linha: int  # posição do item em `itens`, a partir de 0
+    status: str  # "criado", "associado" ou "erro"
+    vereador_id: Optional[int] = None
+    mandato_vereador_id: Optional[int] = None
+    mensagem: Optional[str] = None
+
+class MandatoVereadorImportResponse(BaseModel):
+    criados: int
+    associados: int
+    erros: int
+    resultados: List[MandatoVereadorImportResult]
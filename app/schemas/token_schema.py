@@ -1,6 +1,6 @@
 # app/schemas/token_schema.py
 from pydantic import BaseModel
-from typing import Optional, List
+from typing import Optional, List, Dict
 from app.schemas.usuario_schema import UsuarioPublic
 from app.schemas.camara_schema import CamaraSimple
 
@@ -8,9 +8,26 @@ class Token(BaseModel):
     access_token: str
     token_type: str
 
-class TokenData(BaseModel):
-    email: str | None = None
+class CamaraClaims(BaseModel):
+    papel: int
+    permissao_mask: int = 0  # permissões compiladas (app/core/permissions.py)
+
+class Principal(BaseModel):
+    """
+    Usuário autenticado, montado só com as claims do access token (sem
+    consulta ao banco): identificação, superusuário e papel/permissões em
+    cada câmara ativa.
+    """
+    id: int
+    email: str
+    is_superuser: bool = False
+    camaras: Dict[int, CamaraClaims] = {}
+    token_version: int = 0
 
 class TokenComUsuario(Token):
+    refresh_token: str
     usuario: UsuarioPublic
-    camaras: Optional[List[CamaraSimple]] = None
\ No newline at end of file
+    camaras: Optional[List[CamaraSimple]] = None
+
+class RefreshTokenRequest(BaseModel):
+    refresh_token: str
\ No newline at end of file
@@ -111,4 +111,5 @@ class Usuario(UsuarioPublic):
 
 class PaginatedUsuarioResponse(BaseModel):
     items: List[Usuario]
-    total: int
\ No newline at end of file
+    total: Optional[int] = None
+    next_cursor: Optional[str] = None
\ No newline at end of file
@@ -81,4 +81,5 @@ class Vereador(VereadorPublic):
 
 class PaginatedVereadorResponse(BaseModel):
     items: List[Vereador]
-    total: int
\ No newline at end of file
+    total: Optional[int] = None
+    next_cursor: Optional[str] = None
\ No newline at end of file
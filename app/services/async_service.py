@@ -0,0 +1,32 @@
+# app/services/async_service.py
+from typing import Any, Callable, Optional
+
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.serialization import get_adapter
+
+
+async def run_service(
+    db: AsyncSession,
+    fn: Callable[[Session], Any],
+    response_model: Optional[Any] = None
+) -> Any:
+    """
+    Executa uma chamada dos serviços/repositórios síncronos sobre uma AsyncSession.
+
+    A função recebe a Session síncrona que a AsyncSession expõe via run_sync, de modo
+    que as mesmas consultas são reaproveitadas nos dois modos, mas o I/O passa pelo
+    driver assíncrono sem bloquear o event loop. O restante da chamada (montagem da
+    consulta, leitura das linhas, conversão) roda na thread do loop.
+
+    Se `response_model` for informado, o resultado é convertido para o schema ainda
+    dentro da sessão, pois relacionamentos lazy não podem ser carregados fora dela.
+    """
+    def _call(session: Session) -> Any:
+        result = fn(session)
+        if response_model is not None:
+            return get_adapter(response_model).validate_python(result, from_attributes=True)
+        return result
+
+    return await db.run_sync(_call)
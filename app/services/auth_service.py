@@ -0,0 +1,128 @@
+# app/services/auth_service.py
+import hashlib
+import secrets
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy.orm import Session
+
+from app.core.cache import MemoryCache
+from app.core.config import settings
+from app.core.security import create_user_access_token
+from app.db.unit_of_work import transactional
+from app.repositories.camara_usuario_repository import camara_usuario_repository
+from app.repositories.refresh_token_repository import RefreshTokenRepository
+
+# Dados do login por usuário (câmaras da resposta e claims do token), para
+# que logins seguidos não releiam as associações. Invalidado quando as
+# associações, o usuário ou as câmaras mudam.
+login_cache = MemoryCache(settings.LOGIN_CACHE_MAXSIZE, settings.LOGIN_CACHE_TTL_SECONDS, "login")
+
+
+def _agora() -> datetime:
+    # As datas dos refresh tokens são gravadas em UTC, sem fuso (TIMESTAMP)
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+def _hash_refresh_token(refresh_token: str) -> str:
+    # O token é aleatório (256 bits): SHA-256 basta, sem o custo do bcrypt
+    return hashlib.sha256(refresh_token.encode()).hexdigest()
+
+def _refresh_token_exception() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Refresh token inválido ou expirado",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+class AuthService:
+    def __init__(self, db: Session):
+        self.db = db
+        self.repository = camara_usuario_repository
+        self.refresh_repo = RefreshTokenRepository(db)
+
+    def get_session_bootstrap(self, usuario) -> dict:
+        """
+        Câmaras ativas do usuário para a resposta do login (`camaras`) e para
+        as claims do token (`cam`: papel e máscara de permissões por câmara).
+        Lidas numa única consulta, só com as colunas usadas, e guardadas no
+        login_cache. Superusuários não têm câmaras associadas.
+        """
+        if usuario.is_superuser:
+            return {"camaras": None, "cam": {}}
+
+        bootstrap = login_cache.get(usuario.id) if login_cache.enabled else None
+        if bootstrap is None:
+            linhas = self.repository.get_active_by_usuario_id(self.db, usuario_id=usuario.id)
+            bootstrap = {
+                "camaras": [{"id": linha.camara_id, "nome": linha.camara_nome} for linha in linhas],
+                "cam": {str(linha.camara_id): [linha.papel, linha.permissao_mask or 0] for linha in linhas},
+            }
+            if login_cache.enabled:
+                login_cache.set(usuario.id, bootstrap)
+        return bootstrap
+
+    @transactional
+    def create_session(self, usuario, familia: Optional[str] = None) -> dict:
+        """
+        Resposta do login e do refresh: access token, um novo refresh token,
+        o usuário e as suas câmaras. Sem `familia` (login), inicia uma nova
+        cadeia de rotações.
+        """
+        bootstrap = self.get_session_bootstrap(usuario)
+
+        # Se o utilizador NÃO for um super admin, precisa de alguma câmara ativa
+        if not usuario.is_superuser and not bootstrap["camaras"]:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN, # 403 Forbidden é o código correto para este caso
+                detail="Acesso negado. Você não está associado a nenhuma câmara ativa.",
+            )
+
+        agora = _agora()
+        if familia is None:
+            familia = secrets.token_hex(16)
+            # Login: remove os refresh tokens já vencidos do usuário
+            self.refresh_repo.delete_expired(usuario.id, agora)
+
+        refresh_token = secrets.token_urlsafe(32)
+        self.refresh_repo.create(
+            usuario_id=usuario.id,
+            token_hash=_hash_refresh_token(refresh_token),
+            familia=familia,
+            token_version=usuario.token_version or 0,
+            expira_em=agora + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS),
+        )
+
+        return {
+            "access_token": create_user_access_token(usuario, bootstrap["cam"]),
+            "token_type": "bearer",
+            "refresh_token": refresh_token,
+            "usuario": usuario,
+            "camaras": bootstrap["camaras"],
+        }
+
+    @transactional
+    def refresh(self, refresh_token: str) -> dict:
+        """
+        Troca um refresh token válido por um novo par de tokens (rotação), sem
+        senha nem bcrypt: uma consulta pelo hash do token, que traz o usuário.
+        """
+        linha = self.refresh_repo.get_with_usuario(_hash_refresh_token(refresh_token))
+        if linha is None:
+            raise _refresh_token_exception()
+        token, usuario = linha
+
+        agora = _agora()
+        # Revogado, vencido ou emitido antes de uma revogação dos tokens do usuário
+        if token.revogado or token.expira_em < agora or token.token_version != (usuario.token_version or 0):
+            raise _refresh_token_exception()
+
+        if token.usado_em is not None or not self.refresh_repo.mark_used(token.id, agora):
+            # Reuso de um token já trocado: ele vazou (ou foi enviado duas vezes).
+            # Revoga a família inteira e confirma antes de responder 401
+            self.refresh_repo.revoke_family(token.familia)
+            self.db.commit()
+            raise _refresh_token_exception()
+
+        return self.create_session(usuario, familia=token.familia)
@@ -1,11 +1,15 @@
 # app/services/camera_service.py
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
+from app.db.fields import FieldSelection
+from app.db.unit_of_work import transactional
 from app.repositories.camara_repository import camara_repository
 from app.schemas.camara_schema import CamaraCreate, CamaraUpdate
+from app.services.auth_service import login_cache
 from typing import Optional
 
 class CamaraService:
+    @transactional
     def create_camara(self, db: Session, camara: CamaraCreate):
         return camara_repository.create(db=db, obj_in=camara)
 
@@ -15,20 +19,26 @@ class CamaraService:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Camara não encontrada")
         return db_camara
 
-    def get_all_camaras(self, db: Session, skip: int, limit: int,  filtro: Optional[str] = None):
-        return camara_repository.get_multi(db, skip=skip, limit=limit, filtro=filtro)
+    def get_all_camaras(self, db: Session, skip: int, limit: int,  filtro: Optional[str] = None, cursor: Optional[str] = None, include_total: bool = True, estimate: bool = False, selecao: Optional[FieldSelection] = None):
+        return camara_repository.get_multi(db, skip=skip, limit=limit, filtro=filtro, cursor=cursor,
+                                           include_total=include_total, estimate=estimate, projetar=True, selecao=selecao)
 
+    def get_camaras_version(self, db: Session, filtro: Optional[str] = None):
+        return camara_repository.get_version(db, filtro=filtro)
+
+    @transactional
     def update_camara(self, db: Session, camara_id: int, camara_update: CamaraUpdate):
         db_camara = self.get_camara(db, camara_id)
+        # O nome da câmara vai na resposta do login de cada usuário associado
+        login_cache.clear_on_commit(db)
         return camara_repository.update(db=db, db_obj=db_camara, obj_in=camara_update)
 
+    @transactional
     def delete_camara(self, db: Session, camara_id: int):
         db_camara = camara_repository.remove(db, camara_id=camara_id)
         if not db_camara:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Camara não encontrada")
+        login_cache.clear_on_commit(db)
         return db_camara
 
-    def get_total_camaras(self, db: Session,  filtro: Optional[str] = None):
-        return camara_repository.count(db, filtro=filtro)
-    
 camara_service = CamaraService()
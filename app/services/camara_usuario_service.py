@@ -1,14 +1,23 @@
 # app/services/camara_usuario_service.py
 import json
 from typing import Optional
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
-
+from app.core.permissions import permission_registry
+from app.core.token_version import token_versions
+from app.db.fields import FieldSelection
+from app.db.integrity import integrity_http_error, missing_reference_http_error
+from app.db.unit_of_work import transactional
+
+from app.models.usuario_model import Usuario
+from app.models.vereador_model import Vereador
 from app.repositories.camara_usuario_repository import camara_usuario_repository
 from app.repositories.usuario_repository import UsuarioRepository
 from app.repositories.camara_repository import camara_repository
 from app.schemas.camara_usuario_schema import CamaraUsuarioCreate, CamaraUsuarioUpdate, CamaraUsuarioBase, CamaraUsuarioUpdatePayload
 from app.schemas.usuario_schema import UsuarioUpdate
+from app.services.auth_service import login_cache
 from app.services.usuario_service import UsuarioService
 
 class CamaraUsuarioService:
@@ -27,63 +36,69 @@ class CamaraUsuarioService:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Associação não encontrada")
         return association
 
-    def get_associations_by_camara(self, camara_id: int, skip: int, limit: int, filtro: Optional[str] = None):
+    def get_associations_by_camara(self, camara_id: int, skip: int, limit: int, filtro: Optional[str] = None, cursor: Optional[str] = None, include_total: bool = True, estimate: bool = False, selecao: Optional[FieldSelection] = None):
         cam = self.camara_repo.get(self.db, camara_id=camara_id)
         if not cam:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Câmara não encontrada")
         
         return self.repository.get_all_by_camara_id(
-            self.db, camara_id=camara_id, skip=skip, limit=limit, filtro= filtro
+            self.db, camara_id=camara_id, skip=skip, limit=limit, filtro=filtro, cursor=cursor,
+            include_total=include_total, estimate=estimate, selecao=selecao
         )
 
-    def get_total_associations_by_camara(self, camara_id: int, filtro: Optional[str] = None) -> int:
-        """Retorna o número total de associações para uma câmara específica."""
-        return self.repository.count_by_camara_id(self.db, camara_id=camara_id, filtro=filtro)
+    def get_associations_version_by_camara(self, camara_id: int, filtro: Optional[str] = None):
+        cam = self.camara_repo.get(self.db, camara_id=camara_id)
+        if not cam:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Câmara não encontrada")
+
+        return self.repository.get_version_by_camara_id(self.db, camara_id=camara_id, filtro=filtro)
+
+    def export_associations_by_camara(self, camara_id: int, filtro: Optional[str] = None):
+        # A câmara é verificada antes de a resposta começar a ser enviada
+        cam = self.camara_repo.get(self.db, camara_id=camara_id)
+        if not cam:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Câmara não encontrada")
+
+        return self.repository.stream_all_by_camara_id(self.db, camara_id=camara_id, filtro=filtro)
 
-    def create_association(self, association_in: CamaraUsuarioCreate):
+    @transactional
+    def create_association(self, association_in: CamaraUsuarioCreate, hashed_password: Optional[str] = None):
         if not association_in.usuario:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="O objeto 'usuario' é obrigatório para criar ou associar."
             )
 
+        # A FK não enxerga a exclusão lógica: a câmara excluída é verificada aqui,
+        # antes da reativação e do INSERT
+        cam = self.camara_repo.get(self.db, camara_id=association_in.camara_id)
+        if not cam:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Câmara não encontrada")
+
         usuario_data = association_in.usuario
         usuario_id = usuario_data.id
+        permissao_str = json.dumps(association_in.permissao)
+        permissao_mask = permission_registry.compile(association_in.permissao)
 
         if usuario_id:
-            user = self.usuario_repo.get_by_id(id=usuario_id)
-            if not user:
-                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Usuário com ID {usuario_id} não encontrado.")
+            # Usuário existente: se já foi associado e excluído, a associação é reativada
+            reativada = self.repository.reactivate(
+                self.db, usuario_id=usuario_id, camara_id=association_in.camara_id,
+                papel=association_in.papel, permissao=permissao_str, permissao_mask=permissao_mask
+            )
+            if reativada:
+                login_cache.invalidate_on_commit(self.db, usuario_id)
+                return reativada
         else:
             usuario_service = UsuarioService(self.db)
             try:
-                new_user = usuario_service.create_usuario(usuario_create=usuario_data)
+                new_user = usuario_service.create_usuario(usuario_create=usuario_data, hashed_password=hashed_password)
                 usuario_id = new_user.id
             except HTTPException as e:
                 raise e
-        
-        cam = self.camara_repo.get(self.db, camara_id=association_in.camara_id)
-        if not cam:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Câmara não encontrada")
-
-        existing_association = self.repository.get_by_usuario_and_camara(
-            self.db, usuario_id=usuario_id, camara_id=association_in.camara_id
-        )
-
-        permissao_str = json.dumps(association_in.permissao)
-
-        if existing_association:
-            if existing_association.excluido:
-                update_data = CamaraUsuarioUpdate(papel=association_in.papel, ativo=True)
-                existing_association.excluido = False
-                setattr(existing_association, 'permissao', permissao_str)
-                return self.repository.update(self.db, db_obj=existing_association, obj_in=update_data)
-            else:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Este usuário já está associado a esta câmara."
-                )
 
+        # Usuário inexistente e associação repetida são detectados pelas
+        # constraints no INSERT (app/db/integrity.py)
         create_data_dict = {
             "usuario_id": usuario_id,
             "camara_id": association_in.camara_id,
@@ -93,10 +108,23 @@ class CamaraUsuarioService:
         }
         
         final_obj_to_create = CamaraUsuarioBase(**create_data_dict)
-        return self.repository.create(self.db, obj_in=final_obj_to_create)
-
+        login_cache.invalidate_on_commit(self.db, usuario_id)
+        try:
+            return self.repository.create(self.db, obj_in=final_obj_to_create, permissao_mask=permissao_mask)
+        except IntegrityError as e:
+            # Um usuário criado nesta transação existe: só o id informado é conferido
+            vereador_id = association_in.vereador_id
+            referencias = {
+                ("camara_usuario", ("usuario_id",)): (Usuario, usuario_data.id, f"Usuário com ID {usuario_id} não encontrado."),
+                ("camara_usuario", ("vereador_id",)): (Vereador, vereador_id, f"Vereador com ID {vereador_id} não encontrado."),
+            }
+            raise missing_reference_http_error(self.db, e, referencias) or integrity_http_error(e) or e
+
+    @transactional
     def update_association(self, id: int, association_in: CamaraUsuarioUpdatePayload):
         db_association = self.get_association(id=id)
+        # Compilada antes das escritas: o registro de nomes novos usa outra conexão
+        permissao_mask = permission_registry.compile(association_in.permissao)
 
         # Atualiza dados do usuário (sem senha)
         usuario_data = association_in.usuario
@@ -109,9 +137,14 @@ class CamaraUsuarioService:
         usuario_service = UsuarioService(self.db)
         usuario_service.update_usuario(usuario_id=db_association.usuario_id, usuario_update=usuario_update_schema)
 
+        # Papel e permissões vão nas claims do token: os já emitidos são revogados
+        token_versions.bump_on_commit(self.db, db_association.usuario_id)
+        login_cache.invalidate_on_commit(self.db, db_association.usuario_id)
+
         # Atualiza permissões
         permissao_str = json.dumps(association_in.permissao)
         setattr(db_association, 'permissao', permissao_str)
+        setattr(db_association, 'permissao_mask', permissao_mask)
 
         # Prepara os outros campos da associação para o update
         update_data_schema = CamaraUsuarioUpdate(
@@ -122,8 +155,11 @@ class CamaraUsuarioService:
         
         return self.repository.update(self.db, db_obj=db_association, obj_in=update_data_schema)
     
+    @transactional
     def delete_association(self, id: int):
         deleted_association = self.repository.remove(self.db, id=id)
         if not deleted_association:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Associação não encontrada")
+        token_versions.bump_on_commit(self.db, deleted_association.usuario_id)
+        login_cache.invalidate_on_commit(self.db, deleted_association.usuario_id)
         return deleted_association
\ No newline at end of file
@@ -2,6 +2,8 @@
 from typing import Optional
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
+from app.db.fields import FieldSelection
+from app.db.unit_of_work import transactional
 
 from app.repositories.comissao_membro_repository import ComissaoMembroRepository
 from app.repositories.comissao_repository import comissao_repository
@@ -21,18 +23,32 @@ class ComissaoMembroService:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Associação não encontrada")
         return association
 
-    def get_all_by_comissao_id(self, comissao_id: int, skip: int, limit: int, filtro: Optional[str] = None):
+    def get_all_by_comissao_id(self, comissao_id: int, skip: int, limit: int, filtro: Optional[str] = None, cursor: Optional[str] = None, include_total: bool = True, estimate: bool = False, selecao: Optional[FieldSelection] = None):
         comissao = self.comissao_repo.get(self.db, id=comissao_id)
         if not comissao:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Comissão não encontrada")
         
         return self.repository.get_all_by_comissao_id(
-            comissao_id=comissao_id, skip=skip, limit=limit, filtro=filtro
+            comissao_id=comissao_id, skip=skip, limit=limit, filtro=filtro, cursor=cursor,
+            include_total=include_total, estimate=estimate, selecao=selecao
         )
 
-    def get_total_by_comissao_id(self, comissao_id: int, filtro: Optional[str] = None) -> int:
-        return self.repository.count_by_comissao_id(comissao_id=comissao_id, filtro=filtro)
+    def get_version_by_comissao_id(self, comissao_id: int, filtro: Optional[str] = None):
+        comissao = self.comissao_repo.get(self.db, id=comissao_id)
+        if not comissao:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Comissão não encontrada")
+
+        return self.repository.get_version_by_comissao_id(comissao_id=comissao_id, filtro=filtro)
+
+    def export_by_comissao_id(self, comissao_id: int, filtro: Optional[str] = None):
+        # A comissão é verificada antes de a resposta começar a ser enviada
+        comissao = self.comissao_repo.get(self.db, id=comissao_id)
+        if not comissao:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Comissão não encontrada")
+
+        return self.repository.stream_all_by_comissao_id(comissao_id=comissao_id, filtro=filtro)
 
+    @transactional
     def create_association(self, association_in: ComissaoMembroCreate):
         # Valida se a comissão existe
         comissao = self.comissao_repo.get(self.db, id=association_in.comissao_id)
@@ -46,10 +62,12 @@ class ComissaoMembroService:
             
         return self.repository.create(obj_in=association_in)
 
+    @transactional
     def update_association(self, id: int, association_in: ComissaoMembroUpdate):
         db_association = self.get_association(id=id)
         return self.repository.update(db_obj=db_association, obj_in=association_in)
     
+    @transactional
     def delete_association(self, id: int):
         association = self.get_association(id=id)
         self.repository.remove(id=association.id)
@@ -2,6 +2,8 @@
 from typing import Optional
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
+from app.db.fields import FieldSelection
+from app.db.unit_of_work import transactional
 
 from app.repositories.comissao_repository import comissao_repository
 from app.repositories.camara_repository import camara_repository
@@ -19,18 +21,24 @@ class ComissaoService:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Comissão não encontrada")
         return comissao
 
-    def get_all_comissoes_by_camara(self, camara_id: int, skip: int, limit: int, filtro: Optional[str] = None):
+    def get_all_comissoes_by_camara(self, camara_id: int, skip: int, limit: int, filtro: Optional[str] = None, cursor: Optional[str] = None, include_total: bool = True, estimate: bool = False, selecao: Optional[FieldSelection] = None):
         camara = self.camara_repo.get(self.db, camara_id=camara_id)
         if not camara:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Câmara não encontrada")
         
         return self.repository.get_all_by_camara_id(
-            self.db, camara_id=camara_id, skip=skip, limit=limit, filtro=filtro
+            self.db, camara_id=camara_id, skip=skip, limit=limit, filtro=filtro, cursor=cursor,
+            include_total=include_total, estimate=estimate, selecao=selecao
         )
 
-    def get_total_comissoes_by_camara(self, camara_id: int, filtro: Optional[str] = None) -> int:
-        return self.repository.count_by_camara_id(self.db, camara_id=camara_id, filtro=filtro)
+    def get_comissoes_version_by_camara(self, camara_id: int, filtro: Optional[str] = None):
+        camara = self.camara_repo.get(self.db, camara_id=camara_id)
+        if not camara:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Câmara não encontrada")
+
+        return self.repository.get_version_by_camara_id(self.db, camara_id=camara_id, filtro=filtro)
 
+    @transactional
     def create_comissao(self, comissao_in: ComissaoCreate):
         camara = self.camara_repo.get(self.db, camara_id=comissao_in.camara_id)
         if not camara:
@@ -41,10 +49,12 @@ class ComissaoService:
         
         return self.repository.create(self.db, obj_in=comissao_in)
 
+    @transactional
     def update_comissao(self, id: int, comissao_in: ComissaoUpdate):
         db_comissao = self.get_comissao(id=id)
         return self.repository.update(self.db, db_obj=db_comissao, obj_in=comissao_in)
     
+    @transactional
     def delete_comissao(self, id: int):
         comissao = self.get_comissao(id=id)
         self.repository.remove(self.db, id=comissao.id)
@@ -2,6 +2,8 @@
 from typing import Optional
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
+from app.db.fields import FieldSelection
+from app.db.unit_of_work import transactional
 
 from app.repositories.mandato_repository import mandato_repository
 from app.repositories.camara_repository import camara_repository
@@ -26,7 +28,7 @@ class MandatoService:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Mandato não encontrado")
         return mandato
 
-    def get_all_mandatos_by_camara(self, camara_id: int, skip: int, limit: int, filtro: Optional[str] = None):
+    def get_all_mandatos_by_camara(self, camara_id: int, skip: int, limit: int, filtro: Optional[str] = None, cursor: Optional[str] = None, include_total: bool = True, estimate: bool = False, selecao: Optional[FieldSelection] = None):
         """
         Busca uma lista de mandatos para uma câmara específica, com paginação e filtro.
         """
@@ -36,15 +38,21 @@ class MandatoService:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Câmara não encontrada")
         
         return self.repository.get_all_by_camara_id(
-            self.db, camara_id=camara_id, skip=skip, limit=limit, filtro=filtro
+            self.db, camara_id=camara_id, skip=skip, limit=limit, filtro=filtro, cursor=cursor,
+            include_total=include_total, estimate=estimate, selecao=selecao
         )
 
-    def get_total_mandatos_by_camara(self, camara_id: int, filtro: Optional[str] = None) -> int:
+    def get_mandatos_version_by_camara(self, camara_id: int, filtro: Optional[str] = None):
         """
-        Retorna o número total de mandatos para uma câmara específica, aplicando o filtro.
+        Versão da listagem de mandatos da câmara (ETag), sem buscar a página.
         """
-        return self.repository.count_by_camara_id(self.db, camara_id=camara_id, filtro=filtro)
+        camara = self.camara_repo.get(self.db, camara_id=camara_id)
+        if not camara:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Câmara não encontrada")
+
+        return self.repository.get_version_by_camara_id(self.db, camara_id=camara_id, filtro=filtro)
 
+    @transactional
     def create_mandato(self, mandato_in: MandatoCreate):
         """
         Cria um novo mandato.
@@ -63,6 +71,7 @@ class MandatoService:
         
         return self.repository.create(self.db, obj_in=mandato_in)
 
+    @transactional
     def update_mandato(self, id: int, mandato_in: MandatoUpdate):
         """
         Atualiza um mandato existente.
@@ -77,6 +86,7 @@ class MandatoService:
 
         return self.repository.update(self.db, db_obj=db_mandato, obj_in=mandato_in)
     
+    @transactional
     def delete_mandato(self, id: int):
         """
         Remove um mandato.
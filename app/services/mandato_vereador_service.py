@@ -2,6 +2,8 @@
 from typing import Optional
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
+from app.db.fields import FieldSelection
+from app.db.unit_of_work import transactional
 
 from app.repositories.mandato_vereador_repository import MandatoVereadorRepository
 from app.repositories.vereador_repository import VereadorRepository
@@ -10,9 +12,11 @@ from app.schemas.mandato_vereador_schema import (
     MandatoVereadorCreate, 
     MandatoVereadorBase, 
     MandatoVereadorUpdatePayload,
-    MandatoVereadorUpdate
+    MandatoVereadorUpdate,
+    MandatoVereadorImport,
+    MandatoVereadorImportResult
 )
-from app.schemas.vereador_schema import VereadorUpdate
+from app.schemas.vereador_schema import VereadorCreate, VereadorUpdate
 from app.services.vereador_service import VereadorService
 
 class MandatoVereadorService:
@@ -28,24 +32,33 @@ class MandatoVereadorService:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Associação não encontrada")
         return association
 
-    def get_associations_by_mandato(self, mandato_id: int, skip: int, limit: int, filtro: Optional[str] = None):
+    def get_associations_by_mandato(self, mandato_id: int, skip: int, limit: int, filtro: Optional[str] = None, cursor: Optional[str] = None, include_total: bool = True, estimate: bool = False, selecao: Optional[FieldSelection] = None):
         mandato = self.mandato_repo.get(self.db, id=mandato_id)
         if not mandato:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Mandato não encontrado")
         
         return self.repository.get_all_by_mandato_id(
-            mandato_id=mandato_id, skip=skip, limit=limit, filtro=filtro
+            mandato_id=mandato_id, skip=skip, limit=limit, filtro=filtro, cursor=cursor,
+            include_total=include_total, estimate=estimate, selecao=selecao
         )
 
-    def get_total_associations_by_mandato(self, mandato_id: int, filtro: Optional[str] = None) -> int:
-        return self.repository.count_by_mandato_id(mandato_id=mandato_id, filtro=filtro)
-    
-    def get_all_associations(self, camara_id: Optional[int] = None, mandato_ativo: Optional[bool] = None):
+    def get_associations_version_by_mandato(self, mandato_id: int, filtro: Optional[str] = None):
+        mandato = self.mandato_repo.get(self.db, id=mandato_id)
+        if not mandato:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Mandato não encontrado")
+
+        return self.repository.get_version_by_mandato_id(mandato_id=mandato_id, filtro=filtro)
+
+    def get_all_associations(self, camara_id: Optional[int] = None, mandato_ativo: Optional[bool] = None, selecao: Optional[FieldSelection] = None):
         """
         Busca e retorna associações com base em filtros genéricos.
         """
-        return self.repository.get_all(self.db, camara_id=camara_id, mandato_ativo=mandato_ativo)
+        return self.repository.get_all(self.db, camara_id=camara_id, mandato_ativo=mandato_ativo, projetar=True, selecao=selecao)
+
+    def get_all_associations_version(self, camara_id: Optional[int] = None, mandato_ativo: Optional[bool] = None):
+        return self.repository.get_version(self.db, camara_id=camara_id, mandato_ativo=mandato_ativo)
 
+    @transactional
     def create_association(self, association_in: MandatoVereadorCreate):
         vereador_data = association_in.vereador
         vereador_id = vereador_data.id if vereador_data else association_in.vereador_id
@@ -67,18 +80,8 @@ class MandatoVereadorService:
         mandato = self.mandato_repo.get(self.db, id=association_in.mandato_id)
         if not mandato:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Mandato não encontrado")
-        
-        
-        existing_association = self.repository.get_by_vereador_and_mandato(
-            vereador_id=vereador_id,
-            mandato_id=association_in.mandato_id
-        )
-        if existing_association:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Este vereador já está cadastrado neste mandato."
-            )
 
+        # Vereador já associado ao mandato: violação do índice único, traduzida pelo @transactional
         create_data = MandatoVereadorBase(
             vereador_id=vereador_id,
             mandato_id=association_in.mandato_id,
@@ -87,6 +90,108 @@ class MandatoVereadorService:
         
         return self.repository.create(obj_in=create_data)
 
+    @transactional
+    def import_associations(self, import_in: MandatoVereadorImport):
+        """
+        Importa de uma vez os vereadores de um mandato (uma legislatura inteira).
+
+        Todas as linhas são validadas numa única passada: os vereadores já
+        cadastrados são encontrados por e-mail/CPF com uma consulta IN cada, e
+        os novos vereadores e as associações são gravados com INSERTs de várias
+        linhas, na mesma transação. Vereadores existentes são reaproveitados em
+        vez de recusados. Linhas com erro não impedem as demais; o resultado
+        traz o status de cada linha.
+        """
+        mandato = self.mandato_repo.get(self.db, id=import_in.mandato_id)
+        if not mandato:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Mandato não encontrado")
+
+        itens = import_in.itens
+        dados = [item.vereador for item in itens if item.vereador and not item.vereador.id]
+        ids_informados = [item.vereador.id if item.vereador else item.vereador_id for item in itens]
+
+        # Uma consulta por chave, para todas as linhas
+        por_id = {v.id: v for v in self.vereador_repo.get_by_ids([i for i in ids_informados if i])}
+        por_email = {v.email: v for v in self.vereador_repo.get_by_emails([d.email for d in dados])}
+        por_cpf = {v.cpf: v for v in self.vereador_repo.get_by_cpfs([d.cpf for d in dados])}
+
+        resultados: list[MandatoVereadorImportResult] = []
+        novos: dict[str, VereadorCreate] = {}  # vereadores a criar, por e-mail
+        novos_cpf: dict[str, str] = {}  # cpf -> e-mail do vereador a criar
+        linha_vereador: dict[int, object] = {}  # linha -> id do vereador (ou e-mail, se novo)
+        vistos: set = set()
+
+        for linha, (item, vereador_id) in enumerate(zip(itens, ids_informados)):
+            resultado = MandatoVereadorImportResult(linha=linha, status="associado")
+            resultados.append(resultado)
+            chave = None
+
+            if vereador_id:
+                if vereador_id not in por_id:
+                    resultado.mensagem = f"Vereador com ID {vereador_id} não encontrado."
+                else:
+                    chave = vereador_id
+            elif item.vereador:
+                dado = item.vereador
+                existente_email = por_email.get(dado.email)
+                existente_cpf = por_cpf.get(dado.cpf)
+                if existente_email and existente_cpf and existente_email.id != existente_cpf.id:
+                    resultado.mensagem = "O e-mail e o CPF informados pertencem a vereadores diferentes."
+                elif existente_email or existente_cpf:
+                    chave = (existente_email or existente_cpf).id
+                elif dado.email in novos or novos_cpf.get(dado.cpf, dado.email) != dado.email:
+                    resultado.mensagem = "Vereador repetido na importação."
+                else:
+                    novos[dado.email] = dado
+                    novos_cpf[dado.cpf] = dado.email
+                    resultado.status = "criado"
+                    chave = dado.email
+            else:
+                resultado.mensagem = "ID do vereador ou dados para criação do vereador são necessários."
+
+            if chave is not None and chave in vistos:
+                resultado.mensagem = "Vereador repetido na importação."
+                chave = None
+            if chave is None:
+                resultado.status = "erro"
+                continue
+            vistos.add(chave)
+            linha_vereador[linha] = chave
+
+        # Vereadores existentes que já estão no mandato
+        existentes = [c for c in linha_vereador.values() if isinstance(c, int)]
+        ja_associados = self.repository.get_vereador_ids_by_mandato(
+            mandato_id=import_in.mandato_id, vereador_ids=existentes
+        )
+        for linha, chave in list(linha_vereador.items()):
+            if chave in ja_associados:
+                resultados[linha].status = "erro"
+                resultados[linha].mensagem = "Este vereador já está cadastrado neste mandato."
+                del linha_vereador[linha]
+
+        ids_novos = self.vereador_repo.create_many(list(novos.values()))
+        for linha, chave in linha_vereador.items():
+            linha_vereador[linha] = ids_novos.get(chave, chave)
+
+        ids_associacoes = self.repository.create_many([
+            MandatoVereadorBase(vereador_id=vereador_id, mandato_id=import_in.mandato_id, funcao=itens[linha].funcao)
+            for linha, vereador_id in linha_vereador.items()
+        ])
+        for linha, vereador_id in linha_vereador.items():
+            resultados[linha].vereador_id = vereador_id
+            resultados[linha].mandato_vereador_id = ids_associacoes.get(vereador_id)
+
+        contagem = {"criado": 0, "associado": 0, "erro": 0}
+        for resultado in resultados:
+            contagem[resultado.status] += 1
+        return {
+            "criados": contagem["criado"],
+            "associados": contagem["associado"],
+            "erros": contagem["erro"],
+            "resultados": resultados,
+        }
+
+    @transactional
     def update_association(self, id: int, association_in: MandatoVereadorUpdatePayload):
         db_association = self.get_association(id=id)
 
@@ -94,13 +199,14 @@ class MandatoVereadorService:
         vereador_data = association_in.vereador
         vereador_update_schema = VereadorUpdate(**vereador_data.model_dump())
         vereador_service = VereadorService(self.db)
-        vereador_service.update_vereador(vereador_id=db_association.vereador_id, vereador_update=vereador_update_schema)
+        vereador_service.update_vereador(id=db_association.vereador_id, vereador_update=vereador_update_schema)
         
         # Prepara os campos da associação para o update
         update_data_schema = MandatoVereadorUpdate(funcao=association_in.funcao)
         
         return self.repository.update(db_obj=db_association, obj_in=update_data_schema)
 
+    @transactional
     def delete_association(self, id: int):
         """Deleta uma associação pelo seu ID."""
         association = self.repository.get_by_id(id=id)
@@ -1,30 +1,48 @@
 # app/services/usuario_service.py
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
+from app.db.fields import FieldSelection
+from app.db.integrity import integrity_http_error
+from app.db.unit_of_work import transactional
 from app.repositories.usuario_repository import UsuarioRepository
 from app.schemas.usuario_schema import UsuarioCreate, UsuarioUpdate
+from app.core.hashing import hash_password_async
 from app.core.security import get_password_hash
+from app.core.principal_cache import principal_cache
+from app.core.token_version import token_versions
+from app.services.auth_service import login_cache
 from typing import Optional
 
+async def hash_new_password(senha: Optional[str], conf_senha: Optional[str]) -> Optional[str]:
+    """
+    Hash da senha informada, aguardado no pool de bcrypt sem ocupar uma thread
+    do servidor (app/core/hashing.py); com o pool cheio, 503 com Retry-After.
+    Para as rotas que criam usuários ou trocam a senha, antes de chamar o
+    serviço no threadpool. None sem senha ou sem confirmação igual: o serviço
+    faz a validação e responde o erro.
+    """
+    if not senha or senha != conf_senha:
+        return None
+    return await hash_password_async(senha)
+
+
 class UsuarioService:
     def __init__(self, db: Session):
+        self.db = db
         self.repository = UsuarioRepository(db)
 
-    def create_usuario(self, usuario_create: UsuarioCreate):
+    @transactional
+    def create_usuario(self, usuario_create: UsuarioCreate, hashed_password: Optional[str] = None):
         if usuario_create.senha != usuario_create.confSenha:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="As senhas não coincidem."
             )
         
-        existing_user = self.repository.get_by_email(usuario_create.email)
-        if existing_user:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Um usuário com este e-mail já está cadastrado."
-            )
-        
-        hashed_password = get_password_hash(usuario_create.senha)
+        # E-mail repetido: violação do índice único, traduzida pelo @transactional
+        if hashed_password is None:
+            hashed_password = get_password_hash(usuario_create.senha)
         
         return self.repository.create(usuario_create, hashed_password)
     
@@ -42,14 +60,17 @@ class UsuarioService:
         return usuario
 
 
-    def update_usuario(self, usuario_id: int, usuario_update: UsuarioUpdate):
+    @transactional
+    def update_usuario(self, usuario_id: int, usuario_update: UsuarioUpdate, hashed_password: Optional[str] = None):
         db_usuario = self.get_usuario_by_id(usuario_id)
-
-        # Verifica se o novo e-mail já está em uso por outro usuário
-        if usuario_update.email and usuario_update.email != db_usuario.email:
-            existing_user = self.repository.get_by_email(usuario_update.email)
-            if existing_user:
-                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="E-mail já cadastrado.")
+        # Usuário autenticado em cache (pelo e-mail atual e pelo novo, se mudar)
+        principal_cache.invalidate_on_commit(self.db, *filter(None, (db_usuario.email, usuario_update.email)))
+        login_cache.invalidate_on_commit(self.db, usuario_id)
+        # Tokens emitidos antes da alteração de e-mail, senha, ativo ou superusuário deixam de valer
+        revoga_tokens = bool(usuario_update.senha) or any(
+            getattr(usuario_update, campo) is not None and getattr(usuario_update, campo) != getattr(db_usuario, campo)
+            for campo in ("email", "ativo", "is_superuser")
+        )
 
         # Validação de senha
         if usuario_update.senha:
@@ -58,19 +79,26 @@ class UsuarioService:
             if usuario_update.senha != usuario_update.confSenha:
                 raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="As senhas não coincidem.")
             
-            hashed_password = get_password_hash(usuario_update.senha)
+            if hashed_password is None:
+                hashed_password = get_password_hash(usuario_update.senha)
             # Remove senhas do objeto de atualização para não salvar em texto plano
             del usuario_update.senha
             del usuario_update.confSenha
         else:
             hashed_password = None
 
-        return self.repository.update(db_obj=db_usuario, obj_in=usuario_update, hashed_password=hashed_password)
+        try:
+            usuario = self.repository.update(db_obj=db_usuario, obj_in=usuario_update, hashed_password=hashed_password)
+        except IntegrityError as e:
+            # Novo e-mail já em uso por outro usuário
+            raise integrity_http_error(e, {("usuario", ("email",)): "E-mail já cadastrado."}) or e
+
+        if revoga_tokens:
+            token_versions.bump_on_commit(self.db, usuario_id)
+        return usuario
 
 
-    def get_all_usuarios(self, skip: int = 0, limit: int = 100, filtro: Optional[str] = None):
-        return self.repository.get_all(skip=skip, limit=limit, filtro=filtro)
+    def get_all_usuarios(self, skip: int = 0, limit: int = 100, filtro: Optional[str] = None, cursor: Optional[str] = None, include_total: bool = True, estimate: bool = False, selecao: Optional[FieldSelection] = None):
+        return self.repository.get_all(skip=skip, limit=limit, filtro=filtro, cursor=cursor,
+                                       include_total=include_total, estimate=estimate, selecao=selecao)
     
-    def get_total_usuarios(self, filtro: Optional[str] = None):
-        return self.repository.count(filtro=filtro)
-  
\ No newline at end of file
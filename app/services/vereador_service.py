@@ -1,5 +1,7 @@
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
+from app.db.fields import FieldSelection
+from app.db.unit_of_work import transactional
 from app.repositories.vereador_repository import VereadorRepository
 
 from app.schemas.vereador_schema import VereadorCreate, VereadorUpdate
@@ -7,26 +9,25 @@ from typing import Optional
 
 class VereadorService:
     def __init__(self, db: Session):
+        self.db = db
         self.repository = VereadorRepository(db)
     
-    def get_all_vereadores(self, skip: int = 0, limit: int = 100, filtro: Optional[str] = None):
-        return self.repository.get_all(skip=skip, limit=limit, filtro=filtro)
+    def get_all_vereadores(self, skip: int = 0, limit: int = 100, filtro: Optional[str] = None, cursor: Optional[str] = None, include_total: bool = True, estimate: bool = False, selecao: Optional[FieldSelection] = None):
+        return self.repository.get_all(skip=skip, limit=limit, filtro=filtro, cursor=cursor,
+                                       include_total=include_total, estimate=estimate, projetar=True, selecao=selecao)
     
-    def get_total_vereadores(self, filtro: Optional[str] = None):
-        return self.repository.count(filtro=filtro)
+    def get_vereadores_version(self, filtro: Optional[str] = None):
+        return self.repository.get_version(filtro=filtro)
+
+    def export_vereadores(self, filtro: Optional[str] = None):
+        return self.repository.stream_all(filtro=filtro)
     
+    @transactional
     def create_vereador(self, vereador_create: VereadorCreate):
-        existing_vereador = self.repository.get_by_email(vereador_create.email)
-        existing_vereador_cpf = self.repository.get_by_cpf(vereador_create.cpf)
-
-        if existing_vereador or existing_vereador_cpf:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Um vereador com este e-mail ou CPF já está cadastrado."
-            )
-        
+        # E-mail ou CPF repetido: violação dos índices únicos, traduzida pelo @transactional
         return self.repository.create(vereador_create)
     
+    @transactional
     def update_vereador(self, id: int, vereador_update: VereadorUpdate):
         db_vereador = self.get_vereador_by_id(id)
         if not db_vereador:
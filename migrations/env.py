@@ -0,0 +1,73 @@
+# migrations/env.py
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy import create_engine, event, pool
+
+from app.core.config import settings
+from app.db.base import Base
+from app.db.search import register_sqlite_functions
+import app.models  # noqa: F401 - registra todos os modelos em Base.metadata
+
+config = context.config
+
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+target_metadata = Base.metadata
+
+
+def include_object(object, name, type_, reflected, compare_to):
+    """
+    Ignora no autogenerate os índices condicionais (ddl_if) de outros dialetos
+    e a estrutura de busca textual, que é mantida em SQL puro (app/db/search.py).
+    """
+    if reflected and type_ == "table" and "_fts" in name:
+        return False
+    if reflected and type_ == "index" and name and name.endswith(("_trgm", "_ft")):
+        return False
+    ddl_if = getattr(object, "_ddl_if", None)
+    if type_ == "index" and not reflected and ddl_if is not None and ddl_if.dialect:
+        dialetos = (ddl_if.dialect,) if isinstance(ddl_if.dialect, str) else ddl_if.dialect
+        return context.get_context().dialect.name in dialetos
+    return True
+
+
+def run_migrations_offline() -> None:
+    """Gera o SQL das migrações sem conectar ao banco (alembic upgrade --sql)."""
+    context.configure(
+        url=settings.SQLALCHEMY_DATABASE_URI,
+        target_metadata=target_metadata,
+        literal_binds=True,
+        include_object=include_object,
+        dialect_opts={"paramstyle": "named"},
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    """Executa as migrações conectando ao banco primário."""
+    connectable = create_engine(settings.SQLALCHEMY_DATABASE_URI, poolclass=pool.NullPool)
+    if connectable.dialect.name == "sqlite":
+        # Os triggers da busca textual chamam f_unaccent (app/db/search.py)
+        event.listen(connectable, "connect", lambda conn, rec: register_sqlite_functions(conn))
+
+    with connectable.connect() as connection:
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            include_object=include_object,
+            # SQLite não altera colunas/constraints in-place
+            render_as_batch=connection.dialect.name == "sqlite",
+        )
+
+        with context.begin_transaction():
+            context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
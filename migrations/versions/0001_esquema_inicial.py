@@ -0,0 +1,175 @@
+"""esquema inicial
+
+Tabelas como existiam antes do Alembic. Bancos já existentes devem apenas
+marcar esta revisão com `alembic stamp 0001`.
+
+Revision ID: 0001
+Revises: 
+Create Date: 2026-10-18 09:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001'
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Cria as tabelas do sistema de votação."""
+    op.create_table('camara',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('nome', sa.String(length=120), nullable=False),
+    sa.Column('cnpj', sa.String(length=20), nullable=True),
+    sa.Column('email', sa.String(length=120), nullable=True),
+    sa.Column('telefone', sa.String(length=20), nullable=True),
+    sa.Column('endereco', sa.String(length=200), nullable=True),
+    sa.Column('municipio', sa.String(length=120), nullable=True),
+    sa.Column('uf', sa.String(length=2), nullable=True),
+    sa.Column('numero_cadeiras', sa.Integer(), nullable=True),
+    sa.Column('dt_cadastro', sa.TIMESTAMP(), server_default=sa.func.now(), nullable=True),
+    sa.Column('dt_atualizado', sa.TIMESTAMP(), server_default=sa.func.now(), nullable=True),
+    sa.Column('excluido', sa.Boolean(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_camara_cnpj', 'camara', ['cnpj'], unique=True)
+    op.create_index('ix_camara_email', 'camara', ['email'], unique=True)
+    op.create_index('ix_camara_id', 'camara', ['id'], unique=False)
+
+    op.create_table('usuario',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('nome', sa.String(length=120), nullable=False),
+    sa.Column('email', sa.String(length=120), nullable=False),
+    sa.Column('senha_hash', sa.String(length=255), nullable=False),
+    sa.Column('ativo', sa.Boolean(), nullable=True),
+    sa.Column('is_superuser', sa.Boolean(), nullable=True),
+    sa.Column('dt_cadastro', sa.TIMESTAMP(), server_default=sa.func.now(), nullable=True),
+    sa.Column('dt_atualizado', sa.TIMESTAMP(), server_default=sa.func.now(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_usuario_email', 'usuario', ['email'], unique=True)
+    op.create_index('ix_usuario_id', 'usuario', ['id'], unique=False)
+
+    op.create_table('vereador',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('nome', sa.String(length=120), nullable=False),
+    sa.Column('email', sa.String(length=120), nullable=False),
+    sa.Column('cpf', sa.String(length=14), nullable=False),
+    sa.Column('telefone', sa.String(length=20), nullable=False),
+    sa.Column('partido', sa.String(length=45), nullable=False),
+    sa.Column('ativo', sa.Boolean(), nullable=True),
+    sa.Column('dt_cadastro', sa.TIMESTAMP(), server_default=sa.func.now(), nullable=True),
+    sa.Column('dt_atualizado', sa.TIMESTAMP(), server_default=sa.func.now(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_vereador_cpf', 'vereador', ['cpf'], unique=True)
+    op.create_index('ix_vereador_email', 'vereador', ['email'], unique=True)
+    op.create_index('ix_vereador_id', 'vereador', ['id'], unique=False)
+
+    op.create_table('camara_usuario',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('papel', sa.Integer(), nullable=False, comment='Define o nível de permissão do usuário na câmara.'),
+    sa.Column('permissao', sa.Text(), nullable=False, comment='Define as permissões específicas do usuário em formato de texto (ex: JSON).'),
+    sa.Column('ativo', sa.Boolean(), nullable=True),
+    sa.Column('excluido', sa.Boolean(), nullable=True),
+    sa.Column('dt_cadastro', sa.TIMESTAMP(), server_default=sa.func.now(), nullable=True),
+    sa.Column('dt_atualizado', sa.TIMESTAMP(), server_default=sa.func.now(), nullable=True),
+    sa.Column('usuario_id', sa.Integer(), nullable=False),
+    sa.Column('camara_id', sa.Integer(), nullable=False),
+    sa.Column('vereador_id', sa.Integer(), nullable=True),
+    sa.ForeignKeyConstraint(['camara_id'], ['camara.id'], ),
+    sa.ForeignKeyConstraint(['usuario_id'], ['usuario.id'], ),
+    sa.ForeignKeyConstraint(['vereador_id'], ['vereador.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_camara_usuario_id', 'camara_usuario', ['id'], unique=False)
+
+    op.create_table('comissao',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('nome', sa.String(length=120), nullable=False),
+    sa.Column('ativa', sa.Boolean(), nullable=True),
+    sa.Column('data_inicio', sa.DateTime(), nullable=False),
+    sa.Column('data_fim', sa.DateTime(), nullable=True),
+    sa.Column('dt_cadastro', sa.TIMESTAMP(), server_default=sa.func.now(), nullable=True),
+    sa.Column('camara_id', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['camara_id'], ['camara.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_comissao_id', 'comissao', ['id'], unique=False)
+
+    op.create_table('mandato',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('descricao', sa.String(length=120), nullable=False),
+    sa.Column('data_inicio', sa.Date(), nullable=False),
+    sa.Column('data_fim', sa.Date(), nullable=False),
+    sa.Column('ativo', sa.Boolean(), nullable=True),
+    sa.Column('dt_cadastro', sa.TIMESTAMP(), server_default=sa.func.now(), nullable=True),
+    sa.Column('dt_atualizado', sa.TIMESTAMP(), server_default=sa.func.now(), nullable=True),
+    sa.Column('camara_id', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['camara_id'], ['camara.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_mandato_id', 'mandato', ['id'], unique=False)
+
+    op.create_table('mandato_vereador',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('funcao', sa.Integer(), nullable=False, comment='Define a função do vereador no mandato.'),
+    sa.Column('mandato_id', sa.Integer(), nullable=False),
+    sa.Column('vereador_id', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['mandato_id'], ['mandato.id'], ),
+    sa.ForeignKeyConstraint(['vereador_id'], ['vereador.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_mandato_vereador_id', 'mandato_vereador', ['id'], unique=False)
+
+    op.create_table('comissao_membro',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('funcao', sa.Integer(), nullable=False, comment='Define a função do vereador na comissao.'),
+    sa.Column('data_inicio', sa.Date(), nullable=False),
+    sa.Column('data_fim', sa.Date(), nullable=False),
+    sa.Column('dt_cadastro', sa.TIMESTAMP(), server_default=sa.func.now(), nullable=True),
+    sa.Column('comissao_id', sa.Integer(), nullable=False),
+    sa.Column('mandato_vereador_id', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['comissao_id'], ['comissao.id'], ),
+    sa.ForeignKeyConstraint(['mandato_vereador_id'], ['mandato_vereador.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_comissao_membro_id', 'comissao_membro', ['id'], unique=False)
+
+
+def downgrade() -> None:
+    """Remove todas as tabelas."""
+    op.drop_index('ix_comissao_membro_id', table_name='comissao_membro')
+    op.drop_table('comissao_membro')
+
+    op.drop_index('ix_mandato_vereador_id', table_name='mandato_vereador')
+    op.drop_table('mandato_vereador')
+
+    op.drop_index('ix_mandato_id', table_name='mandato')
+    op.drop_table('mandato')
+
+    op.drop_index('ix_comissao_id', table_name='comissao')
+    op.drop_table('comissao')
+
+    op.drop_index('ix_camara_usuario_id', table_name='camara_usuario')
+    op.drop_table('camara_usuario')
+
+    op.drop_index('ix_vereador_id', table_name='vereador')
+    op.drop_index('ix_vereador_email', table_name='vereador')
+    op.drop_index('ix_vereador_cpf', table_name='vereador')
+    op.drop_table('vereador')
+
+    op.drop_index('ix_usuario_id', table_name='usuario')
+    op.drop_index('ix_usuario_email', table_name='usuario')
+    op.drop_table('usuario')
+
+    op.drop_index('ix_camara_id', table_name='camara')
+    op.drop_index('ix_camara_email', table_name='camara')
+    op.drop_index('ix_camara_cnpj', table_name='camara')
+    op.drop_table('camara')
\ No newline at end of file
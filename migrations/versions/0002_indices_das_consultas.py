@@ -0,0 +1,61 @@
+"""índices das consultas
+
+Índices compostos (e parciais, onde o banco suporta) para os filtros usados
+pelos repositórios: listagens por câmara, mandato ativo, vereadores de um
+mandato e membros de uma comissão.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 09:30:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, Sequence[str], None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Cria os índices compostos e parciais."""
+    # MySQL não suporta índice parcial: usa um composto (excluido, id)
+    if op.get_bind().dialect.name == 'mysql':
+        op.create_index('ix_camara_excluido_id', 'camara', ['excluido', 'id'], unique=False)
+    else:
+        op.create_index(
+            'ix_camara_nao_excluidas', 'camara', ['id'], unique=False,
+            postgresql_where=sa.text('excluido = false'),
+            sqlite_where=sa.text('excluido = 0'),
+        )
+
+    op.create_index('ix_camara_usuario_camara_id_excluido', 'camara_usuario', ['camara_id', 'excluido'], unique=False)
+    op.create_index('ix_camara_usuario_usuario_id_camara_id', 'camara_usuario', ['usuario_id', 'camara_id'], unique=False)
+    op.create_index('ix_comissao_camara_id', 'comissao', ['camara_id'], unique=False)
+    op.create_index('ix_comissao_membro_comissao_id', 'comissao_membro', ['comissao_id'], unique=False)
+    op.create_index('ix_comissao_membro_mandato_vereador_id', 'comissao_membro', ['mandato_vereador_id'], unique=False)
+    op.create_index('ix_mandato_camara_id_ativo', 'mandato', ['camara_id', 'ativo'], unique=False)
+    op.create_index('ix_mandato_vereador_mandato_id_vereador_id', 'mandato_vereador', ['mandato_id', 'vereador_id'], unique=False)
+    op.create_index('ix_mandato_vereador_vereador_id', 'mandato_vereador', ['vereador_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Remove os índices criados nesta revisão."""
+    op.drop_index('ix_mandato_vereador_vereador_id', table_name='mandato_vereador')
+    op.drop_index('ix_mandato_vereador_mandato_id_vereador_id', table_name='mandato_vereador')
+    op.drop_index('ix_mandato_camara_id_ativo', table_name='mandato')
+    op.drop_index('ix_comissao_membro_mandato_vereador_id', table_name='comissao_membro')
+    op.drop_index('ix_comissao_membro_comissao_id', table_name='comissao_membro')
+    op.drop_index('ix_comissao_camara_id', table_name='comissao')
+    op.drop_index('ix_camara_usuario_usuario_id_camara_id', table_name='camara_usuario')
+    op.drop_index('ix_camara_usuario_camara_id_excluido', table_name='camara_usuario')
+
+    if op.get_bind().dialect.name == 'mysql':
+        op.drop_index('ix_camara_excluido_id', table_name='camara')
+    else:
+        op.drop_index('ix_camara_nao_excluidas', table_name='camara')
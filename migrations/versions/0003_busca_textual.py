@@ -0,0 +1,47 @@
+"""busca textual
+
+Estrutura de busca do parâmetro `filtro` (ver app/db/search.py): pg_trgm e
+unaccent com índices GIN no PostgreSQL, índices FULLTEXT no MySQL e tabelas
+FTS5 mantidas por triggers no SQLite.
+
+No PostgreSQL, as extensões exigem permissão de criação no banco.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 11:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from app.db.search import PG_SETUP_DDL, SEARCH_COLUMNS, create_search_ddl, drop_search_ddl
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003'
+down_revision: Union[str, Sequence[str], None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Cria os índices de busca de cada tabela pesquisável."""
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        for stmt in PG_SETUP_DDL:
+            op.execute(stmt)
+    for tabela in SEARCH_COLUMNS:
+        # Estrutura original (por palavra); a busca por trecho vem na 0010
+        for stmt in create_search_ddl(dialect, tabela, por_trecho=False):
+            op.execute(stmt)
+
+
+def downgrade() -> None:
+    """Remove os índices de busca (as extensões do PostgreSQL são mantidas)."""
+    dialect = op.get_bind().dialect.name
+    for tabela in SEARCH_COLUMNS:
+        for stmt in drop_search_ddl(dialect, tabela):
+            op.execute(stmt)
+    if dialect == 'postgresql':
+        op.execute("DROP FUNCTION IF EXISTS f_unaccent(text)")
@@ -0,0 +1,61 @@
+"""mandato ativo único por câmara
+
+Índice único parcial em mandato (camara_id) WHERE ativo, para que o banco
+garanta no máximo um mandato ativo por câmara. No MySQL, que não tem índice
+parcial, é um índice único funcional sobre IF(ativo, camara_id, NULL).
+
+Antes de criar o índice, câmaras que já tenham mais de um mandato ativo
+mantêm ativo apenas o mais recente (maior id).
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18 14:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0004'
+down_revision: Union[str, Sequence[str], None] = '0003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Corrige os mandatos ativos duplicados e cria o índice único."""
+    mandato = sa.table('mandato', sa.column('id', sa.Integer), sa.column('camara_id', sa.Integer), sa.column('ativo', sa.Boolean))
+    # Tabela derivada: o MySQL não aceita ler a própria tabela do UPDATE numa subconsulta direta
+    mais_recentes = (
+        sa.select(sa.func.max(mandato.c.id).label('id'))
+        .where(mandato.c.ativo == sa.true())
+        .group_by(mandato.c.camara_id)
+        .subquery()
+    )
+    op.execute(
+        mandato.update()
+        .where(mandato.c.ativo == sa.true(), mandato.c.id.not_in(sa.select(mais_recentes.c.id)))
+        .values(ativo=False)
+    )
+
+    if op.get_bind().dialect.name == 'mysql':
+        op.create_index(
+            'ux_mandato_camara_id_ativo_fn', 'mandato', [sa.text('IF(ativo, camara_id, NULL)')], unique=True
+        )
+    else:
+        op.create_index(
+            'ux_mandato_camara_id_ativo', 'mandato', ['camara_id'], unique=True,
+            postgresql_where=sa.text('ativo = true'),
+            sqlite_where=sa.text('ativo = 1'),
+        )
+
+
+def downgrade() -> None:
+    """Remove o índice único (os mandatos desativados não são reativados)."""
+    if op.get_bind().dialect.name == 'mysql':
+        op.drop_index('ux_mandato_camara_id_ativo_fn', table_name='mandato')
+    else:
+        op.drop_index('ux_mandato_camara_id_ativo', table_name='mandato')
@@ -0,0 +1,44 @@
+"""constraints de unicidade das associações
+
+Torna únicos os índices (usuario_id, camara_id) de camara_usuario e
+(mandato_id, vereador_id) de mandato_vereador. Com isso os serviços inserem
+direto e a duplicidade é detectada pelo banco (app/db/integrity.py), em vez
+de uma consulta prévia sujeita a condição de corrida.
+
+Se já houver associações duplicadas, a criação do índice falha: elas devem
+ser resolvidas manualmente antes da migração.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18 15:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0005'
+down_revision: Union[str, Sequence[str], None] = '0004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Substitui os índices compostos pelos equivalentes únicos."""
+    # O índice único é criado antes de remover o antigo: no MySQL a chave
+    # estrangeira da primeira coluna precisa sempre de um índice
+    op.create_index('ux_camara_usuario_usuario_id_camara_id', 'camara_usuario', ['usuario_id', 'camara_id'], unique=True)
+    op.drop_index('ix_camara_usuario_usuario_id_camara_id', table_name='camara_usuario')
+    op.create_index('ux_mandato_vereador_mandato_id_vereador_id', 'mandato_vereador', ['mandato_id', 'vereador_id'], unique=True)
+    op.drop_index('ix_mandato_vereador_mandato_id_vereador_id', table_name='mandato_vereador')
+
+
+def downgrade() -> None:
+    """Volta aos índices compostos não únicos."""
+    op.create_index('ix_mandato_vereador_mandato_id_vereador_id', 'mandato_vereador', ['mandato_id', 'vereador_id'], unique=False)
+    op.drop_index('ux_mandato_vereador_mandato_id_vereador_id', table_name='mandato_vereador')
+    op.create_index('ix_camara_usuario_usuario_id_camara_id', 'camara_usuario', ['usuario_id', 'camara_id'], unique=False)
+    op.drop_index('ux_camara_usuario_usuario_id_camara_id', table_name='camara_usuario')
@@ -0,0 +1,33 @@
+"""versão dos tokens do usuário
+
+Adiciona usuario.token_version, incrementada para revogar os access tokens já
+emitidos (app/core/token_version.py). Os usuários existentes começam na
+versão 0.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18 17:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0006'
+down_revision: Union[str, Sequence[str], None] = '0005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Cria a coluna token_version."""
+    op.add_column('usuario', sa.Column('token_version', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    """Remove a coluna token_version."""
+    with op.batch_alter_table('usuario') as batch_op:
+        batch_op.drop_column('token_version')
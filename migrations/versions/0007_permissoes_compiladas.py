@@ -0,0 +1,83 @@
+"""permissões compiladas em máscara de bits
+
+Cria o catálogo `permissao` (nome -> id; o bit é id - 1) e a coluna
+camara_usuario.permissao_mask, e preenche os dois a partir das listas JSON
+já gravadas em camara_usuario.permissao (app/core/permissions.py).
+
+Os nomes existentes são registrados em ordem alfabética. A migração falha se
+houver mais de 63 nomes distintos (limite de um BIGINT com sinal).
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18 18:00:00
+
+"""
+import json
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0007'
+down_revision: Union[str, Sequence[str], None] = '0006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+MAX_PERMISSOES = 63
+
+
+def _nomes(texto):
+    try:
+        nomes = json.loads(texto or '[]')
+    except ValueError:
+        return []
+    return [str(n) for n in nomes] if isinstance(nomes, list) else []
+
+
+def upgrade() -> None:
+    """Cria o catálogo e a coluna da máscara e preenche as associações existentes."""
+    op.create_table('permissao',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('nome', sa.String(length=100), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('nome')
+    )
+    op.create_index('ix_permissao_id', 'permissao', ['id'], unique=False)
+    op.add_column('camara_usuario', sa.Column('permissao_mask', sa.BigInteger(), server_default='0', nullable=False))
+
+    conn = op.get_bind()
+    camara_usuario = sa.table('camara_usuario', sa.column('id', sa.Integer), sa.column('permissao', sa.Text),
+                              sa.column('permissao_mask', sa.BigInteger))
+    permissao = sa.table('permissao', sa.column('id', sa.Integer), sa.column('nome', sa.String))
+
+    associacoes = [(id, _nomes(texto)) for id, texto in conn.execute(sa.select(camara_usuario.c.id, camara_usuario.c.permissao))]
+    nomes = sorted({nome for _, lista in associacoes for nome in lista})
+    if len(nomes) > MAX_PERMISSOES:
+        raise RuntimeError(f'{len(nomes)} permissões distintas em camara_usuario; o limite é {MAX_PERMISSOES}.')
+    if not nomes:
+        return
+
+    # Sem id explícito: a sequência/autoincremento continua valendo para os próximos nomes
+    conn.execute(permissao.insert(), [{'nome': nome} for nome in nomes])
+    bits = {nome: id - 1 for id, nome in conn.execute(sa.select(permissao.c.id, permissao.c.nome))}
+
+    atualizacoes = [
+        {'b_id': id, 'b_mask': sum(1 << bits[nome] for nome in set(lista))}
+        for id, lista in associacoes if lista
+    ]
+    if atualizacoes:
+        conn.execute(
+            camara_usuario.update().where(camara_usuario.c.id == sa.bindparam('b_id'))
+            .values(permissao_mask=sa.bindparam('b_mask')),
+            atualizacoes
+        )
+
+
+def downgrade() -> None:
+    """Remove a coluna da máscara e o catálogo."""
+    with op.batch_alter_table('camara_usuario') as batch_op:
+        batch_op.drop_column('permissao_mask')
+    op.drop_index('ix_permissao_id', table_name='permissao')
+    op.drop_table('permissao')
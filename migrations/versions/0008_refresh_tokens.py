@@ -0,0 +1,51 @@
+"""refresh tokens
+
+Cria a tabela refresh_token (app/models/refresh_token_model.py), com o hash
+dos refresh tokens emitidos no login e renovados em POST /refresh.
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-18 19:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0008'
+down_revision: Union[str, Sequence[str], None] = '0007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Cria a tabela refresh_token e os seus índices."""
+    op.create_table('refresh_token',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('token_hash', sa.String(length=64), nullable=False),
+    sa.Column('familia', sa.String(length=32), nullable=False),
+    sa.Column('token_version', sa.Integer(), nullable=False),
+    sa.Column('expira_em', sa.TIMESTAMP(), nullable=False),
+    sa.Column('usado_em', sa.TIMESTAMP(), nullable=True),
+    sa.Column('revogado', sa.Boolean(), nullable=False),
+    sa.Column('dt_cadastro', sa.TIMESTAMP(), server_default=sa.func.now(), nullable=True),
+    sa.Column('usuario_id', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['usuario_id'], ['usuario.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_refresh_token_id', 'refresh_token', ['id'], unique=False)
+    op.create_index('ix_refresh_token_token_hash', 'refresh_token', ['token_hash'], unique=True)
+    op.create_index('ix_refresh_token_familia', 'refresh_token', ['familia'], unique=False)
+    op.create_index('ix_refresh_token_usuario_id', 'refresh_token', ['usuario_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Remove a tabela refresh_token."""
+    op.drop_index('ix_refresh_token_usuario_id', table_name='refresh_token')
+    op.drop_index('ix_refresh_token_familia', table_name='refresh_token')
+    op.drop_index('ix_refresh_token_token_hash', table_name='refresh_token')
+    op.drop_index('ix_refresh_token_id', table_name='refresh_token')
+    op.drop_table('refresh_token')
@@ -0,0 +1,40 @@
+"""dt_atualizado das comissões e associações
+
+Adiciona dt_atualizado (atualizada a cada UPDATE) em comissao, comissao_membro
+e mandato_vereador, como nas demais tabelas: é a versão usada nas ETags das
+leituras (app/core/etag.py). As linhas existentes recebem a data da migração.
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-18 21:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0009'
+down_revision: Union[str, Sequence[str], None] = '0008'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABELAS = ('comissao', 'comissao_membro', 'mandato_vereador')
+
+
+def upgrade() -> None:
+    """Cria as colunas dt_atualizado."""
+    # O SQLite não aceita ADD COLUMN com default não constante: recria a tabela
+    recreate = 'always' if op.get_bind().dialect.name == 'sqlite' else 'auto'
+    for tabela in TABELAS:
+        with op.batch_alter_table(tabela, recreate=recreate) as batch_op:
+            batch_op.add_column(sa.Column('dt_atualizado', sa.TIMESTAMP(), server_default=sa.func.now(), nullable=True))
+
+
+def downgrade() -> None:
+    """Remove as colunas dt_atualizado."""
+    for tabela in TABELAS:
+        with op.batch_alter_table(tabela) as batch_op:
+            batch_op.drop_column('dt_atualizado')
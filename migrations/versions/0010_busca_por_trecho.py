@@ -0,0 +1,50 @@
+"""busca por trecho
+
+Recria a estrutura de busca do MySQL e do SQLite (ver app/db/search.py) para
+que o `filtro` volte a encontrar qualquer trecho ("ilva" encontra "Silva"),
+como o `ilike('%filtro%')` anterior à 0003, e não só o começo das palavras:
+índices FULLTEXT com o parser ngram no MySQL e tabelas FTS5 com o tokenizer
+trigram, sobre o texto sem acentos, no SQLite. O PostgreSQL já buscava por
+trecho (pg_trgm) e não muda.
+
+No SQLite, recriar a estrutura também restaura os triggers das comissões,
+removidos junto com a tabela quando a 0009 a recriou.
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-18 22:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from app.db.search import SEARCH_COLUMNS, create_search_ddl, drop_search_ddl
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0010'
+down_revision: Union[str, Sequence[str], None] = '0009'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+DIALETOS = ('mysql', 'sqlite')
+
+
+def _recriar(por_trecho: bool) -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect not in DIALETOS:
+        return
+    for tabela in SEARCH_COLUMNS:
+        for stmt in drop_search_ddl(dialect, tabela) + create_search_ddl(dialect, tabela, por_trecho=por_trecho):
+            op.execute(stmt)
+
+
+def upgrade() -> None:
+    """Recria os índices de busca do MySQL e do SQLite para a busca por trecho."""
+    _recriar(por_trecho=True)
+
+
+def downgrade() -> None:
+    """Volta aos índices de busca por palavra da 0003."""
+    _recriar(por_trecho=False)
@@ -0,0 +1,445 @@
+# scripts/benchmark.py
+"""
+Benchmarks das otimizações de leitura, num banco SQLite temporário criado
+pelas migrações do Alembic e populado com dados sintéticos.
+
+    python scripts/benchmark.py                      # todos os cenários
+    python scripts/benchmark.py paginacao            # só os cenários indicados
+    python scripts/benchmark.py paginacao --linhas 50000
+
+Cenários:
+
+- paginacao: primeira página e página 1.000 (limit=10), por skip/limit e por
+  cursor, em /vereadores/, /camaras/ e /usuario-camara/camara/{id}.
+- projecao: todas as linhas de vereadores, câmaras e mandato-vereador pelo
+  caminho ORM e pela projeção de colunas (tempo e pico de memória).
+- auth_cache: GET /usuarios/me com o cache do usuário autenticado desligado
+  e ligado.
+- login: login de usuários com 1, 50 e 500 câmaras, sem e com o login_cache.
+- serializacao: páginas de 1.000 vereadores, membros de comissão e
+  usuários da câmara pelo caminho antigo (json da biblioteca padrão), pela
+  validação + dump_json e pelo page_response.
+- compressao: corpo de /mandato-vereador/ (sem paginação) em cada nível do
+  gzip e do brotli, acerto no cache da compressão e a requisição inteira.
+
+Os tempos são de um só processo, sem rede e com o banco em arquivo local:
+servem para comparar os caminhos entre si, não como latência de produção.
+O `.env` não é lido: as configurações vêm das variáveis definidas abaixo.
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+import warnings
+from datetime import date, datetime
+from pathlib import Path
+
+RAIZ = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RAIZ))
+warnings.filterwarnings("ignore")
+
+os.environ.update(
+    DB_DIALECT="sqlite",
+    DB_NAME=os.path.join(tempfile.mkdtemp(prefix="votacao-benchmark-"), "votacao.db"),
+    DB_ASYNC="false",
+    DB_REPLICA_URLS="",
+    DB_METRICS="true",
+    SECRET_KEY="segredo-do-benchmark",
+    ALGORITHM="HS256",
+    ACCESS_TOKEN_EXPIRE_MINUTES="30",
+    HASH_WORKERS="0",
+    TOKEN_VERSION_TTL_SECONDS="3600",
+)
+
+NOMES = "Ana Bruno Carla Daniel Eduarda Fábio Gabriela Henrique Isabel João Karina Lucas Mariana Nelson Otávio Paula Rafael Sônia Tiago Vânia".split()
+SOBRENOMES = "Silva Souza Oliveira Santos Pereira Lima Carvalho Ferreira Rodrigues Almeida Costa Gomes Martins Araújo Barbosa Ribeiro".split()
+PARTIDOS = ["PT", "PL", "MDB", "PSD", "PP", "UNIÃO", "PSB", "PDT"]
+
+
+# ------------------- Dados -------------------
+
+def popular(linhas: int) -> None:
+    """
+    `linhas` vereadores, usuários e câmaras. A câmara 1 tem todos os usuários
+    (usuario-camara) e a comissão 1 tem todos os vereadores como membros; os
+    vereadores se dividem entre os mandatos das 50 primeiras câmaras.
+    """
+    from alembic import command
+    from alembic.config import Config
+    from sqlalchemy import insert
+
+    from app.db.database import SessionLocal
+    from app.models import Camara, CamaraUsuario, Comissao, ComissaoMembro, Mandato, MandatoVereador, Usuario, Vereador
+
+    command.upgrade(Config(str(RAIZ / "alembic.ini")), "head")
+    aleatorio = random.Random(42)
+
+    def nome():
+        return f"{aleatorio.choice(NOMES)} {aleatorio.choice(SOBRENOMES)} {aleatorio.choice(SOBRENOMES)}"
+
+    def digitos(n):
+        return "".join(aleatorio.choices("0123456789", k=n))
+
+    ids = range(1, linhas + 1)
+    inicio, fim = date(2025, 1, 1), date(2028, 12, 31)
+    with SessionLocal() as db:
+        db.execute(insert(Camara), [
+            {"id": i, "nome": f"Câmara Municipal {i}", "email": f"camara{i}@camara.leg.br", "cnpj": digitos(14),
+             "municipio": f"Município {i}", "uf": "PE", "numero_cadeiras": 9, "excluido": False} for i in ids
+        ])
+        db.execute(insert(Mandato), [
+            {"id": i, "camara_id": i, "descricao": "Legislatura 2025-2028", "ativo": True,
+             "data_inicio": inicio, "data_fim": fim} for i in ids
+        ])
+        db.execute(insert(Vereador), [
+            {"id": i, "nome": nome(), "email": f"vereador{i}@camara.leg.br", "cpf": digitos(11),
+             "telefone": digitos(11), "partido": aleatorio.choice(PARTIDOS), "ativo": True} for i in ids
+        ])
+        db.execute(insert(Usuario), [
+            {"id": i, "nome": nome(), "email": f"usuario{i}@camara.leg.br", "senha_hash": "-",
+             "ativo": True, "is_superuser": False} for i in ids
+        ])
+        db.execute(insert(MandatoVereador), [
+            {"id": i, "mandato_id": i % 50 + 1, "vereador_id": i, "funcao": aleatorio.randint(1, 4)} for i in ids
+        ])
+        db.execute(insert(CamaraUsuario), [
+            {"id": i, "usuario_id": i, "camara_id": 1, "vereador_id": i, "papel": aleatorio.randint(1, 3),
+             "permissao": '["votar", "presenca"]', "permissao_mask": 3, "ativo": True, "excluido": False} for i in ids
+        ])
+        db.execute(insert(Comissao), [
+            {"id": 1, "camara_id": 1, "nome": "Comissão de Finanças e Orçamento", "ativa": True, "data_inicio": datetime(2025, 1, 1)}
+        ])
+        db.execute(insert(ComissaoMembro), [
+            {"id": i, "comissao_id": 1, "mandato_vereador_id": i, "funcao": aleatorio.randint(1, 3),
+             "data_inicio": inicio, "data_fim": fim} for i in ids
+        ])
+        db.commit()
+
+
+def cliente():
+    """TestClient e o cabeçalho Authorization de um superusuário."""
+    from fastapi.testclient import TestClient
+
+    from app.main import app
+
+    client = TestClient(app)
+    dados = {"email": "admin@camara.leg.br", "nome": "Admin", "senha": "1234", "confSenha": "1234", "is_superuser": True}
+    client.post("/api/v1/usuarios/", json=dados)
+    token = client.post("/api/v1/login", data={"username": dados["email"], "password": dados["senha"]}).json()["access_token"]
+    return client, {"Authorization": f"Bearer {token}"}
+
+
+# ------------------- Medição -------------------
+
+def medir(funcao, repeticoes: int) -> tuple[float, float]:
+    """p50 e p95 (ms) de `funcao`, depois de uma execução de aquecimento."""
+    funcao()
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao()
+        tempos.append((time.perf_counter() - inicio) * 1000)
+    tempos.sort()
+    return statistics.median(tempos), tempos[min(len(tempos) - 1, int(len(tempos) * 0.95))]
+
+
+def get(client, url: str, headers: dict):
+    resposta = client.get(url, headers=headers)
+    assert resposta.status_code == 200, (url, resposta.status_code, resposta.text[:200])
+    return resposta
+
+
+def tabela(titulo: str, colunas: list[str], linhas: list[list]) -> None:
+    larguras = [max(len(str(c)) for c in coluna) for coluna in zip(colunas, *linhas)]
+    print(f"\n{titulo}")
+    for linha in (colunas, *linhas):
+        print("  " + "  ".join(str(c).rjust(w) if i else str(c).ljust(w) for i, (c, w) in enumerate(zip(linha, larguras))))
+
+
+# ------------------- Cenários -------------------
+
+def paginacao(linhas: int, repeticoes: int) -> None:
+    """
+    Página 1 e página 1.000 (limit=10): skip/limit contra cursor, na consulta
+    da página (repositório) e na requisição inteira, que inclui a consulta da
+    ETag (contagem das linhas do filtro, igual em qualquer página).
+    """
+    from app.db.database import SessionLocal
+    from app.db.pagination import encode_cursor
+    from app.repositories.camara_repository import camara_repository
+    from app.repositories.camara_usuario_repository import camara_usuario_repository
+    from app.repositories.vereador_repository import VereadorRepository
+
+    limite, pagina = 10, min(1000, linhas // 10)
+    profunda = limite * (pagina - 1)
+    resultado = []
+    with SessionLocal() as db:
+        consultas = {
+            "vereadores": lambda **kw: VereadorRepository(db).get_all(limit=limite, include_total=False, **kw),
+            "camaras": lambda **kw: camara_repository.get_multi(db, limit=limite, include_total=False, **kw),
+            "usuario-camara": lambda **kw: camara_usuario_repository.get_all_by_camara_id(db, camara_id=1, limit=limite, include_total=False, **kw),
+        }
+        for nome, consulta in consultas.items():
+            casos = {
+                "skip, página 1": dict(skip=0),
+                f"skip, página {pagina}": dict(skip=profunda),
+                "cursor, página 1": dict(cursor=""),
+                f"cursor, página {pagina}": dict(cursor=encode_cursor(profunda)),
+            }
+            for caso, kw in casos.items():
+                p50, p95 = medir(lambda: consulta(**kw), repeticoes)
+                resultado.append([nome, caso, f"{p50:.2f}", f"{p95:.2f}"])
+    tabela(f"paginacao ({linhas} linhas, limit={limite}): ms da consulta da página", ["listagem", "caso", "p50", "p95"], resultado)
+
+    client, headers = cliente()
+    resultado = []
+    for rota in ("/api/v1/vereadores/", "/api/v1/camaras/", "/api/v1/usuario-camara/camara/1"):
+        base = f"{rota}?limit={limite}&include_total=false"
+        casos = {
+            "skip, página 1": f"{base}&skip=0",
+            f"skip, página {pagina}": f"{base}&skip={profunda}",
+            "cursor, página 1": f"{base}&cursor=",
+            f"cursor, página {pagina}": f"{base}&cursor={encode_cursor(profunda)}",
+        }
+        for caso, url in casos.items():
+            p50, p95 = medir(lambda: get(client, url, headers), repeticoes)
+            resultado.append([rota, caso, f"{p50:.2f}", f"{p95:.2f}"])
+    tabela(f"paginacao ({linhas} linhas, limit={limite}): ms por requisição (GET)", ["rota", "caso", "p50", "p95"], resultado)
+
+
+def projecao(linhas: int, repeticoes: int) -> None:
+    """
+    Listagens de todas as linhas pelo caminho ORM (instâncias com joinedload,
+    montadas com `construct`) e pela projeção (colunas direto nos schemas),
+    até os bytes do JSON: tempo e pico de memória (tracemalloc).
+    """
+    import tracemalloc
+    from typing import List
+
+    from app.core.serialization import construct, get_adapter
+    from app.db.database import SessionLocal
+    from app.db.fields import page_response
+    from app.repositories.camara_repository import camara_repository
+    from app.repositories.mandato_vereador_repository import MandatoVereadorRepository
+    from app.repositories.vereador_repository import VereadorRepository
+    from app.schemas.camara_schema import PaginatedCamaraResponse
+    from app.schemas.mandato_vereador_schema import MandatoVereadorPublic
+    from app.schemas.vereador_schema import PaginatedVereadorResponse
+
+    def vereadores(projetar):
+        with SessionLocal() as db:
+            page = VereadorRepository(db).get_all(limit=linhas, include_total=False, projetar=projetar)
+            return page_response(page, PaginatedVereadorResponse).body
+
+    def camaras(projetar):
+        with SessionLocal() as db:
+            page = camara_repository.get_multi(db, limit=linhas, include_total=False, projetar=projetar)
+            return page_response(page, PaginatedCamaraResponse).body
+
+    def mandato_vereador(projetar):
+        with SessionLocal() as db:
+            itens = MandatoVereadorRepository(db).get_all(db, projetar=projetar)
+            if not projetar:
+                itens = [construct(MandatoVereadorPublic, item) for item in itens]
+            return get_adapter(List[MandatoVereadorPublic]).dump_json(itens)
+
+    resultado = []
+    for nome, listagem in (("vereadores", vereadores), ("camaras", camaras), ("mandato-vereador", mandato_vereador)):
+        assert listagem(False) == listagem(True), nome
+        for caminho, projetar in (("ORM", False), ("projeção", True)):
+            p50, p95 = medir(lambda: listagem(projetar), max(3, repeticoes // 10))
+            tracemalloc.start()
+            listagem(projetar)
+            pico = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            resultado.append([nome, caminho, f"{p50:.1f}", f"{p95:.1f}", f"{pico / 2**20:.1f}"])
+    tabela(f"projecao ({linhas} linhas): consulta + JSON", ["listagem", "caminho", "p50 ms", "p95 ms", "pico MB"], resultado)
+
+
+def auth_cache(linhas: int, repeticoes: int) -> None:
+    """
+    Rota que carrega o usuário autenticado (get_current_user) com o cache
+    do principal desligado e ligado: tempo e comandos SQL por requisição.
+    """
+    from app.core.principal_cache import principal_cache
+
+    client, headers = cliente()
+    tamanho = principal_cache.maxsize
+    resultado = []
+    for caso, maxsize in (("desligado", 0), ("ligado", tamanho)):
+        principal_cache.maxsize = maxsize
+        principal_cache.clear()
+        p50, p95 = medir(lambda: get(client, "/api/v1/usuarios/me", headers), repeticoes * 10)
+        comandos = get(client, "/api/v1/usuarios/me", headers).headers["x-db-statements"]
+        resultado.append(["/api/v1/usuarios/me", caso, comandos, f"{p50:.2f}", f"{p95:.2f}"])
+    principal_cache.maxsize = tamanho
+    tabela("auth_cache: ms por requisição", ["rota", "cache", "comandos SQL", "p50", "p95"], resultado)
+
+
+def login(linhas: int, repeticoes: int) -> None:
+    """
+    Login de usuários com 1, 50 e 500 câmaras: comandos SQL do POST /login
+    (1º login e seguinte, com o login_cache) e tempo da montagem da resposta
+    (câmaras e claims do token, sem o bcrypt), sem e com o cache.
+    """
+    from sqlalchemy import insert
+
+    from app.core.hashing import hash_password
+    from app.core.security import create_user_access_token
+    from app.db.database import SessionLocal
+    from app.models import CamaraUsuario, Usuario
+    from app.repositories.usuario_repository import UsuarioRepository
+    from app.services.auth_service import AuthService, login_cache
+
+    client, _ = cliente()
+    senha = hash_password("1234")
+    quantidades = [n for n in (1, 50, 500) if n <= linhas]
+    with SessionLocal() as db:
+        for n in quantidades:
+            usuario_id = db.execute(insert(Usuario).values(
+                nome=f"Usuário com {n} câmaras", email=f"login{n}@camara.leg.br", senha_hash=senha, ativo=True, is_superuser=False
+            )).inserted_primary_key[0]
+            db.execute(insert(CamaraUsuario), [
+                {"usuario_id": usuario_id, "camara_id": camara_id, "papel": 1, "permissao": '["votar"]',
+                 "permissao_mask": 1, "ativo": True, "excluido": False} for camara_id in range(1, n + 1)
+            ])
+        db.commit()
+
+    resultado = []
+    for n in quantidades:
+        email = f"login{n}@camara.leg.br"
+        login_cache.clear()
+        comandos = [
+            client.post("/api/v1/login", data={"username": email, "password": "1234"}).headers["x-db-statements"]
+            for _ in range(2)
+        ]
+        with SessionLocal() as db:
+            usuario = UsuarioRepository(db).get_by_email(email)
+            servico = AuthService(db)
+
+            def resposta(limpar: bool):
+                if limpar:
+                    login_cache.clear()
+                bootstrap = servico.get_session_bootstrap(usuario)
+                return create_user_access_token(usuario, bootstrap["cam"])
+
+            sem_cache = medir(lambda: resposta(True), repeticoes)
+            com_cache = medir(lambda: resposta(False), repeticoes)
+        resultado.append([n, *comandos, f"{sem_cache[0]:.2f}", f"{com_cache[0]:.2f}"])
+    tabela("login: comandos SQL do POST /login e ms (p50) da resposta sem o bcrypt",
+           ["câmaras", "comandos 1º", "comandos 2º", "sem cache", "com cache"], resultado)
+
+
+def serializacao(linhas: int, repeticoes: int) -> None:
+    """
+    Páginas de 1.000 linhas já carregadas (instâncias ORM com joinedload)
+    serializadas por três caminhos: validação + jsonable_encoder + json.dumps
+    (o caminho antigo), validação + dump_json (o do FastAPI com
+    response_model) e page_response (construct + dump_json, sem validação).
+    Só a serialização entra no tempo, não a consulta.
+    """
+    import json
+
+    from fastapi.encoders import jsonable_encoder
+
+    from app.core.serialization import get_adapter
+    from app.db.database import SessionLocal
+    from app.db.fields import page_response
+    from app.repositories.camara_usuario_repository import camara_usuario_repository
+    from app.repositories.comissao_membro_repository import ComissaoMembroRepository
+    from app.repositories.vereador_repository import VereadorRepository
+    from app.schemas.camara_usuario_schema import PaginatedCamaraUsuarioResponse
+    from app.schemas.comissao_membro_schema import PaginatedComissaoMembroResponse
+    from app.schemas.vereador_schema import PaginatedVereadorResponse
+
+    tamanho = min(1000, linhas)
+    resultado = []
+    with SessionLocal() as db:
+        paginas = (
+            (PaginatedVereadorResponse, VereadorRepository(db).get_all(limit=tamanho)),
+            (PaginatedComissaoMembroResponse, ComissaoMembroRepository(db).get_all_by_comissao_id(1, limit=tamanho)),
+            (PaginatedCamaraUsuarioResponse, camara_usuario_repository.get_all_by_camara_id(db, camara_id=1, limit=tamanho)),
+        )
+        for modelo, page in paginas:
+            adapter = get_adapter(modelo)
+            dados = {"items": page.items, "total": page.total, "next_cursor": page.next_cursor}
+            caminhos = {
+                "json": lambda: json.dumps(jsonable_encoder(adapter.dump_python(adapter.validate_python(dados, from_attributes=True), mode="json"))).encode(),
+                "dump_json": lambda: adapter.dump_json(adapter.validate_python(dados, from_attributes=True)),
+                "page_response": lambda: page_response(page, modelo).body,
+            }
+            assert len({json.dumps(json.loads(caminho())) for caminho in caminhos.values()}) == 1, modelo.__name__
+            tempos = [medir(caminho, max(3, repeticoes // 5))[0] * 1000 / tamanho for caminho in caminhos.values()]
+            resultado.append([modelo.__name__, *(f"{t:.1f}" for t in tempos)])
+    tabela(f"serializacao: ms (p50) por 1.000 linhas, páginas de {tamanho}",
+           ["response_model", "validação + json", "validação + dump_json", "page_response"], resultado)
+
+
+def compressao(linhas: int, repeticoes: int) -> None:
+    """
+    Corpo de GET /mandato-vereador/ (sem paginação): tamanho e tempo de cada
+    nível do gzip e do brotli (se instalado), custo do acerto no cache da
+    compressão (hash do corpo) e a requisição inteira sem compressão, com
+    br e com gzip (cache ligado, como em produção).
+    """
+    import gzip
+    import hashlib
+
+    from app.core.compression import brotli
+
+    client, headers = cliente()
+    rota = "/api/v1/mandato-vereador/"
+    corpo = get(client, rota, {**headers, "Accept-Encoding": "identity"}).content
+    vezes = max(3, repeticoes // 10)
+
+    niveis = [("gzip", n, lambda n=n: gzip.compress(corpo, compresslevel=n)) for n in (1, 6, 9)]
+    if brotli is not None:
+        niveis += [("br", n, lambda n=n: brotli.compress(corpo, quality=n)) for n in (1, 4, 6, 11)]
+    resultado = [["identity", "-", f"{len(corpo):,}", "-", "-"]]
+    for codificacao, nivel, comprimir in niveis:
+        tamanho = len(comprimir())
+        p50, _ = medir(comprimir, vezes if nivel < 10 else 3)
+        resultado.append([codificacao, nivel, f"{tamanho:,}", f"{tamanho / len(corpo):.3f}", f"{p50:.1f}"])
+    p50, _ = medir(lambda: hashlib.blake2b(corpo, digest_size=16).digest(), repeticoes)
+    resultado.append(["acerto no cache", "-", "-", "-", f"{p50:.2f}"])
+    tabela(f"compressao: corpo de {rota} ({linhas} linhas)", ["codificação", "nível", "bytes", "razão", "p50 ms"], resultado)
+
+    resultado = []
+    for codificacao in ("identity", *(("br",) if brotli is not None else ()), "gzip"):
+        cabecalhos = {**headers, "Accept-Encoding": codificacao}
+        resposta = get(client, rota, cabecalhos)
+        p50, p95 = medir(lambda: get(client, rota, cabecalhos), vezes)
+        resultado.append([codificacao, resposta.headers.get("content-encoding", "-"), f"{p50:.1f}", f"{p95:.1f}"])
+    tabela(f"compressao: ms por requisição (GET {rota}, TestClient descomprime)",
+           ["Accept-Encoding", "Content-Encoding", "p50", "p95"], resultado)
+
+
+CENARIOS = {
+    "paginacao": paginacao,
+    "projecao": projecao,
+    "auth_cache": auth_cache,
+    "login": login,
+    "serializacao": serializacao,
+    "compressao": compressao,
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("cenarios", nargs="*", choices=[[], *CENARIOS], help="cenários a executar (padrão: todos)")
+    parser.add_argument("--linhas", type=int, default=10000, help="linhas de cada tabela (padrão: 10000)")
+    parser.add_argument("--repeticoes", type=int, default=50, help="repetições de cada medida (padrão: 50)")
+    args = parser.parse_args()
+
+    inicio = time.perf_counter()
+    popular(args.linhas)
+    print(f"banco populado com {args.linhas} linhas por tabela em {time.perf_counter() - inicio:.1f} s")
+    for nome in args.cenarios or CENARIOS:
+        CENARIOS[nome](args.linhas, args.repeticoes)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+# tests/conftest.py
+"""
+Banco SQLite temporário, criado pelas migrações do Alembic (com os mesmos
+índices da produção), e dados fixos para as rotas de leitura.
+
+As variáveis de ambiente são definidas antes de importar a aplicação: as
+configurações (app/core/config.py) são lidas no import.
+"""
+import os
+import tempfile
+from datetime import date, datetime
+from pathlib import Path
+
+RAIZ = Path(__file__).resolve().parent.parent
+
+os.environ.update(
+    DB_DIALECT="sqlite",
+    DB_NAME=os.path.join(tempfile.mkdtemp(prefix="votacao-testes-"), "votacao.db"),
+    DB_ASYNC="false",
+    DB_REPLICA_URLS="",
+    DB_METRICS="true",             # X-DB-Statements/X-DB-Commits em cada resposta
+    SECRET_KEY="segredo-dos-testes",
+    ALGORITHM="HS256",
+    ACCESS_TOKEN_EXPIRE_MINUTES="30",
+    HASH_WORKERS="0",              # bcrypt na própria thread
+    TOKEN_VERSION_TTL_SECONDS="3600",  # sem releitura das versões no meio de um teste
+)
+
+import pytest
+from alembic import command
+from alembic.config import Config
+from fastapi.testclient import TestClient
+
+# Quantidade de cada entidade nos dados dos testes
+CAMARAS = 10
+VEREADORES = 200
+
+
+def _popular(db) -> None:
+    from app.models.camara_model import Camara
+    from app.models.camara_usuario_model import CamaraUsuario
+    from app.models.comissao_membro import ComissaoMembro
+    from app.models.comissao_model import Comissao
+    from app.models.mandato_model import Mandato
+    from app.models.mandato_vereador_model import MandatoVereador
+    from app.models.usuario_model import Usuario
+    from app.models.vereador_model import Vereador
+
+    for i in range(1, CAMARAS + 1):
+        # As duas últimas câmaras estão excluídas (exclusão lógica)
+        db.add(Camara(id=i, nome=f"Câmara {i}", email=f"camara{i}@camara.leg.br", cnpj=f"{i:014}",
+                      municipio="Recife", uf="PE", excluido=i > CAMARAS - 2))
+        db.add(Mandato(id=i, camara_id=i, descricao=f"Legislatura {i}", ativo=True,
+                       data_inicio=date(2025, 1, 1), data_fim=date(2028, 12, 31)))
+        db.add(Comissao(id=i, camara_id=i, nome=f"Comissão {i}", data_inicio=datetime(2025, 1, 1)))
+    db.flush()
+
+    for i in range(1, VEREADORES + 1):
+        camara_id = i % CAMARAS + 1
+        db.add(Vereador(id=i, nome=f"Vereador {i}", email=f"vereador{i}@camara.leg.br", cpf=f"{i:011}",
+                        telefone="81999999999", partido="PARTIDO"))
+        db.add(Usuario(id=i + 1, nome=f"Usuário {i}", email=f"usuario{i}@camara.leg.br", senha_hash="-"))
+        db.flush()
+        db.add(MandatoVereador(id=i, mandato_id=camara_id, vereador_id=i, funcao=1))
+        db.add(CamaraUsuario(usuario_id=i + 1, camara_id=camara_id, vereador_id=i, papel=1, permissao="[]"))
+        db.flush()
+        db.add(ComissaoMembro(id=i, comissao_id=camara_id, mandato_vereador_id=i, funcao=1,
+                              data_inicio=date(2025, 1, 1), data_fim=date(2026, 12, 31)))
+    db.commit()
+
+
+@pytest.fixture(scope="session")
+def app():
+    """Aplicação sobre o banco migrado (alembic upgrade head) e populado."""
+    command.upgrade(Config(str(RAIZ / "alembic.ini")), "head")
+
+    from app.db.database import SessionLocal
+    from app.main import app as aplicacao
+
+    with SessionLocal() as db:
+        _popular(db)
+    return aplicacao
+
+
+@pytest.fixture(scope="session")
+def client(app):
+    return TestClient(app)
+
+
+@pytest.fixture(scope="session")
+def auth_headers(client):
+    """Cabeçalho Authorization de um superusuário."""
+    dados = {"email": "admin@camara.leg.br", "nome": "Admin", "senha": "1234", "confSenha": "1234", "is_superuser": True}
+    assert client.post("/api/v1/usuarios/", json=dados).status_code == 201
+    resposta = client.post("/api/v1/login", data={"username": dados["email"], "password": dados["senha"]})
+    headers = {"Authorization": f"Bearer {resposta.json()['access_token']}"}
+    # Carrega as versões dos tokens (app/core/token_version.py) antes dos testes
+    assert client.get("/api/v1/usuarios/me", headers=headers).status_code == 200
+    return headers
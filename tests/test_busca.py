@@ -0,0 +1,50 @@
+# tests/test_busca.py
+"""
+Busca do parâmetro `filtro` (app/db/search.py): encontra qualquer trecho
+das colunas pesquisáveis, sem diferenciar acentos, tanto pelo índice FTS5
+(palavras com 3 caracteres ou mais) quanto pela busca simples.
+"""
+import pytest
+
+
+def _nomes(client, url, headers) -> list[str]:
+    resposta = client.get(url, headers=headers)
+    assert resposta.status_code == 200, resposta.text
+    return sorted(item["nome"] for item in resposta.json()["items"])
+
+
+@pytest.mark.parametrize("filtro", ["ereador 123", "EADOR 123", "vereadôr 123"])
+def test_encontra_trecho_no_meio_da_palavra(client, auth_headers, filtro):
+    assert _nomes(client, f"/api/v1/vereadores/?filtro={filtro}", auth_headers) == ["Vereador 123"]
+
+
+@pytest.mark.parametrize("filtro", ["camara", "CAMARA", "Câmara", "amar"])
+def test_ignora_acentos_no_texto_e_no_filtro(client, auth_headers, filtro):
+    # As câmaras 9 e 10 estão excluídas
+    esperados = sorted(f"Câmara {i}" for i in range(1, 9))
+    assert _nomes(client, f"/api/v1/camaras/?filtro={filtro}", auth_headers) == esperados
+
+
+@pytest.mark.parametrize("filtro", ["comissao", "missao", "Missão"])
+def test_trecho_sem_acento_de_palavra_acentuada(client, auth_headers, filtro):
+    assert _nomes(client, f"/api/v1/comissoes/camara/3?filtro={filtro}", auth_headers) == ["Comissão 3"]
+
+
+@pytest.mark.parametrize("filtro", ["mara 3", "câmara 3", "a 3"])
+def test_palavras_curtas_usam_a_busca_simples_sem_acentos(client, auth_headers, filtro):
+    # "3" e "a" são curtas demais para o índice de trigramas
+    assert _nomes(client, f"/api/v1/camaras/?filtro={filtro}", auth_headers) == ["Câmara 3"]
+
+
+def test_indice_acompanha_as_alteracoes(client, auth_headers):
+    url = "/api/v1/vereadores/200"
+    original = client.get(url, headers=auth_headers).json()["nome"]
+    try:
+        resposta = client.put(url, json={"nome": "Joaquim Magalhães"}, headers=auth_headers)
+        assert resposta.status_code == 200, resposta.text
+        assert _nomes(client, "/api/v1/vereadores/?filtro=galhaes", auth_headers) == ["Joaquim Magalhães"]
+        # O e-mail (vereador200@...) continua igual
+        assert _nomes(client, "/api/v1/vereadores/?filtro=ereador 200", auth_headers) == ["Joaquim Magalhães"]
+    finally:
+        client.put(url, json={"nome": original}, headers=auth_headers)
+    assert _nomes(client, "/api/v1/vereadores/?filtro=galhaes", auth_headers) == []
@@ -0,0 +1,29 @@
+# tests/test_cache_do_usuario.py
+"""Cache do usuário autenticado (app/core/principal_cache.py)."""
+
+
+def _login(client, email: str, senha: str = "1234") -> dict:
+    resposta = client.post("/api/v1/login", data={"username": email, "password": senha})
+    assert resposta.status_code == 200, resposta.text
+    return {"Authorization": f"Bearer {resposta.json()['access_token']}"}
+
+
+def test_usuario_em_cache_e_invalidado_na_alteracao(client, auth_headers):
+    dados = {"email": "cache@camara.leg.br", "nome": "Antes", "senha": "1234", "confSenha": "1234"}
+    associacao = {"camara_id": 1, "papel": 1, "permissao": ["votar"], "usuario": dados}
+    resposta = client.post("/api/v1/usuario-camara/", json=associacao, headers=auth_headers)
+    assert resposta.status_code == 201, resposta.text
+    usuario_id = resposta.json()["usuario"]["id"]
+    headers = _login(client, dados["email"])
+
+    client.get("/api/v1/usuarios/me", headers=headers)
+    resposta = client.get("/api/v1/usuarios/me", headers=headers)
+    assert resposta.json()["nome"] == "Antes"
+    assert resposta.headers["x-db-statements"] == "0"
+
+    assert client.put(f"/api/v1/usuarios/{usuario_id}", json={"nome": "Depois"}, headers=auth_headers).status_code == 200
+    assert client.get("/api/v1/usuarios/me", headers=headers).json()["nome"] == "Depois"
+
+    # Desativar o usuário revoga os tokens dele (app/core/token_version.py)
+    assert client.put(f"/api/v1/usuarios/{usuario_id}", json={"ativo": False}, headers=auth_headers).status_code == 200
+    assert client.get("/api/v1/usuarios/me", headers=headers).status_code == 401
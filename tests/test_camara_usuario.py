@@ -0,0 +1,56 @@
+# tests/test_camara_usuario.py
+"""Associação de usuários com câmaras excluídas (exclusão lógica)."""
+
+
+def _associar(client, headers, camara_id: int, usuario: dict):
+    dados = {"camara_id": camara_id, "papel": 1, "permissao": ["votar"], "usuario": usuario}
+    return client.post("/api/v1/usuario-camara/", json=dados, headers=headers)
+
+
+def _criar_camara(client, headers, nome: str) -> int:
+    dados = {"nome": nome, "email": f"{nome.lower()}@camara.leg.br", "municipio": "Olinda", "uf": "PE"}
+    resposta = client.post("/api/v1/camaras/", json=dados, headers=headers)
+    assert resposta.status_code == 201, resposta.text
+    return resposta.json()["id"]
+
+
+def test_associar_novo_usuario_a_camara_excluida(client, auth_headers):
+    camara_id = _criar_camara(client, auth_headers, "Excluida1")
+    assert client.delete(f"/api/v1/camaras/{camara_id}", headers=auth_headers).status_code == 200
+
+    usuario = {"email": "novo.usuario@camara.leg.br", "nome": "Novo", "senha": "1234", "confSenha": "1234"}
+    resposta = _associar(client, auth_headers, camara_id, usuario)
+    assert resposta.status_code == 404
+    assert resposta.json()["detail"] == "Câmara não encontrada"
+    # O usuário criado na mesma transação foi desfeito
+    assert client.get(f"/api/v1/usuarios/email/{usuario['email']}", headers=auth_headers).status_code == 404
+
+
+def test_reativar_associacao_de_camara_excluida(client, auth_headers):
+    camara_id = _criar_camara(client, auth_headers, "Excluida2")
+    usuario = {"id": 2, "email": "usuario1@camara.leg.br", "nome": "Usuário 1", "senha": "1234", "confSenha": "1234"}
+    associacao = _associar(client, auth_headers, camara_id, usuario)
+    assert associacao.status_code == 201, associacao.text
+    assert client.delete(f"/api/v1/usuario-camara/{associacao.json()['id']}", headers=auth_headers).status_code == 200
+    assert client.delete(f"/api/v1/camaras/{camara_id}", headers=auth_headers).status_code == 200
+
+    resposta = _associar(client, auth_headers, camara_id, usuario)
+    assert resposta.status_code == 404
+    assert resposta.json()["detail"] == "Câmara não encontrada"
+
+
+def test_usuario_inexistente(client, auth_headers):
+    usuario = {"id": 999999, "email": "inexistente@camara.leg.br", "nome": "Inexistente", "senha": "1234", "confSenha": "1234"}
+    resposta = _associar(client, auth_headers, 3, usuario)
+    assert resposta.status_code == 404
+    assert resposta.json()["detail"] == "Usuário com ID 999999 não encontrado."
+
+
+def test_vereador_inexistente(client, auth_headers):
+    usuario = {"email": "sem.vereador@camara.leg.br", "nome": "Sem vereador", "senha": "1234", "confSenha": "1234"}
+    dados = {"camara_id": 3, "papel": 1, "permissao": ["votar"], "vereador_id": 999999, "usuario": usuario}
+    resposta = client.post("/api/v1/usuario-camara/", json=dados, headers=auth_headers)
+    assert resposta.status_code == 404
+    assert resposta.json()["detail"] == "Vereador com ID 999999 não encontrado."
+    # O usuário criado na mesma transação foi desfeito
+    assert client.get(f"/api/v1/usuarios/email/{usuario['email']}", headers=auth_headers).status_code == 404
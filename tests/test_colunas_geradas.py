@@ -0,0 +1,12 @@
+# tests/test_colunas_geradas.py
+"""Colunas geradas pelo banco lidas no próprio INSERT/UPDATE (RETURNING)."""
+
+
+def test_insert_traz_as_colunas_geradas(client, auth_headers):
+    dados = {"nome": "Paulista", "email": "paulista@camara.leg.br", "municipio": "Paulista", "uf": "PE"}
+    resposta = client.post("/api/v1/camaras/", json=dados, headers=auth_headers)
+    assert resposta.status_code == 201, resposta.text
+    assert resposta.json()["dt_cadastro"] and resposta.json()["dt_atualizado"]
+    # Só o INSERT ... RETURNING (o usuário autenticado vem do cache), sem
+    # refresh nem releitura depois do commit
+    assert resposta.headers["x-db-statements"] == "1"
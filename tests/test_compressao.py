@@ -0,0 +1,42 @@
+# tests/test_compressao.py
+"""Compressão das respostas negociada pelo Accept-Encoding (app/core/compression.py)."""
+import gzip
+
+import pytest
+
+from app.core.compression import brotli, negotiate
+
+URL = "/api/v1/mandato-vereador/"
+
+
+@pytest.mark.parametrize("accept_encoding, esperado", [
+    ("gzip", "gzip"),
+    ("br;q=0.5, gzip", "gzip"),
+    ("gzip;q=0, identity", None),
+    ("identity", None),
+    ("", None),
+])
+def test_negociacao(accept_encoding, esperado):
+    assert negotiate(accept_encoding) == esperado
+
+
+def test_gzip_devolve_o_mesmo_corpo(client, auth_headers):
+    identidade = client.get(URL, headers={**auth_headers, "Accept-Encoding": "identity"})
+    assert "content-encoding" not in identidade.headers
+    assert "Accept-Encoding" in identidade.headers["vary"]
+
+    resposta = client.get(URL, headers={**auth_headers, "Accept-Encoding": "gzip"})
+    assert resposta.headers["content-encoding"] == "gzip"
+    assert resposta.content == identidade.content
+    assert resposta.headers["etag"].startswith("W/")
+
+
+@pytest.mark.skipif(brotli is None, reason="pacote brotli não instalado")
+def test_brotli_tem_preferencia(client, auth_headers):
+    resposta = client.get(URL, headers={**auth_headers, "Accept-Encoding": "gzip, br"})
+    assert resposta.headers["content-encoding"] == "br"
+
+
+def test_resposta_pequena_nao_e_comprimida(client, auth_headers):
+    resposta = client.get("/api/v1/vereadores/1", headers={**auth_headers, "Accept-Encoding": "gzip"})
+    assert "content-encoding" not in resposta.headers
@@ -0,0 +1,51 @@
+# tests/test_consultas_das_listagens.py
+"""
+Número de comandos SQL de cada listagem (X-DB-Statements, DB_METRICS=true).
+
+As relações serializadas pelos schemas aninhados vêm na mesma consulta da
+página (JOINs ou projeção), então o número de comandos é fixo e não
+depende do tamanho da página: um N+1 faz esses números crescerem.
+"""
+import pytest
+
+# (rota, comandos SQL esperados) das listagens paginadas
+PAGINADAS = [
+    ("/api/v1/camaras/", 2),
+    ("/api/v1/camaras/?view=lean", 2),
+    ("/api/v1/vereadores/", 2),
+    ("/api/v1/usuarios/", 1),
+    ("/api/v1/mandato-vereador/mandato/2", 4),
+    ("/api/v1/mandato-vereador/mandato/2?view=lean", 4),
+    ("/api/v1/mandatos/camara/2", 4),
+    ("/api/v1/mandatos/camara/2?fields=descricao,camara.nome", 4),
+    ("/api/v1/comissoes/camara/2", 4),
+    ("/api/v1/comissao-membros/comissao/2", 4),
+    ("/api/v1/comissao-membros/comissao/2?include=comissao,mandato_vereador.mandato", 4),
+    ("/api/v1/comissao-membros/comissao/2?fields=funcao,mandato_vereador.vereador.nome", 4),
+    ("/api/v1/usuario-camara/camara/2", 4),
+    ("/api/v1/usuario-camara/camara/2?fields=papel,usuario.nome,camara.nome", 4),
+]
+
+SEM_PAGINACAO = [
+    ("/api/v1/mandato-vereador/", 2),
+    ("/api/v1/mandato-vereador/?camara_id=2", 2),
+    ("/api/v1/mandato-vereador/?camara_id=2&fields=vereador.nome", 2),
+]
+
+
+def _comandos(client, url, headers) -> int:
+    resposta = client.get(url, headers=headers)
+    assert resposta.status_code == 200, resposta.text
+    return int(resposta.headers["x-db-statements"])
+
+
+@pytest.mark.parametrize("url, esperado", PAGINADAS + SEM_PAGINACAO)
+def test_comandos_por_listagem(client, auth_headers, url, esperado):
+    assert _comandos(client, url, auth_headers) == esperado
+
+
+@pytest.mark.parametrize("url, esperado", PAGINADAS)
+def test_comandos_nao_dependem_do_tamanho_da_pagina(client, auth_headers, url, esperado):
+    separador = "&" if "?" in url else "?"
+    assert _comandos(client, f"{url}{separador}limit=1", auth_headers) == esperado
+    assert _comandos(client, f"{url}{separador}limit=100", auth_headers) == esperado
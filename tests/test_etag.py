@@ -0,0 +1,33 @@
+# tests/test_etag.py
+"""Leituras condicionais com ETag / If-None-Match (app/core/etag.py)."""
+import time
+
+import pytest
+
+
+@pytest.mark.parametrize("url", [
+    "/api/v1/vereadores/",
+    "/api/v1/vereadores/3",
+    "/api/v1/comissao-membros/comissao/3",
+    "/api/v1/usuario-camara/camara/3",
+])
+def test_mesma_etag_devolve_304(client, auth_headers, url):
+    resposta = client.get(url, headers=auth_headers)
+    etag = resposta.headers["etag"]
+    condicional = client.get(url, headers={**auth_headers, "If-None-Match": etag})
+    assert condicional.status_code == 304
+    assert condicional.content == b""
+    assert client.get(url, headers={**auth_headers, "If-None-Match": '"outra"'}).content == resposta.content
+
+
+def test_alteracao_muda_a_etag(client, auth_headers):
+    url = "/api/v1/comissoes/camara/4"
+    etag = client.get(url, headers=auth_headers).headers["etag"]
+    # dt_atualizado tem resolução de um segundo no SQLite
+    time.sleep(1)
+    assert client.put("/api/v1/comissoes/4", json={"nome": "Comissão alterada"}, headers=auth_headers).status_code == 200
+
+    resposta = client.get(url, headers={**auth_headers, "If-None-Match": etag})
+    assert resposta.status_code == 200
+    assert resposta.headers["etag"] != etag
+    assert resposta.json()["items"][0]["nome"] == "Comissão alterada"
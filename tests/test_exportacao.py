@@ -0,0 +1,48 @@
+# tests/test_exportacao.py
+"""Exportação das listagens em CSV e NDJSON (app/db/export.py)."""
+import csv
+import io
+import json
+
+import pytest
+
+EXPORTACOES = [
+    ("/api/v1/vereadores/exportar", "/api/v1/vereadores/"),
+    ("/api/v1/usuario-camara/camara/2/exportar", "/api/v1/usuario-camara/camara/2"),
+    ("/api/v1/comissao-membros/comissao/2/exportar", "/api/v1/comissao-membros/comissao/2"),
+]
+
+
+def _listagem(client, rota, headers) -> list[dict]:
+    separador = "&" if "?" in rota else "?"
+    return client.get(f"{rota}{separador}limit=1000", headers=headers).json()["items"]
+
+
+@pytest.mark.parametrize("exportacao, listagem", EXPORTACOES)
+def test_ndjson_traz_os_itens_da_listagem(client, auth_headers, exportacao, listagem):
+    resposta = client.get(f"{exportacao}?formato=ndjson", headers=auth_headers)
+    assert resposta.status_code == 200
+    assert resposta.headers["content-type"] == "application/x-ndjson"
+    linhas = [json.loads(linha) for linha in resposta.text.splitlines()]
+    assert sorted(linhas, key=lambda item: item["id"]) == _listagem(client, listagem, auth_headers)
+
+
+@pytest.mark.parametrize("exportacao, listagem", EXPORTACOES)
+def test_csv_achata_os_campos_aninhados(client, auth_headers, exportacao, listagem):
+    resposta = client.get(exportacao, headers=auth_headers)
+    assert resposta.status_code == 200
+    assert resposta.headers["content-type"].startswith("text/csv")
+    assert "attachment" in resposta.headers["content-disposition"]
+    linhas = list(csv.DictReader(io.StringIO(resposta.text.lstrip("\ufeff"))))
+    itens = _listagem(client, listagem, auth_headers)
+    assert sorted(int(linha["id"]) for linha in linhas) == [item["id"] for item in itens]
+    aninhados = [chave for chave, valor in itens[0].items() if isinstance(valor, dict)]
+    for relacao in aninhados:
+        assert f"{relacao}.id" in linhas[0]
+
+
+def test_exportacao_aplica_o_filtro(client, auth_headers):
+    resposta = client.get("/api/v1/vereadores/exportar?formato=ndjson&filtro=Vereador 17", headers=auth_headers)
+    nomes = [json.loads(linha)["nome"] for linha in resposta.text.splitlines()]
+    assert "Vereador 17" in nomes
+    assert len(nomes) < 200
@@ -0,0 +1,51 @@
+# tests/test_hash_de_senhas.py
+"""Pool do bcrypt cheio: 503 com Retry-After, sem ocupar o servidor (app/core/hashing.py)."""
+import threading
+
+import pytest
+
+from app.core import hashing
+from app.core.config import settings
+
+
+@pytest.fixture
+def pool_cheio(monkeypatch):
+    """Todas as vagas do pool ocupadas."""
+    vagas = threading.BoundedSemaphore(1)
+    vagas.acquire()
+    monkeypatch.setattr(hashing._executor, "_vagas", vagas)
+
+
+def _assert_ocupado(resposta):
+    assert resposta.status_code == 503, resposta.text
+    assert resposta.headers["retry-after"] == str(settings.HASH_RETRY_AFTER_SECONDS)
+
+
+def test_cadastro_com_pool_cheio(client, auth_headers, pool_cheio):
+    dados = {"email": "pool.cheio@camara.leg.br", "nome": "Pool", "senha": "1234", "confSenha": "1234"}
+    _assert_ocupado(client.post("/api/v1/usuarios/", json=dados))
+    associacao = {"camara_id": 1, "papel": 1, "permissao": ["votar"], "usuario": dados}
+    _assert_ocupado(client.post("/api/v1/usuario-camara/", json=associacao, headers=auth_headers))
+    # Nada foi gravado
+    assert client.get(f"/api/v1/usuarios/email/{dados['email']}", headers=auth_headers).status_code == 404
+
+
+def test_troca_de_senha_com_pool_cheio(client, auth_headers, pool_cheio):
+    senha = {"senha": "4321", "confSenha": "4321"}
+    _assert_ocupado(client.put("/api/v1/usuarios/3", json=senha, headers=auth_headers))
+    # Sem senha não há bcrypt: a alteração passa
+    assert client.put("/api/v1/usuarios/3", json={"nome": "Usuário 2"}, headers=auth_headers).status_code == 200
+
+
+def test_login_com_pool_cheio(client, pool_cheio):
+    _assert_ocupado(client.post("/api/v1/login", data={"username": "admin@camara.leg.br", "password": "1234"}))
+
+
+def test_cadastro_nao_chama_o_bcrypt_na_thread(client, monkeypatch):
+    """O hash vem da rota (pool de processos), não do hash síncrono do serviço."""
+    def sincrono(_):
+        raise AssertionError("hash síncrono chamado")
+    monkeypatch.setattr("app.services.usuario_service.get_password_hash", sincrono)
+
+    dados = {"email": "hash.assincrono@camara.leg.br", "nome": "Hash", "senha": "1234", "confSenha": "1234"}
+    assert client.post("/api/v1/usuarios/", json=dados).status_code == 201
@@ -0,0 +1,39 @@
+# tests/test_importacao.py
+"""Importação em lote de vereadores de um mandato (POST /mandato-vereador/importar)."""
+
+
+def _vereador(n: int, email: str = "") -> dict:
+    return {"nome": f"Importado {n}", "email": email or f"importado{n}@camara.leg.br", "cpf": f"9{n:010}",
+            "telefone": "81988888888", "partido": "PARTIDO"}
+
+
+def test_importacao_com_linhas_validas_e_invalidas(client, auth_headers):
+    # O vereador 1 é do mandato 2 e o vereador 2 já é do mandato 3 (tests/conftest.py)
+    itens = [
+        {"funcao": 1, "vereador_id": 1},
+        {"funcao": 1, "vereador_id": 2},
+        {"funcao": 2, "vereador": _vereador(1)},
+        {"funcao": 1, "vereador": _vereador(2, email="vereador5@camara.leg.br")},
+        {"funcao": 1, "vereador_id": 9999},
+    ]
+    resposta = client.post("/api/v1/mandato-vereador/importar", json={"mandato_id": 3, "itens": itens}, headers=auth_headers)
+    assert resposta.status_code == 200, resposta.text
+    corpo = resposta.json()
+    assert [r["status"] for r in corpo["resultados"]] == ["associado", "erro", "criado", "associado", "erro"]
+    assert (corpo["criados"], corpo["associados"], corpo["erros"]) == (1, 2, 2)
+    assert corpo["resultados"][3]["vereador_id"] == 5
+    assert resposta.headers["x-db-commits"] == "1"
+
+    associados = client.get("/api/v1/mandato-vereador/mandato/3?limit=1000", headers=auth_headers).json()["items"]
+    ids = {item["vereador"]["id"] for item in associados}
+    assert {1, 2, 5, corpo["resultados"][2]["vereador_id"]} <= ids
+
+
+def test_comandos_nao_dependem_do_numero_de_linhas(client, auth_headers):
+    def importar(inicio: int, quantidade: int) -> int:
+        itens = [{"funcao": 1, "vereador": _vereador(n)} for n in range(inicio, inicio + quantidade)]
+        resposta = client.post("/api/v1/mandato-vereador/importar", json={"mandato_id": 4, "itens": itens}, headers=auth_headers)
+        assert resposta.json()["criados"] == quantidade
+        return int(resposta.headers["x-db-statements"])
+
+    assert importar(100, 2) == importar(200, 50)
@@ -0,0 +1,24 @@
+# tests/test_include.py
+"""Relações trazidas uma vez só em `included` (?include=)."""
+
+
+def test_include_separa_as_relacoes_repetidas(client, auth_headers):
+    url = "/api/v1/comissao-membros/comissao/2"
+    completo = client.get(url, headers=auth_headers).json()
+    resposta = client.get(f"{url}?include=comissao,mandato_vereador.mandato", headers=auth_headers)
+    assert resposta.status_code == 200, resposta.text
+    corpo = resposta.json()
+
+    assert corpo["total"] == completo["total"]
+    assert set(corpo["included"]) == {"comissao", "mandato_vereador", "mandato_vereador.mandato"}
+    assert list(corpo["included"]["comissao"]) == ["2"]
+    for item, original in zip(corpo["items"], completo["items"]):
+        assert "comissao" not in item and item["comissao_id"] == 2
+        assert corpo["included"]["comissao"]["2"] == original["comissao"]
+        mandato = original["mandato_vereador"]["mandato"]
+        assert corpo["included"]["mandato_vereador.mandato"][str(mandato["id"])] == mandato
+
+
+def test_include_desconhecido(client, auth_headers):
+    resposta = client.get("/api/v1/comissao-membros/comissao/2?include=inexistente", headers=auth_headers)
+    assert resposta.status_code == 400
@@ -0,0 +1,58 @@
+# tests/test_indices_das_listagens.py
+"""
+As listagens filtradas usam os índices das migrações (0002, 0004 e 0005):
+o plano (EXPLAIN QUERY PLAN) das consultas de cada rota sobre a tabela
+filtrada não tem varredura completa (`SCAN <tabela>`) e usa o índice.
+"""
+import re
+
+import pytest
+from sqlalchemy import event
+
+# (rota, tabela filtrada, índice esperado)
+LISTAGENS = [
+    ("/api/v1/camaras/", "camara", "ix_camara_nao_excluidas"),
+    ("/api/v1/camaras/?cursor=", "camara", "ix_camara_nao_excluidas"),
+    ("/api/v1/camaras/?skip=3&limit=2", "camara", "ix_camara_nao_excluidas"),
+    ("/api/v1/usuario-camara/camara/2", "camara_usuario", "ix_camara_usuario_camara_id_excluido"),
+    ("/api/v1/usuario-camara/camara/2?cursor=&limit=5", "camara_usuario", "ix_camara_usuario_camara_id_excluido"),
+    ("/api/v1/mandatos/camara/2", "mandato", "ix_mandato_camara_id_ativo"),
+    ("/api/v1/comissoes/camara/2", "comissao", "ix_comissao_camara_id"),
+    ("/api/v1/comissao-membros/comissao/2", "comissao_membro", "ix_comissao_membro_comissao_id"),
+    ("/api/v1/comissao-membros/comissao/2?skip=5&limit=5", "comissao_membro", "ix_comissao_membro_comissao_id"),
+    ("/api/v1/mandato-vereador/mandato/2", "mandato_vereador", "ux_mandato_vereador_mandato_id_vereador_id"),
+    ("/api/v1/mandato-vereador/?camara_id=2", "mandato_vereador", "ix_mandato_camara_id_ativo"),
+]
+
+
+def _consultas(engine, client, url, headers) -> list:
+    """Comandos SQL (e parâmetros) executados pela requisição."""
+    comandos = []
+
+    def capturar(conn, cursor, statement, parameters, context, executemany):
+        comandos.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", capturar)
+    try:
+        resposta = client.get(url, headers=headers)
+    finally:
+        event.remove(engine, "before_cursor_execute", capturar)
+    assert resposta.status_code == 200, resposta.text
+    return comandos
+
+
+@pytest.mark.parametrize("url, tabela, indice", LISTAGENS)
+def test_listagem_filtrada_usa_indice(client, auth_headers, url, tabela, indice):
+    from app.db.database import engine
+
+    consultas = [
+        (sql, params) for sql, params in _consultas(engine, client, url, auth_headers)
+        if re.search(rf"\bFROM {tabela}\b", sql)
+    ]
+    assert consultas, f"nenhuma consulta em {tabela}"
+
+    with engine.connect() as conn:
+        for sql, params in consultas:
+            plano = [linha[3] for linha in conn.exec_driver_sql("EXPLAIN QUERY PLAN " + sql, params)]
+            assert not [passo for passo in plano if re.fullmatch(r"SCAN \w+", passo)], (sql, plano)
+            assert any(indice in passo for passo in plano), (sql, plano)
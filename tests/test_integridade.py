@@ -0,0 +1,40 @@
+# tests/test_integridade.py
+"""Tradução das violações de integridade (app/db/integrity.py)."""
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from app.db.integrity import integrity_http_error
+from app.repositories.mandato_repository import MandatoRepository
+
+
+@pytest.mark.parametrize("mensagem", [
+    "UNIQUE constraint failed: mandato.camara_id",  # SQLite
+    'duplicate key value violates unique constraint "ux_mandato_camara_id_ativo"\n'
+    "DETAIL:  Key (camara_id)=(2) already exists.",  # PostgreSQL
+    "(1062, \"Duplicate entry '2' for key 'mandato.ux_mandato_camara_id_ativo_fn'\")",  # MySQL
+])
+def test_mandato_ativo_duplicado_e_conflito(mensagem):
+    erro = integrity_http_error(IntegrityError("INSERT INTO mandato ...", {}, Exception(mensagem)))
+    assert erro.status_code == 409
+    assert erro.detail == "Já existe um mandato ativo para esta câmara."
+
+
+def test_ativacao_simultanea_de_mandatos(client, auth_headers, monkeypatch):
+    # A outra requisição ativou um mandato depois da desativação desta
+    monkeypatch.setattr(MandatoRepository, "deactivate_all_active_by_camara", lambda self, db, **kwargs: None)
+
+    dados = {"descricao": "Nova legislatura", "ativo": True, "data_inicio": "2029-01-01",
+             "data_fim": "2032-12-31", "camara_id": 3}
+    resposta = client.post("/api/v1/mandatos/", json=dados, headers=auth_headers)
+    assert resposta.status_code == 409
+    assert resposta.json()["detail"] == "Já existe um mandato ativo para esta câmara."
+
+
+def test_referencia_identificada_pelo_banco_dispensa_consulta():
+    from app.db.integrity import missing_reference_http_error
+
+    mensagem = ('insert or update on table "camara_usuario" violates foreign key constraint "fk"\n'
+                "DETAIL:  Key (usuario_id)=(7) is not present in table \"usuario\".")  # PostgreSQL
+    referencias = {("camara_usuario", ("usuario_id",)): (None, 7, "Usuário com ID 7 não encontrado.")}
+    erro = missing_reference_http_error(None, IntegrityError("INSERT ...", {}, Exception(mensagem)), referencias)
+    assert (erro.status_code, erro.detail) == (404, "Usuário com ID 7 não encontrado.")
@@ -0,0 +1,42 @@
+# tests/test_login.py
+"""Câmaras do login numa só consulta e cache da sessão (AuthService.get_session_bootstrap)."""
+
+
+def _usuario_com_camaras(client, headers, email: str, camaras: list[int]) -> int:
+    usuario = {"email": email, "nome": email, "senha": "1234", "confSenha": "1234"}
+    usuario_id = None
+    for camara_id in camaras:
+        if usuario_id:
+            usuario = {**usuario, "id": usuario_id}
+        dados = {"camara_id": camara_id, "papel": 1, "permissao": ["votar"], "usuario": usuario}
+        resposta = client.post("/api/v1/usuario-camara/", json=dados, headers=headers)
+        assert resposta.status_code == 201, resposta.text
+        usuario_id = resposta.json()["usuario"]["id"]
+    return usuario_id
+
+
+def _login(client, email: str):
+    resposta = client.post("/api/v1/login", data={"username": email, "password": "1234"})
+    assert resposta.status_code == 200, resposta.text
+    return resposta
+
+
+def test_comandos_do_login_nao_dependem_das_camaras(client, auth_headers):
+    _usuario_com_camaras(client, auth_headers, "uma.camara@camara.leg.br", [1])
+    _usuario_com_camaras(client, auth_headers, "oito.camaras@camara.leg.br", list(range(1, 9)))
+
+    uma, oito = _login(client, "uma.camara@camara.leg.br"), _login(client, "oito.camaras@camara.leg.br")
+    assert [c["id"] for c in oito.json()["camaras"]] == list(range(1, 9))
+    assert uma.headers["x-db-statements"] == oito.headers["x-db-statements"]
+    # O segundo login vem do login_cache
+    assert int(_login(client, "oito.camaras@camara.leg.br").headers["x-db-statements"]) < int(oito.headers["x-db-statements"])
+
+
+def test_cache_do_login_segue_as_associacoes(client, auth_headers):
+    _usuario_com_camaras(client, auth_headers, "duas.camaras@camara.leg.br", [1, 2])
+    assert [c["id"] for c in _login(client, "duas.camaras@camara.leg.br").json()["camaras"]] == [1, 2]
+
+    associacao = client.get("/api/v1/usuario-camara/camara/2?limit=1000", headers=auth_headers)
+    associacao_id = next(a["id"] for a in associacao.json()["items"] if a["usuario"]["email"] == "duas.camaras@camara.leg.br")
+    assert client.delete(f"/api/v1/usuario-camara/{associacao_id}", headers=auth_headers).status_code == 200
+    assert [c["id"] for c in _login(client, "duas.camaras@camara.leg.br").json()["camaras"]] == [1]
@@ -0,0 +1,34 @@
+# tests/test_mandato_ativo.py
+"""Um só mandato ativo por câmara (desativação em um UPDATE e índice único)."""
+from datetime import date
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+
+def _ativos(client, headers, camara_id: int) -> list[int]:
+    itens = client.get(f"/api/v1/mandatos/camara/{camara_id}?limit=1000", headers=headers).json()["items"]
+    return [item["id"] for item in itens if item["ativo"]]
+
+
+def test_novo_mandato_ativo_desativa_os_demais(client, auth_headers):
+    dados = {"descricao": "Legislatura seguinte", "ativo": True, "data_inicio": "2029-01-01",
+             "data_fim": "2032-12-31", "camara_id": 5}
+    resposta = client.post("/api/v1/mandatos/", json=dados, headers=auth_headers)
+    assert resposta.status_code == 201, resposta.text
+    assert _ativos(client, auth_headers, 5) == [resposta.json()["id"]]
+
+    # Reativar o mandato anterior desativa o novo
+    assert client.put("/api/v1/mandatos/5", json={"ativo": True}, headers=auth_headers).status_code == 200
+    assert _ativos(client, auth_headers, 5) == [5]
+
+
+def test_indice_rejeita_dois_mandatos_ativos(app):
+    from app.db.database import SessionLocal
+    from app.models.mandato_model import Mandato
+
+    with SessionLocal() as db:
+        db.add(Mandato(camara_id=6, descricao="Duplicado", ativo=True,
+                       data_inicio=date(2029, 1, 1), data_fim=date(2032, 12, 31)))
+        with pytest.raises(IntegrityError):
+            db.flush()
@@ -0,0 +1,64 @@
+# tests/test_paginacao.py
+"""Paginação por skip/limit e por cursor (app/db/pagination.py)."""
+import pytest
+
+ROTAS = ["/api/v1/vereadores/", "/api/v1/camaras/", "/api/v1/usuario-camara/camara/2"]
+
+
+def _ids(resposta) -> list[int]:
+    assert resposta.status_code == 200, resposta.text
+    return [item["id"] for item in resposta.json()["items"]]
+
+
+@pytest.mark.parametrize("rota", ROTAS)
+def test_cursor_percorre_as_mesmas_linhas_do_skip(client, auth_headers, rota):
+    por_skip = _ids(client.get(f"{rota}?limit=1000", headers=auth_headers))
+
+    por_cursor, cursor = [], ""
+    while cursor is not None:
+        resposta = client.get(f"{rota}?limit=3&cursor={cursor}", headers=auth_headers)
+        por_cursor += _ids(resposta)
+        cursor = resposta.json()["next_cursor"]
+    assert por_cursor == por_skip == sorted(por_skip)
+
+
+def test_pagina_por_skip_continua_por_cursor(client, auth_headers):
+    resposta = client.get("/api/v1/vereadores/?skip=3&limit=3", headers=auth_headers)
+    assert _ids(resposta) == [4, 5, 6]
+    seguinte = client.get(f"/api/v1/vereadores/?limit=3&cursor={resposta.json()['next_cursor']}", headers=auth_headers)
+    assert _ids(seguinte) == [7, 8, 9]
+
+
+def test_cursor_invalido(client, auth_headers):
+    resposta = client.get("/api/v1/vereadores/?cursor=invalido", headers=auth_headers)
+    assert resposta.status_code == 400
+    assert resposta.json()["detail"] == "Cursor de paginação inválido."
+
+
+@pytest.mark.parametrize("rota", [*ROTAS, "/api/v1/vereadores/?cursor="])
+def test_total_vem_na_consulta_da_pagina(client, auth_headers, rota):
+    separador = "&" if "?" in rota else "?"
+    total = len(_ids(client.get(f"{rota}{separador}limit=1000", headers=auth_headers)))
+    resposta = client.get(f"{rota}{separador}limit=5", headers=auth_headers)
+    assert resposta.json()["total"] == total
+    sem_total = client.get(f"{rota}{separador}limit=5&include_total=false", headers=auth_headers)
+    assert sem_total.json()["total"] is None
+    # O total não custa uma consulta a mais
+    assert sem_total.headers["x-db-statements"] == resposta.headers["x-db-statements"]
+
+
+@pytest.mark.parametrize("parametros", ["limit=0", "limit=-1", "skip=-1"])
+def test_limit_e_skip_fora_do_intervalo(client, auth_headers, parametros):
+    resposta = client.get(f"/api/v1/vereadores/?{parametros}", headers=auth_headers)
+    assert resposta.status_code == 422
+
+
+def test_total_com_limit_negativo_conta_a_parte(app):
+    from app.db.database import SessionLocal
+    from app.db.pagination import paginate
+    from app.models.vereador_model import Vereador
+
+    with SessionLocal() as db:
+        pagina = paginate(db.query(Vereador), Vereador.id, limit=-1)
+        assert pagina.items == []
+        assert pagina.total == db.query(Vereador).count() > 0
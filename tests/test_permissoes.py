@@ -0,0 +1,74 @@
+# tests/test_permissoes.py
+"""Verificação das permissões por máscara de bits (app/core/permissions.py)."""
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.permissions import require_permission
+
+
+@pytest.fixture(scope="module")
+def rotas(app):
+    """Rotas protegidas por require_permission, sobre o banco dos testes."""
+    protegida = FastAPI()
+
+    @protegida.get("/votar")
+    def votar_em_alguma(_=Depends(require_permission("votar"))):
+        return {}
+
+    @protegida.get("/camaras/{camara_id}/votar")
+    def votar(camara_id: int, _=Depends(require_permission("votar"))):
+        return {}
+
+    @protegida.get("/camaras/{camara_id}/presidir")
+    def presidir(camara_id: int, _=Depends(require_permission("presidir"))):
+        return {}
+
+    @protegida.get("/camaras/{camara_id}/votar-e-presidir")
+    def votar_e_presidir(camara_id: int, _=Depends(require_permission("votar", "presidir"))):
+        return {}
+
+    @protegida.get("/camaras/{camara_id}/auditar")
+    def auditar(camara_id: int, _=Depends(require_permission("permissao.nunca.concedida"))):
+        return {}
+
+    return TestClient(protegida)
+
+
+@pytest.fixture(scope="module")
+def votante(client, auth_headers) -> dict:
+    """Usuário com a permissão `votar` na câmara 1 e `presidir` na câmara 2."""
+    dados = {"email": "votante@camara.leg.br", "nome": "Votante", "senha": "1234", "confSenha": "1234"}
+    for camara_id, permissao in ((1, ["votar"]), (2, ["presidir"])):
+        associacao = {"camara_id": camara_id, "papel": 1, "permissao": permissao, "usuario": dados}
+        resposta = client.post("/api/v1/usuario-camara/", json=associacao, headers=auth_headers)
+        assert resposta.status_code == 201, resposta.text
+        dados = {**dados, "id": resposta.json()["usuario"]["id"]}
+    resposta = client.post("/api/v1/login", data={"username": dados["email"], "password": "1234"})
+    return {"Authorization": f"Bearer {resposta.json()['access_token']}"}
+
+
+@pytest.mark.parametrize("url, esperado", [
+    ("/camaras/1/votar", 200),
+    ("/votar", 200),                      # sem câmara: basta tê-la em alguma
+    ("/camaras/2/presidir", 200),
+    ("/camaras/2/votar", 403),            # permissão de outra câmara
+    ("/camaras/1/presidir", 403),
+    ("/camaras/1/votar-e-presidir", 403), # exige todas, na mesma câmara
+    ("/camaras/2/votar-e-presidir", 403),
+    ("/camaras/1/auditar", 403),          # permissão que ninguém recebeu
+])
+def test_permissao_na_camara(rotas, votante, url, esperado):
+    resposta = rotas.get(url, headers=votante)
+    assert resposta.status_code == esperado
+    if esperado == 403:
+        assert resposta.json()["detail"] == "Permissão insuficiente."
+
+
+@pytest.mark.parametrize("url", ["/camaras/2/votar", "/camaras/1/votar-e-presidir", "/camaras/1/auditar"])
+def test_superusuario_tem_todas(rotas, auth_headers, url):
+    assert rotas.get(url, headers=auth_headers).status_code == 200
+
+
+def test_sem_token(rotas):
+    assert rotas.get("/camaras/1/votar").status_code == 401
@@ -0,0 +1,41 @@
+# tests/test_projecao.py
+"""A projeção de colunas (app/db/projection.py) gera o mesmo JSON do caminho ORM."""
+from typing import List
+
+import pytest
+from pydantic import TypeAdapter
+
+from app.schemas.camara_schema import Camara
+from app.schemas.mandato_vereador_schema import MandatoVereadorPublic
+from app.schemas.vereador_schema import Vereador
+
+
+def _vereadores(db, projetar):
+    from app.repositories.vereador_repository import VereadorRepository
+    return VereadorRepository(db).get_all(limit=1000, projetar=projetar).items
+
+
+def _camaras(db, projetar):
+    from app.repositories.camara_repository import camara_repository
+    return camara_repository.get_multi(db, limit=1000, projetar=projetar).items
+
+
+def _mandato_vereador(db, projetar):
+    from app.repositories.mandato_vereador_repository import MandatoVereadorRepository
+    return MandatoVereadorRepository(db).get_all(db, projetar=projetar)
+
+
+@pytest.mark.parametrize("listagem, schema", [
+    (_vereadores, Vereador),
+    (_camaras, Camara),
+    (_mandato_vereador, MandatoVereadorPublic),
+])
+def test_projecao_igual_ao_orm(app, listagem, schema):
+    from app.db.database import SessionLocal
+
+    adapter = TypeAdapter(List[schema])
+    with SessionLocal() as db:
+        orm = adapter.dump_json(adapter.validate_python(listagem(db, False), from_attributes=True))
+        projecao = listagem(db, True)
+        assert projecao and all(isinstance(item, schema) for item in projecao)
+        assert adapter.dump_json(projecao) == orm
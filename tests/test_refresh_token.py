@@ -0,0 +1,51 @@
+# tests/test_refresh_token.py
+"""Rotação dos refresh tokens e detecção de reuso (AuthService.refresh)."""
+from app.core.config import settings
+
+
+def _login(client, auth_headers, email: str) -> dict:
+    dados = {"email": email, "nome": email, "senha": "1234", "confSenha": "1234"}
+    associacao = {"camara_id": 1, "papel": 1, "permissao": ["votar"], "usuario": dados}
+    assert client.post("/api/v1/usuario-camara/", json=associacao, headers=auth_headers).status_code == 201
+    resposta = client.post("/api/v1/login", data={"username": email, "password": "1234"})
+    assert resposta.status_code == 200, resposta.text
+    return resposta.json()
+
+
+def _refresh(client, refresh_token: str):
+    return client.post("/api/v1/refresh", json={"refresh_token": refresh_token})
+
+
+def test_rotacao_devolve_um_novo_par(client, auth_headers):
+    sessao = _login(client, auth_headers, "rotacao@camara.leg.br")
+
+    resposta = _refresh(client, sessao["refresh_token"])
+    assert resposta.status_code == 200, resposta.text
+    novo = resposta.json()
+    assert novo["refresh_token"] != sessao["refresh_token"]
+    assert novo["usuario"]["email"] == "rotacao@camara.leg.br"
+    me = client.get("/api/v1/usuarios/me", headers={"Authorization": f"Bearer {novo['access_token']}"})
+    assert me.status_code == 200
+
+    # O novo refresh token também pode ser trocado
+    assert _refresh(client, novo["refresh_token"]).status_code == 200
+
+
+def test_reuso_revoga_a_familia(client, auth_headers):
+    sessao = _login(client, auth_headers, "reuso@camara.leg.br")
+    novo = _refresh(client, sessao["refresh_token"]).json()
+
+    # O token antigo, já trocado, é reapresentado
+    assert _refresh(client, sessao["refresh_token"]).status_code == 401
+    # O token legítimo da mesma família foi revogado junto
+    assert _refresh(client, novo["refresh_token"]).status_code == 401
+
+
+def test_token_vencido_e_recusado(client, auth_headers, monkeypatch):
+    monkeypatch.setattr(settings, "REFRESH_TOKEN_EXPIRE_DAYS", -1)
+    sessao = _login(client, auth_headers, "vencido@camara.leg.br")
+    assert _refresh(client, sessao["refresh_token"]).status_code == 401
+
+
+def test_token_desconhecido_e_recusado(client):
+    assert _refresh(client, "desconhecido").status_code == 401
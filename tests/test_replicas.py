@@ -0,0 +1,139 @@
+# tests/test_replicas.py
+"""Leitura das próprias escritas com réplicas (app/db/database.py)."""
+import time
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from app.db import database
+from app.db.database import PRIMARY_COOKIE
+
+
+def _requisicao(metodo: str = "GET", cookie: str = "") -> Request:
+    headers = [(b"cookie", cookie.encode())] if cookie else []
+    return Request({"type": "http", "method": metodo, "headers": headers, "client": ("10.0.0.1", 1234)})
+
+
+@pytest.fixture
+def outro_processo():
+    """Sem as marcas de escrita em memória, como num outro processo."""
+    database._escritas_recentes.clear()
+    yield
+    database._escritas_recentes.clear()
+
+
+def test_cookie_de_escrita_leva_ao_primario(outro_processo):
+    futuro, passado = time.time() + 5, time.time() - 1
+    assert database._is_read_only(_requisicao())
+    assert not database._is_read_only(_requisicao(cookie=f"{database.PRIMARY_COOKIE}={futuro}"))
+    assert database._is_read_only(_requisicao(cookie=f"{database.PRIMARY_COOKIE}={passado}"))
+    assert database._is_read_only(_requisicao(cookie=f"{database.PRIMARY_COOKIE}=invalido"))
+    assert not database._is_read_only(_requisicao("POST"))
+
+
+def test_escrita_devolve_o_cookie(outro_processo):
+    app = FastAPI()
+    app.add_middleware(database.ReadAfterWriteMiddleware)
+
+    @app.get("/leitura")
+    def leitura():
+        return {}
+
+    @app.post("/escrita")
+    def escrita(request: Request):
+        database._registrar_escrita(database._client_key(request))
+        return {}
+
+    client = TestClient(app)
+    assert "set-cookie" not in client.get("/leitura").headers
+
+    resposta = client.post("/escrita")
+    assert resposta.headers["set-cookie"].startswith(f"{database.PRIMARY_COOKIE}=")
+    assert float(client.cookies[database.PRIMARY_COOKIE]) > time.time()
+
+
+@pytest.fixture
+def primario_e_replica(tmp_path, monkeypatch, outro_processo):
+    """
+    Dois arquivos SQLite, primário e réplica, com conteúdos diferentes: a
+    origem de cada leitura aparece no resultado.
+    """
+    from sqlalchemy import Column, Integer, MetaData, String, Table, create_engine, insert
+    from sqlalchemy.orm import registry, sessionmaker
+
+    metadata = MetaData()
+    registro = Table("registro", metadata, Column("id", Integer, primary_key=True), Column("origem", String))
+    engines = {}
+    for nome in ("primario", "replica"):
+        engines[nome] = create_engine(f"sqlite:///{tmp_path / nome}.db")
+        metadata.create_all(engines[nome])
+        with engines[nome].begin() as conn:
+            conn.execute(insert(registro).values(origem=nome))
+
+    class SessaoDeTeste(database.RoutingSession):
+        primary_engine = engines["primario"]
+        replica_engines = [engines["replica"]]
+
+    class Registro:
+        pass
+    registry().map_imperatively(Registro, registro)
+
+    monkeypatch.setattr(database, "SessionLocal", sessionmaker(class_=SessaoDeTeste, expire_on_commit=False))
+    yield Registro
+    for e in engines.values():
+        e.dispose()
+
+
+def test_roteamento_entre_primario_e_replica(primario_e_replica):
+    from fastapi import Depends
+    from sqlalchemy import insert, select
+    from sqlalchemy.orm import Session
+
+    Registro = primario_e_replica
+    registro = Registro.__table__
+    app = FastAPI()
+    app.add_middleware(database.ReadAfterWriteMiddleware)
+
+    @app.get("/registros")
+    def listar(db: Session = Depends(database.get_db)):
+        return db.scalars(select(registro.c.origem).order_by(registro.c.id)).all()
+
+    @app.post("/registros")
+    def criar(db: Session = Depends(database.get_db)):
+        db.execute(insert(registro).values(origem="escrita"))
+        db.commit()
+        return {}
+
+    @app.put("/registros/{id}")
+    def alterar(id: int, db: Session = Depends(database.get_db)):
+        db.get(Registro, id).origem = "alterado"
+        db.commit()
+        return {}
+
+    client = TestClient(app)
+    # Sem escrita recente a leitura vai à réplica
+    assert client.get("/registros").json() == ["replica"]
+
+    # A escrita vai ao primário e devolve o cookie
+    assert client.post("/registros").status_code == 200
+    assert PRIMARY_COOKIE in client.cookies
+
+    # Com o cookie, o cliente lê a própria escrita no primário
+    assert client.get("/registros").json() == ["primario", "escrita"]
+
+    # Sem o cookie, mas no mesmo processo: a marca em memória também leva ao primário
+    client.cookies.clear()
+    assert client.get("/registros").json() == ["primario", "escrita"]
+
+    # Escrita pelo flush do ORM, também no primário
+    client.cookies.clear()
+    database._escritas_recentes.clear()
+    assert client.put("/registros/1").status_code == 200
+    assert PRIMARY_COOKIE in client.cookies
+    assert client.get("/registros").json() == ["alterado", "escrita"]
+
+    # Sem cookie nem marca (outro processo, ou depois do atraso das réplicas): réplica
+    client.cookies.clear()
+    database._escritas_recentes.clear()
+    assert client.get("/registros").json() == ["replica"]
@@ -0,0 +1,66 @@
+# tests/test_revogacao_de_tokens.py
+"""Revogação dos access tokens pela versão do usuário (app/core/token_version.py)."""
+import pytest
+
+from app.core.security import create_access_token
+from app.core.token_version import token_versions
+
+
+def _usuario(client, headers, email: str) -> int:
+    dados = {"email": email, "nome": email, "senha": "1234", "confSenha": "1234"}
+    associacao = {"camara_id": 1, "papel": 1, "permissao": ["votar"], "usuario": dados}
+    resposta = client.post("/api/v1/usuario-camara/", json=associacao, headers=headers)
+    assert resposta.status_code == 201, resposta.text
+    return resposta.json()["usuario"]["id"]
+
+
+def _login(client, email: str, senha: str = "1234") -> dict:
+    resposta = client.post("/api/v1/login", data={"username": email, "password": senha})
+    assert resposta.status_code == 200, resposta.text
+    return {"Authorization": f"Bearer {resposta.json()['access_token']}"}
+
+
+def _me(client, headers) -> int:
+    return client.get("/api/v1/usuarios/me", headers=headers).status_code
+
+
+def test_troca_de_senha_revoga_o_token(client, auth_headers):
+    usuario_id = _usuario(client, auth_headers, "troca.senha@camara.leg.br")
+    antigo = _login(client, "troca.senha@camara.leg.br")
+    assert _me(client, antigo) == 200
+
+    senha = {"senha": "4321", "confSenha": "4321"}
+    assert client.put(f"/api/v1/usuarios/{usuario_id}", json=senha, headers=auth_headers).status_code == 200
+    assert _me(client, antigo) == 401
+
+    novo = _login(client, "troca.senha@camara.leg.br", "4321")
+    assert _me(client, novo) == 200
+
+
+def test_revogacao_vale_apos_reler_as_versoes(client, auth_headers):
+    from app.db.database import SessionLocal
+
+    usuario_id = _usuario(client, auth_headers, "outro.processo@camara.leg.br")
+    antigo = _login(client, "outro.processo@camara.leg.br")
+
+    # Versão incrementada direto no banco, como por outro processo
+    with SessionLocal() as db:
+        token_versions.bump_on_commit(db, usuario_id)
+        db.info.pop("versoes_de_token")
+        db.commit()
+    assert _me(client, antigo) == 200
+
+    # Mapa vencido: relido do banco na próxima requisição
+    token_versions.clear()
+    assert _me(client, antigo) == 401
+    assert _me(client, _login(client, "outro.processo@camara.leg.br")) == 200
+
+
+@pytest.mark.parametrize("claims", [
+    {"sub": "admin@camara.leg.br", "ver": 0},
+    {"sub": "admin@camara.leg.br", "uid": 1},
+    {"uid": 1, "ver": 0},
+])
+def test_token_sem_as_claims_e_recusado(client, auth_headers, claims):
+    headers = {"Authorization": f"Bearer {create_access_token(claims)}"}
+    assert _me(client, headers) == 401
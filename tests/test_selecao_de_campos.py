@@ -0,0 +1,61 @@
+# tests/test_selecao_de_campos.py
+"""Seleção de campos nas listagens (?fields= e ?view=lean, app/db/fields.py)."""
+import pytest
+
+# (listagem, fields, forma esperada de cada item: campo -> subcampos)
+LISTAGENS = [
+    ("/api/v1/camaras/", "nome,dt_cadastro_formatada", {"id": None, "nome": None, "dt_cadastro_formatada": None}),
+    ("/api/v1/vereadores/", "nome,partido", {"id": None, "nome": None, "partido": None}),
+    ("/api/v1/usuarios/", "email", {"id": None, "email": None}),
+    ("/api/v1/usuario-camara/camara/2", "papel,usuario.nome", {"id": None, "papel": None, "usuario": {"id", "nome"}}),
+    ("/api/v1/mandatos/camara/2", "descricao,camara.nome", {"id": None, "descricao": None, "camara": {"id", "nome"}}),
+    ("/api/v1/comissoes/camara/2", "nome", {"id": None, "nome": None}),
+    ("/api/v1/comissao-membros/comissao/2", "funcao,data_inicio_formatada",
+     {"id": None, "funcao": None, "data_inicio_formatada": None}),
+    ("/api/v1/mandato-vereador/mandato/2", "funcao,vereador.nome", {"id": None, "funcao": None, "vereador": {"id", "nome"}}),
+    ("/api/v1/mandato-vereador/?camara_id=2", "vereador.nome", {"id": None, "vereador": {"id", "nome"}}),
+]
+
+
+def _itens(resposta) -> list[dict]:
+    assert resposta.status_code == 200, resposta.text
+    corpo = resposta.json()
+    return corpo if isinstance(corpo, list) else corpo["items"]
+
+
+def _url(listagem: str, parametros: str) -> str:
+    return f"{listagem}{'&' if '?' in listagem else '?'}{parametros}"
+
+
+@pytest.mark.parametrize("listagem, fields, forma", LISTAGENS)
+def test_fields_traz_so_os_campos_pedidos(client, auth_headers, listagem, fields, forma):
+    completos = {item["id"]: item for item in _itens(client.get(listagem, headers=auth_headers))}
+    itens = _itens(client.get(_url(listagem, f"fields={fields}"), headers=auth_headers))
+    assert itens and len(itens) == len(completos)
+
+    for item in itens:
+        assert set(item) == set(forma)
+        completo = completos[item["id"]]
+        for campo, subcampos in forma.items():
+            if subcampos is None:
+                assert item[campo] == completo[campo]
+            else:
+                assert item[campo] == {sub: completo[campo][sub] for sub in subcampos}
+
+
+@pytest.mark.parametrize("listagem", [listagem for listagem, _, _ in LISTAGENS])
+def test_view_lean_sem_objetos_aninhados(client, auth_headers, listagem):
+    itens = _itens(client.get(_url(listagem, "view=lean"), headers=auth_headers))
+    assert itens
+    for item in itens:
+        assert "id" in item
+        assert not [valor for valor in item.values() if isinstance(valor, (dict, list))]
+        assert not [campo for campo in item if campo.endswith("_formatada") or campo == "ativo_desc"]
+
+
+@pytest.mark.parametrize("listagem", [listagem for listagem, _, _ in LISTAGENS])
+@pytest.mark.parametrize("fields", ["inexistente", "nome.inexistente"])
+def test_campo_desconhecido(client, auth_headers, listagem, fields):
+    resposta = client.get(_url(listagem, f"fields={fields}"), headers=auth_headers)
+    assert resposta.status_code == 400
+    assert resposta.json()["detail"] == f"Campo desconhecido: '{fields}'."
@@ -0,0 +1,22 @@
+# tests/test_unidade_de_trabalho.py
+"""Um commit por requisição (app/db/unit_of_work.py)."""
+
+
+def test_escrita_faz_um_commit(client, auth_headers):
+    dados = {"nome": "Olinda", "email": "olinda@camara.leg.br", "municipio": "Olinda", "uf": "PE"}
+    resposta = client.post("/api/v1/camaras/", json=dados, headers=auth_headers)
+    assert resposta.status_code == 201, resposta.text
+    assert resposta.headers["x-db-commits"] == "1"
+
+    leitura = client.get(f"/api/v1/camaras/{resposta.json()['id']}", headers=auth_headers)
+    assert leitura.headers["x-db-commits"] == "0"
+
+
+def test_servicos_aninhados_desfazem_juntos(client, auth_headers):
+    # O usuário é criado pelo UsuarioService dentro da associação, que falha depois
+    usuario = {"email": "sem.camara@camara.leg.br", "nome": "Sem Câmara", "senha": "1234", "confSenha": "1234"}
+    dados = {"camara_id": 999, "papel": 1, "permissao": ["votar"], "usuario": usuario}
+    resposta = client.post("/api/v1/usuario-camara/", json=dados, headers=auth_headers)
+    assert resposta.status_code == 404
+    assert resposta.headers["x-db-commits"] == "0"
+    assert client.get(f"/api/v1/usuarios/email/{usuario['email']}", headers=auth_headers).status_code == 404